@@ -0,0 +1,328 @@
+"""
+Benchmark the plugin on synthetic git repositories.
+
+Generates a repository offline (with `git fast-import`) with many files, commits, renames,
+deep directory trees, tags and a long list of ignored commits. Then builds the docs with every
+history engine, git backend and parallel mode, each in a fresh python process, and reports the
+time spent in `on_files`, `on_page_markdown`, the git queries and the full build.
+
+    python benchmarks/benchmark.py --files 1000 --commits 2000 --output results.json
+
+Results are written as JSON, a summary table is printed to stderr.
+"""
+
+import argparse
+import fnmatch
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from mkdocs_git_revision_date_localized_plugin import __version__
+from mkdocs_git_revision_date_localized_plugin.backends import BACKENDS, is_backend_available
+
+AUTHOR = "Benchmark <benchmark@example.com>"
+# Author date of the first commit, commits are one hour apart
+START_TIMESTAMP = 1500000000
+
+
+def get_configurations() -> dict[str, dict]:
+    """
+    Get the plugin options of every configuration to benchmark, by name.
+    """
+    configurations = {}
+    for backend in BACKENDS:
+        if not is_backend_available(backend):
+            continue
+        for parallel in (False, True):
+            name = f"per_file-{backend}-{'parallel' if parallel else 'serial'}"
+            configurations[name] = {
+                "history_engine": "per_file",
+                "git_backend": backend,
+                "enable_parallel_processing": parallel,
+            }
+    configurations["single_pass"] = {"history_engine": "single_pass"}
+    configurations["asyncio"] = {"history_engine": "asyncio"}
+    return configurations
+
+
+def data(text: str) -> str:
+    """
+    Format a 'data' command of git fast-import.
+    """
+    return f"data {len(text.encode('utf-8'))}\n{text}\n"
+
+
+def generate_repository(
+    path: Path,
+    n_files: int = 500,
+    n_commits: int = 1000,
+    max_depth: int = 5,
+    n_renames: int = 20,
+    n_tags: int = 50,
+    n_ignored: int = 100,
+    changes_per_commit: int = 3,
+    seed: int = 42,
+) -> dict:
+    """
+    Generate a mkdocs project in a new git repository.
+
+    The files are added during the first half of the commits, later commits change random files.
+    Renames and tags are spread evenly over the history.
+
+    Args:
+        path (Path): directory to create the project in
+        n_files (int): number of markdown files
+        n_commits (int): number of commits
+        max_depth (int): maximum number of nested directories of a file
+        n_renames (int): number of commits that rename a file
+        n_tags (int): number of (annotated) tags
+        n_ignored (int): number of hashes in the ignored commits file. Half of them are commits of the repository.
+        changes_per_commit (int): number of files changed by a commit that does not add files
+        seed (int): seed of the random generator, the same parameters give the same repository
+
+    Returns:
+        dict: the parameters of the repository
+    """
+    parameters = {
+        "files": n_files,
+        "commits": n_commits,
+        "max_depth": max_depth,
+        "renames": n_renames,
+        "tags": n_tags,
+        "ignored": n_ignored,
+        "changes_per_commit": changes_per_commit,
+        "seed": seed,
+    }
+    rng = random.Random(seed)
+    path.mkdir(parents=True)
+    subprocess.run(["git", "init", "-q", str(path)], check=True)
+    subprocess.run(["git", "symbolic-ref", "HEAD", "refs/heads/main"], cwd=path, check=True)
+
+    def new_path(i: int) -> str:
+        depth = rng.randint(0, max_depth)
+        return "/".join(["docs", *(f"dir{rng.randrange(8)}" for _ in range(depth)), f"page{i}.md"])
+
+    files: list[str] = []
+    next_file = 0
+    files_per_commit = max(1, -(-n_files // max(1, n_commits // 2)))
+    rename_at = set(rng.sample(range(n_commits // 2, n_commits), min(n_renames, n_commits - n_commits // 2)))
+    tag_every = max(1, n_commits // n_tags) if n_tags else 0
+
+    stream = []
+    for i in range(1, n_commits + 1):
+        timestamp = START_TIMESTAMP + 3600 * i
+        changes = []
+        if next_file < n_files:
+            for _ in range(min(files_per_commit, n_files - next_file)):
+                files.append(new_path(next_file))
+                changes.append(f"M 100644 inline {files[-1]}\n" + data(f"# Page {next_file}\n\nAdded in commit {i}\n"))
+                next_file += 1
+        elif i in rename_at:
+            index = rng.randrange(len(files))
+            old_path, files[index] = files[index], new_path(n_files + i)
+            changes.append(f'R "{old_path}" "{files[index]}"\n')
+        else:
+            for index in rng.sample(range(len(files)), min(changes_per_commit, len(files))):
+                changes.append(f"M 100644 inline {files[index]}\n" + data(f"# Page\n\nChanged in commit {i}\n"))
+
+        stream.append(f"commit refs/heads/main\nmark :{i}\n")
+        stream.append(f"author {AUTHOR} {timestamp} +0000\ncommitter {AUTHOR} {timestamp} +0000\n")
+        stream.append(data(f"Commit {i}"))
+        if i > 1:
+            stream.append(f"from :{i - 1}\n")
+        stream.extend(changes)
+        stream.append("\n")
+        if tag_every and i % tag_every == 0:
+            stream.append(f"tag v{i // tag_every}\nfrom :{i}\ntagger {AUTHOR} {timestamp} +0000\n")
+            stream.append(data(f"Release {i // tag_every}"))
+
+    stream.append(f"commit refs/heads/main\nmark :{n_commits + 1}\n")
+    timestamp = START_TIMESTAMP + 3600 * (n_commits + 1)
+    stream.append(f"author {AUTHOR} {timestamp} +0000\ncommitter {AUTHOR} {timestamp} +0000\n")
+    stream.append(data("Add mkdocs.yml"))
+    if n_commits:
+        stream.append(f"from :{n_commits}\n")
+    plugin_options = "\n        enable_creation_date: true"
+    if n_ignored:
+        plugin_options += "\n        ignored_commits_file: ignored-commits.txt"
+    mkdocs_yml = f"site_name: benchmark\nplugins:\n    - git-revision-date-localized:{plugin_options}\n"
+    stream.append("M 100644 inline mkdocs.yml\n" + data(mkdocs_yml) + "\n")
+
+    subprocess.run(["git", "fast-import", "--quiet"], cwd=path, input="".join(stream).encode("utf-8"), check=True)
+    subprocess.run(["git", "reset", "-q", "--hard", "main"], cwd=path, check=True)
+
+    if n_ignored:
+        commits = subprocess.run(
+            ["git", "rev-list", "main"], cwd=path, check=True, capture_output=True, text=True
+        ).stdout.split()
+        ignored = [commit[:10] for commit in rng.sample(commits, min(n_ignored // 2, len(commits)))]
+        ignored += ["".join(rng.choice("0123456789abcdef") for _ in range(40)) for _ in range(n_ignored - len(ignored))]
+        (path / "ignored-commits.txt").write_text("\n".join(ignored) + "\n", encoding="utf-8")
+
+    return parameters
+
+
+def measure(project: Path, options: dict) -> dict:
+    """
+    Build the docs of a project once, and time the plugin.
+
+    Run this in a fresh python process, so that nothing is cached from other builds.
+
+    Args:
+        project (Path): directory of the mkdocs project
+        options (dict): plugin options to override
+
+    Returns:
+        dict: seconds spent per phase, and the number of git queries
+    """
+    from mkdocs.commands.build import build
+    from mkdocs.config import load_config
+
+    from mkdocs_git_revision_date_localized_plugin.plugin import GitRevisionDateLocalizedPlugin
+    from mkdocs_git_revision_date_localized_plugin.util import Util
+
+    timings = {}
+    counts = {}
+
+    def timed(cls, name: str, key: str) -> None:
+        original = getattr(cls, name)
+
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                timings[key] = timings.get(key, 0.0) + time.perf_counter() - start
+                counts[key] = counts.get(key, 0) + 1
+
+        setattr(cls, name, wrapper)
+
+    timed(GitRevisionDateLocalizedPlugin, "on_config", "on_config")
+    timed(GitRevisionDateLocalizedPlugin, "on_files", "on_files")
+    timed(GitRevisionDateLocalizedPlugin, "on_page_markdown", "on_page_markdown")
+    timed(Util, "get_git_commit_timestamp", "get_git_commit_timestamp")
+    timed(Util, "get_git_commit_timestamps", "get_git_commit_timestamps")
+    timed(Util, "get_git_history_index", "get_git_history_index")
+    timed(Util, "get_git_commit_timestamps_async", "get_git_commit_timestamps_async")
+
+    with tempfile.TemporaryDirectory() as site_dir:
+        config = load_config(str(project / "mkdocs.yml"), site_dir=site_dir)
+        for plugin in config.plugins.values():
+            if isinstance(plugin, GitRevisionDateLocalizedPlugin):
+                plugin.config.update(options)
+
+        start = time.perf_counter()
+        config.plugins.on_startup(command="build", dirty=False)
+        try:
+            build(config)
+        finally:
+            config.plugins.on_shutdown()
+        timings["build"] = time.perf_counter() - start
+
+    return {"seconds": timings, "calls": counts}
+
+
+def summarize(results: list[dict]) -> str:
+    """
+    Format the median timings of every configuration as a table.
+    """
+    phases = ["build", "on_config", "on_files", "on_page_markdown"]
+    lines = [f"{'configuration':<28}" + "".join(f"{phase:>18}" for phase in phases)]
+    for result in results:
+        line = f"{result['name']:<28}"
+        for phase in phases:
+            line += f"{result['median'].get(phase, 0.0):>17.3f}s"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """
+    Command line interface, see `python benchmarks/benchmark.py --help`.
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=500, help="number of markdown files")
+    parser.add_argument("--commits", type=int, default=1000, help="number of commits")
+    parser.add_argument("--depth", type=int, default=5, help="maximum directory depth of a file")
+    parser.add_argument("--renames", type=int, default=20, help="number of commits renaming a file")
+    parser.add_argument("--tags", type=int, default=50, help="number of tags")
+    parser.add_argument("--ignored", type=int, default=100, help="number of hashes in the ignored commits file")
+    parser.add_argument("--seed", type=int, default=42, help="seed of the random generator")
+    parser.add_argument("--repeat", type=int, default=3, help="number of builds per configuration")
+    parser.add_argument("--only", action="append", help="glob pattern of the configurations to run (can be repeated)")
+    parser.add_argument("--project", type=Path, help="directory to generate the project in (default: temporary)")
+    parser.add_argument("--output", type=Path, help="file to write the JSON results to (default: stdout)")
+    parser.add_argument("--measure", type=Path, help=argparse.SUPPRESS)
+    parser.add_argument("--options", type=json.loads, default={}, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    # A single build, in the process started below
+    if args.measure:
+        print(json.dumps(measure(args.measure, args.options)))
+        return
+
+    configurations = get_configurations()
+    if args.only:
+        configurations = {
+            name: options
+            for name, options in configurations.items()
+            if any(fnmatch.fnmatch(name, pattern) for pattern in args.only)
+        }
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        project = args.project or Path(temp_dir) / "project"
+        start = time.perf_counter()
+        parameters = generate_repository(
+            project,
+            n_files=args.files,
+            n_commits=args.commits,
+            max_depth=args.depth,
+            n_renames=args.renames,
+            n_tags=args.tags,
+            n_ignored=args.ignored,
+            seed=args.seed,
+        )
+        print(f"Generated repository in {time.perf_counter() - start:.1f}s: {parameters}", file=sys.stderr)
+
+        results = []
+        for name, options in configurations.items():
+            runs = []
+            for _ in range(args.repeat):
+                output = subprocess.run(
+                    [sys.executable, __file__, "--measure", str(project), "--options", json.dumps(options)],
+                    check=True,
+                    capture_output=True,
+                    text=True,
+                ).stdout
+                runs.append(json.loads(output.splitlines()[-1]))
+            phases = {phase for run in runs for phase in run["seconds"]}
+            median = {phase: statistics.median(run["seconds"].get(phase, 0.0) for run in runs) for phase in phases}
+            results.append({"name": name, "options": options, "median": median, "runs": runs})
+            print(summarize(results[-1:]).splitlines()[-1], file=sys.stderr)
+
+    git_version = subprocess.run(["git", "--version"], capture_output=True, text=True).stdout.strip()
+    report = {
+        "plugin_version": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "git": git_version,
+        "cpu_count": os.cpu_count(),
+        "repository": parameters,
+        "results": results,
+    }
+    print(summarize(results), file=sys.stderr)
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    else:
+        print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+"""
+Benchmark the startup cost the plugin adds to MkDocs, with `python -X importtime`.
+
+Every run imports the modules that `mkdocs build` loads anyway, then the plugin, in a fresh
+python process, and reports the import time of the plugin and its slowest imports. Then it
+builds a small site with 'enabled: false', which should not load GitPython, packaging or the
+date formatting of the plugin (which uses Babel).
+
+    python benchmarks/importtime.py --repeat 10 --max-ms 100
+
+Results are written as JSON, a summary is printed to stderr. Exits with status 1 when the
+disabled build loads any of these modules, or the median import time exceeds '--max-ms'.
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+PLUGIN_MODULE = "mkdocs_git_revision_date_localized_plugin.plugin"
+# Modules that `mkdocs build` loads without the plugin
+MKDOCS_MODULES = ["mkdocs.commands.build", "mkdocs.config.defaults", "mkdocs.plugins"]
+# Modules that builds with 'enabled: false' should not load
+HEAVY_MODULES = [
+    "git",
+    "gitdb",
+    "packaging.version",
+    "mkdocs_git_revision_date_localized_plugin.dates",
+    "mkdocs_git_revision_date_localized_plugin.util",
+]
+
+# Builds the site of the mkdocs.yml file in sys.argv[1], and prints the heavy modules that were loaded
+DISABLED_BUILD = """
+import json
+import sys
+
+from mkdocs.commands.build import build
+from mkdocs.config import load_config
+
+build(load_config(sys.argv[1], quiet=True))
+print(json.dumps(sorted(set(sys.modules) & set(json.loads(sys.argv[2])))))
+"""
+
+
+def parse_importtime(stderr: str) -> list[tuple[str, int, int]]:
+    """
+    Parse the output of `python -X importtime`.
+
+    Returns:
+        list[tuple[str, int, int]]: (module, self µs, cumulative µs) in import order, with the
+        indentation of nested imports kept in the module name
+    """
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, module = line[len("import time:") :].split("|")
+        imports.append((module.rstrip()[1:], int(self_us), int(cumulative_us)))
+    return imports
+
+
+def measure_import() -> dict:
+    """
+    Import the plugin after the modules of MkDocs, in a fresh python process.
+
+    Returns:
+        dict: cumulative import time of the plugin in milliseconds, and the modules it imported
+    """
+    statement = "; ".join(f"import {module}" for module in [*MKDOCS_MODULES, PLUGIN_MODULE])
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement], check=True, capture_output=True, text=True
+    ).stderr
+    imports = parse_importtime(stderr)
+
+    # The plugin is the last top-level import, its own imports are listed right before it (indented)
+    (module, _, cumulative_us) = imports[-1]
+    assert module == PLUGIN_MODULE, f"Unexpected output of -X importtime: {module}"
+    modules = []
+    for module, self_us, _ in reversed(imports[:-1]):
+        if not module.startswith(" "):
+            break
+        modules.append({"module": module.strip(), "ms": self_us / 1000})
+    return {"ms": cumulative_us / 1000, "modules": modules}
+
+
+def measure_disabled_build() -> list[str]:
+    """
+    Build a site with 'enabled: false' in a fresh python process.
+
+    Returns:
+        list[str]: the heavy modules that the build loaded
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        project = Path(temp_dir)
+        (project / "docs").mkdir()
+        (project / "docs" / "index.md").write_text("# Home\n\n{{ git_revision_date_localized }}\n", encoding="utf-8")
+        (project / "mkdocs.yml").write_text(
+            "site_name: importtime\nplugins:\n  - git-revision-date-localized:\n      enabled: false\n",
+            encoding="utf-8",
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", DISABLED_BUILD, str(project / "mkdocs.yml"), json.dumps(HEAVY_MODULES)],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Command line interface, see `python benchmarks/importtime.py --help`.
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5, help="number of python processes to measure")
+    parser.add_argument("--max-ms", type=float, help="fail when the median import time exceeds this")
+    parser.add_argument("--output", type=Path, help="file to write the JSON results to (default: stdout)")
+    args = parser.parse_args(argv)
+
+    runs = [measure_import() for _ in range(args.repeat)]
+    median_ms = statistics.median(run["ms"] for run in runs)
+    # The slowest imports of the plugin, by their median over the runs
+    slowest = {}
+    for run in runs:
+        for module in run["modules"]:
+            slowest.setdefault(module["module"], []).append(module["ms"])
+    slowest = sorted(((statistics.median(times), module) for module, times in slowest.items()), reverse=True)[:10]
+    loaded = measure_disabled_build()
+
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "median_ms": median_ms,
+        "runs_ms": [run["ms"] for run in runs],
+        "slowest_imports": [{"module": module, "ms": ms} for ms, module in slowest],
+        "disabled_build_loaded": loaded,
+    }
+    print(f"Import time of the plugin: {median_ms:.1f}ms (median of {args.repeat})", file=sys.stderr)
+    for ms, module in slowest:
+        print(f"  {module:<60}{ms:>8.1f}ms", file=sys.stderr)
+    print(f"Loaded by a disabled build: {', '.join(loaded) or 'none of ' + ', '.join(HEAVY_MODULES)}", file=sys.stderr)
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    else:
+        print(json.dumps(report, indent=2))
+
+    if loaded:
+        print("Error: the disabled build loaded modules it does not need", file=sys.stderr)
+        return 1
+    if args.max_ms is not None and median_ms > args.max_ms:
+        print(f"Error: the import time exceeds {args.max_ms:.1f}ms", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
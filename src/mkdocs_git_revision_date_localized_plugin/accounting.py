@@ -0,0 +1,161 @@
+"""
+Accounting of the git processes started by the plugin.
+
+Git objects of the plugin are `CountingGit` instances (also the ones of a `CountingRepo`),
+which record every command they run. Processes started in other ways (f.e. on an asyncio
+event loop, or the long-lived `git cat-file` process) are recorded with `record_git_call()`.
+
+Use `count_git_calls()` to count the git processes started by a piece of code, f.e. in tests.
+"""
+
+import threading
+import time
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+
+from git import Git, Repo
+
+
+class GitCalls:
+    """
+    Number of git processes and the time spent waiting on them, per git subcommand (f.e. 'log').
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.counts: dict[str, int] = {}
+        self.seconds: dict[str, float] = {}
+
+    def record(self, subcommand: str, seconds: float = 0.0) -> None:
+        """
+        Record a git process.
+
+        Args:
+            subcommand (str): git subcommand, f.e. 'log'
+            seconds (float): time spent waiting on the process
+        """
+        with self.lock:
+            self.counts[subcommand] = self.counts.get(subcommand, 0) + 1
+            self.seconds[subcommand] = self.seconds.get(subcommand, 0.0) + seconds
+
+    def snapshot(self) -> dict[str, tuple[int, float]]:
+        """
+        Get the number of processes and seconds per subcommand recorded so far.
+        """
+        with self.lock:
+            return {subcommand: (count, self.seconds[subcommand]) for subcommand, count in self.counts.items()}
+
+
+# All git processes started in this python process
+git_calls = GitCalls()
+
+
+class GitCallCounter:
+    """
+    Git processes started since the counter was created, see `count_git_calls()`.
+    """
+
+    def __init__(self):
+        self.start = git_calls.snapshot()
+        self.end: dict[str, tuple[int, float]] | None = None
+
+    def stop(self) -> None:
+        """
+        Stop counting, later git processes are not included.
+        """
+        if self.end is None:
+            self.end = git_calls.snapshot()
+
+    def _delta(self) -> dict[str, tuple[int, float]]:
+        end = self.end if self.end is not None else git_calls.snapshot()
+        delta = {}
+        for subcommand, (count, seconds) in end.items():
+            start_count, start_seconds = self.start.get(subcommand, (0, 0.0))
+            if count > start_count:
+                delta[subcommand] = (count - start_count, seconds - start_seconds)
+        return delta
+
+    @property
+    def counts(self) -> dict[str, int]:
+        """
+        Number of git processes per subcommand.
+        """
+        return {subcommand: count for subcommand, (count, _) in self._delta().items()}
+
+    @property
+    def seconds(self) -> dict[str, float]:
+        """
+        Seconds spent waiting on git processes per subcommand.
+        """
+        return {subcommand: seconds for subcommand, (_, seconds) in self._delta().items()}
+
+    @property
+    def total(self) -> int:
+        """
+        Total number of git processes.
+        """
+        return sum(self.counts.values())
+
+
+@contextmanager
+def count_git_calls() -> Iterator[GitCallCounter]:
+    """
+    Count the git processes started by the plugin within a `with` block.
+
+    Processes started on other threads (f.e. the thread pool for parallel processing) are included.
+
+        with count_git_calls() as calls:
+            ...
+        print(calls.total, calls.counts)
+    """
+    counter = GitCallCounter()
+    try:
+        yield counter
+    finally:
+        counter.stop()
+
+
+def record_git_call(subcommand: str, seconds: float = 0.0) -> None:
+    """
+    Record a git process that was not started through a `CountingGit` object.
+    """
+    git_calls.record(subcommand, seconds)
+
+
+def get_subcommand(command: str | Sequence[str]) -> str:
+    """
+    Get the subcommand of a git command line, f.e. 'log' for ['git', '-c', 'x=y', 'log', '-n', '1'].
+    """
+    if isinstance(command, str):
+        command = command.split()
+    args = iter(command[1:])
+    for arg in args:
+        if arg in ("-c", "-C"):
+            # Global options with a value
+            next(args, None)
+        elif not arg.startswith("-"):
+            return arg
+    return "git"
+
+
+class CountingGit(Git):
+    """
+    GitPython Git object that records the commands it runs.
+
+    For commands run with `as_process=True`, only the time to start the process is recorded.
+    """
+
+    def execute(self, command, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return super().execute(command, *args, **kwargs)
+        finally:
+            record_git_call(get_subcommand(command), time.perf_counter() - start)
+
+
+class CountingRepo(Repo):
+    """
+    GitPython Repo whose git commands are recorded.
+    """
+
+    GitCommandWrapperType = CountingGit
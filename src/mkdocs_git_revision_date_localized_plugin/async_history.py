@@ -0,0 +1,185 @@
+"""
+Asyncio history engine.
+
+Runs the same per-file `git log` queries as `GitCliBackend`, but as asyncio subprocesses.
+A single event loop can keep many git processes in flight at once,
+without a thread or worker process for each of them.
+"""
+
+import asyncio
+import os
+import time
+from collections.abc import Callable, Coroutine
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from typing import Any
+
+from git import Git, GitCommandError
+
+from mkdocs_git_revision_date_localized_plugin.accounting import record_git_call
+from mkdocs_git_revision_date_localized_plugin.backends import GitCliBackend
+
+# Default number of git processes to run at the same time
+DEFAULT_MAX_CONCURRENCY = min(128, 4 * (os.cpu_count() or 1))
+
+# Seconds spent in git processes by the query of the current task, see `query_commits()`
+query_seconds: ContextVar[list[float] | None] = ContextVar("query_seconds", default=None)
+
+
+def record_process(seconds: float) -> None:
+    """
+    Count a finished `git log` process, and add its time to the query of the current task.
+    """
+    record_git_call("log", seconds)
+    timings = query_seconds.get()
+    if timings is not None:
+        timings.append(seconds)
+
+
+async def run_git_log(backend: GitCliBackend, args: list[str], semaphore: asyncio.Semaphore) -> bytes:
+    """
+    Run `git log` in the repository of a backend.
+
+    Args:
+        backend (GitCliBackend): backend of the repository
+        args (list[str]): arguments for git log
+        semaphore (asyncio.Semaphore): limits the number of git processes running at the same time
+
+    Returns:
+        bytes: output of the command
+    """
+    command = [Git.GIT_PYTHON_GIT_EXECUTABLE or "git", "log", *args]
+    async with semaphore:
+        start = time.perf_counter()
+        process = await asyncio.create_subprocess_exec(
+            *command,
+            cwd=backend.working_dir,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        stdout, stderr = await process.communicate()
+        record_process(time.perf_counter() - start)
+    if process.returncode != 0:
+        raise GitCommandError(command, process.returncode, stderr)
+    return stdout
+
+
+async def query_commit(
+    backend: GitCliBackend, path: str, is_first_commit: bool, semaphore: asyncio.Semaphore
+) -> tuple[str, int] | None:
+    """
+    Get the last (or first) commit of a path, like `GitCliBackend.last_commit()` and `first_commit()`.
+    """
+    if not is_first_commit and backend.ignored:
+        return await stream_last_commit(backend, path, semaphore)
+    output = await run_git_log(backend, backend.log_args(path, is_first_commit=is_first_commit), semaphore)
+    return backend.parse_log(output.decode("utf-8", errors="replace"), is_first_commit=is_first_commit)
+
+
+async def stream_last_commit(backend: GitCliBackend, path: str, semaphore: asyncio.Semaphore) -> tuple[str, int] | None:
+    """
+    Get the last commit of a path that is not ignored, stopping git as soon as it is found.
+
+    The error output is not read while streaming: git would block on a full stderr pipe,
+    and stdout would never end. When git fails, the query is run again without streaming.
+    """
+    command = [Git.GIT_PYTHON_GIT_EXECUTABLE or "git", "log", *backend.log_args(path)]
+    async with semaphore:
+        start = time.perf_counter()
+        process = await asyncio.create_subprocess_exec(
+            *command,
+            cwd=backend.working_dir,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        commit = None
+        async for line in process.stdout:
+            line_commit, found = backend.select_last_commit([line.decode("utf-8", errors="replace")])
+            if found:
+                process.kill()
+                await process.wait()
+                record_process(time.perf_counter() - start)
+                return line_commit
+            # If all commits are ignored, the oldest one is used
+            commit = line_commit or commit
+        await process.wait()
+        record_process(time.perf_counter() - start)
+    if process.returncode != 0:
+        # Raises GitCommandError with the error output of git
+        output = await run_git_log(backend, backend.log_args(path), semaphore)
+        commit, _ = backend.select_last_commit(output.decode("utf-8", errors="replace").splitlines())
+    return commit
+
+
+async def query_both_commits(
+    backend: GitCliBackend, path: str, semaphore: asyncio.Semaphore
+) -> tuple[tuple[str, int] | None, tuple[str, int] | None]:
+    """
+    Get the last and first commit of a path with a single `git log`, like `GitCliBackend.commits()`.
+    """
+    output = await run_git_log(backend, backend.commits_log_args(path), semaphore)
+    return backend.parse_commits_log(output)
+
+
+async def query_commits(
+    queries: list[tuple[GitCliBackend, str]],
+    include_first_commit: bool = True,
+    max_concurrency: int | None = None,
+    on_query: Callable[[GitCliBackend, str, float], None] | None = None,
+) -> list[tuple[Any, Any]]:
+    """
+    Get the last and first commit of many paths concurrently.
+
+    Args:
+        queries (list[tuple[GitCliBackend, str]]): backend of the repository and path relative to its root
+        include_first_commit (bool): also determine the commit that created each file
+        max_concurrency (int | None): maximum number of git processes to run at the same time
+        on_query (Callable | None): called with the backend, the path and the seconds spent in git processes
+            (not waiting for a free slot) of every query
+
+    Returns:
+        list: (last commit, first commit) per query. A commit is None when not found,
+              or the exception raised when git failed.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency or DEFAULT_MAX_CONCURRENCY)
+    if include_first_commit:
+        # One git process per path finds both commits
+        tasks = [query_both_commits(backend, path, semaphore) for backend, path in queries]
+    else:
+        tasks = [query_commit(backend, path, False, semaphore) for backend, path in queries]
+    if on_query is not None:
+        tasks = [timed_query(task, backend, path, on_query) for task, (backend, path) in zip(tasks, queries)]
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    if not include_first_commit:
+        return [(last, None) for last in results]
+    # A failed query fails both commits
+    return [(result, result) if isinstance(result, BaseException) else result for result in results]
+
+
+async def timed_query(
+    query: Coroutine, backend: GitCliBackend, path: str, on_query: Callable[[GitCliBackend, str, float], None]
+) -> Any:
+    """
+    Run a query, and pass the seconds spent in its git processes to `on_query`.
+    """
+    # Every task of asyncio.gather() runs in a copy of the context, so the timings are per query
+    timings = []
+    query_seconds.set(timings)
+    try:
+        return await query
+    finally:
+        on_query(backend, path, sum(timings))
+
+
+def run(coroutine: Coroutine) -> Any:
+    """
+    Run a coroutine to completion, also when called from a running event loop.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+    # asyncio.run() can not be nested, use a new event loop in another thread
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coroutine).result()
@@ -0,0 +1,802 @@
+"""
+Backends to query the git history.
+
+`Util` delegates all history queries to a `Backend`:
+
+- `GitCliBackend` runs a `git` process (through GitPython) for every query.
+- the other backends walk the commit graph themselves, reading commits and trees from an `ObjectStore`:
+  a long-lived `git cat-file --batch` process (`CatFileBackend`), or the repository files
+  read in-process by dulwich (`DulwichBackend`) or libgit2 (`Pygit2Backend`).
+  The latter two need no `git` binary at all.
+"""
+
+import atexit
+import heapq
+import importlib.util
+import itertools
+import os
+import subprocess
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator
+from functools import lru_cache
+
+from git import Git, SymbolicReference
+
+from mkdocs_git_revision_date_localized_plugin.accounting import CountingGit, CountingRepo, record_git_call
+from mkdocs_git_revision_date_localized_plugin.history import iter_log_entries, stop_process
+from mkdocs_git_revision_date_localized_plugin.ignored_commits import IgnoredCommits
+
+# Mode of a tree (directory) entry in a git tree object
+TREE_MODE = 0o40000
+# `git log --diff-filter` of the last commit of a file: every status but R (renamed)
+LAST_COMMIT_DIFF_FILTER = "ACDMTUXB"
+
+
+def parse_commit(data: bytes) -> tuple[str, tuple[str, ...], int, int]:
+    """
+    Parse a raw git commit object.
+
+    Args:
+        data (bytes): contents of the commit object
+
+    Returns:
+        tuple: tree hash, parent hashes, author timestamp and committer timestamp
+    """
+    tree = ""
+    parents = []
+    author_timestamp = committer_timestamp = 0
+    header, _, _ = data.partition(b"\n\n")
+    for line in header.split(b"\n"):
+        key, _, value = line.partition(b" ")
+        if key == b"tree":
+            tree = value.decode("ascii")
+        elif key == b"parent":
+            parents.append(value.decode("ascii"))
+        elif key == b"author":
+            # Format: Name <email> 1500854705 +0000
+            author_timestamp = int(value.rsplit(b" ", 2)[1])
+        elif key == b"committer":
+            committer_timestamp = int(value.rsplit(b" ", 2)[1])
+    return tree, tuple(parents), author_timestamp, committer_timestamp
+
+
+def parse_tree(data: bytes, hash_size: int = 20) -> dict[str, tuple[int, str]]:
+    """
+    Parse a raw git tree object.
+
+    Args:
+        data (bytes): contents of the tree object
+        hash_size (int): size of object ids in bytes (20 for SHA-1, 32 for SHA-256 repositories)
+
+    Returns:
+        dict: name -> (mode, object hash)
+    """
+    entries = {}
+    i = 0
+    while i < len(data):
+        space = data.index(b" ", i)
+        nul = data.index(b"\0", space)
+        entries[os.fsdecode(data[space + 1 : nul])] = (
+            int(data[i:space], 8),
+            data[nul + 1 : nul + 1 + hash_size].hex(),
+        )
+        i = nul + 1 + hash_size
+    return entries
+
+
+def read_tags(git: Git) -> dict[str, list[str]]:
+    """
+    Get the names of all tags of a repository with a single `git for-each-ref`.
+
+    Args:
+        git (Git): GitPython Git object of the repository
+
+    Returns:
+        dict: commit hash -> tag names, sorted by name
+    """
+    tags: dict[str, list[str]] = {}
+    output = git.for_each_ref("refs/tags", format="%(objectname) %(*objectname) %(refname:short)")
+    for line in output.splitlines():
+        object_hash, peeled_hash, name = line.split(" ", 2)
+        # Annotated tags point at a tag object, which points ('peels') to the commit
+        tags.setdefault(peeled_hash or object_hash, []).append(name)
+    return tags
+
+
+class ObjectStore(ABC):
+    """
+    Read-only access to the objects of a repository, with caches of the parsed commits and trees.
+
+    Subclasses implement `resolve_head()`, `read_tags()`, `_read_commit()` and `_read_tree()`.
+    """
+
+    # (store class, process id, thread id, repository) -> ObjectStore
+    _instances: dict[tuple[type, int, int, str], "ObjectStore"] = {}
+
+    def __init__(self, working_dir: str, cache_size: int = 65536):
+        """
+        Initialize the store.
+
+        Args:
+            working_dir (str): root directory of the repository
+            cache_size (int): maximum number of parsed commits and trees to keep in memory
+        """
+        self.working_dir = working_dir
+        self.read_commit = lru_cache(maxsize=cache_size)(self._read_commit)
+        self.read_tree = lru_cache(maxsize=cache_size)(self._read_tree)
+        self.lookup = lru_cache(maxsize=cache_size)(self._lookup)
+        self.tags: dict[str, list[str]] | None = None
+
+    @classmethod
+    def for_repository(cls, working_dir: str) -> "ObjectStore":
+        """
+        Get the store of a repository, opening it if needed.
+
+        Every thread (and every process of a multiprocessing pool) gets its own store,
+        which is kept open for the rest of the build.
+        """
+        key = (cls, os.getpid(), threading.get_ident(), working_dir)
+        instance = cls._instances.get(key)
+        if instance is None or not instance.is_alive():
+            instance = cls._instances[key] = cls(working_dir)
+        return instance
+
+    @classmethod
+    def close_all(cls) -> None:
+        """
+        Close all stores opened by this process.
+        """
+        for key, instance in list(cls._instances.items()):
+            if key[1] == os.getpid():
+                instance.close()
+            del cls._instances[key]
+
+    def is_alive(self) -> bool:
+        return True
+
+    def close(self) -> None:
+        pass
+
+    @abstractmethod
+    def resolve_head(self) -> str | None:
+        """
+        Get the commit hash of HEAD, or None for a repository without commits.
+        """
+
+    @abstractmethod
+    def read_tags(self) -> dict[str, list[str]]:
+        """
+        Get the names of all tags, by the hash of the commit they point at.
+        """
+
+    @abstractmethod
+    def _read_commit(self, commit_hash: str) -> tuple[str, tuple[str, ...], int, int]:
+        """
+        Read a commit, see `parse_commit()`. Cached as `read_commit()`.
+        """
+
+    @abstractmethod
+    def _read_tree(self, tree_hash: str) -> dict[str, tuple[int, str]]:
+        """
+        Read a tree, as name -> (mode, hash) of its entries. Cached as `read_tree()`.
+        """
+
+    def _lookup(self, tree_hash: str, path: str) -> tuple[int, str] | None:
+        """
+        Find the entry of a path in a tree.
+
+        Memoized per (tree, path), so unchanged subtrees are only searched once.
+        """
+        if path in ("", "."):
+            return TREE_MODE, tree_hash
+        name, _, rest = path.partition("/")
+        entry = self.read_tree(tree_hash).get(name)
+        if entry is None or not rest:
+            return entry
+        if entry[0] != TREE_MODE:
+            return None
+        return self.lookup(entry[1], rest)
+
+    def find_deleted(self, old_tree: str, new_tree: str | None, object_hash: str, prefix: str = "") -> str | None:
+        """
+        Find a path that had an object in the old tree, but no longer exists in the new tree.
+
+        Only subtrees that differ between both trees are searched.
+
+        Returns:
+            str | None: the path, or None if there is no such path
+        """
+        new_entries = self.read_tree(new_tree) if new_tree is not None else {}
+        for name, (mode, entry_hash) in self.read_tree(old_tree).items():
+            new_entry = new_entries.get(name)
+            if new_entry == (mode, entry_hash):
+                continue
+            if mode == TREE_MODE:
+                new_subtree = new_entry[1] if new_entry is not None and new_entry[0] == TREE_MODE else None
+                found = self.find_deleted(entry_hash, new_subtree, object_hash, prefix=f"{prefix}{name}/")
+                if found is not None:
+                    return found
+            elif entry_hash == object_hash and new_entry is None:
+                return f"{prefix}{name}"
+        return None
+
+
+atexit.register(ObjectStore.close_all)
+
+
+class CatFile(ObjectStore):
+    """
+    Objects read through a long-lived `git cat-file --batch` process.
+    """
+
+    def __init__(self, working_dir: str, cache_size: int = 65536):
+        super().__init__(working_dir, cache_size=cache_size)
+        record_git_call("cat-file")
+        self.process = subprocess.Popen(
+            [Git.GIT_PYTHON_GIT_EXECUTABLE or "git", "cat-file", "--batch"],
+            cwd=working_dir,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+
+    def is_alive(self) -> bool:
+        return self.process.poll() is None
+
+    def close(self) -> None:
+        if self.process.poll() is None:
+            assert self.process.stdin is not None
+            self.process.stdin.close()
+            self.process.wait()
+
+    def read(self, name: str) -> tuple[str, str, bytes]:
+        """
+        Read an object from the repository.
+
+        Args:
+            name (str): object hash, or any revision git understands (f.e. 'HEAD')
+
+        Returns:
+            tuple: object hash, object type and contents of the object
+        """
+        assert self.process.stdin is not None and self.process.stdout is not None
+        self.process.stdin.write(name.encode() + b"\n")
+        self.process.stdin.flush()
+        header = self.process.stdout.readline()
+        if not header:
+            raise RuntimeError(f"git cat-file stopped unexpectedly in '{self.working_dir}'")
+        fields = header.split()
+        if len(fields) != 3:
+            raise KeyError(f"Object '{name}' not found in '{self.working_dir}': {header.decode().strip()}")
+        object_hash, object_type, size = fields
+        data = self.process.stdout.read(int(size))
+        # Every object is followed by a newline
+        self.process.stdout.read(1)
+        return object_hash.decode("ascii"), object_type.decode("ascii"), data
+
+    def resolve_head(self) -> str | None:
+        try:
+            return self.read("HEAD")[0]
+        except KeyError:
+            return None
+
+    def read_tags(self) -> dict[str, list[str]]:
+        return read_tags(CountingGit(self.working_dir))
+
+    def _read_commit(self, commit_hash: str) -> tuple[str, tuple[str, ...], int, int]:
+        return parse_commit(self.read(commit_hash)[2])
+
+    def _read_tree(self, tree_hash: str) -> dict[str, tuple[int, str]]:
+        return parse_tree(self.read(tree_hash)[2], hash_size=len(tree_hash) // 2)
+
+
+class DulwichStore(ObjectStore):
+    """
+    Objects read in-process with dulwich, a pure Python implementation of git.
+    """
+
+    def __init__(self, working_dir: str, cache_size: int = 65536):
+        from dulwich.repo import Repo as DulwichRepo
+
+        super().__init__(working_dir, cache_size=cache_size)
+        self.repo = DulwichRepo(working_dir)
+
+    def close(self) -> None:
+        self.repo.close()
+
+    def resolve_head(self) -> str | None:
+        try:
+            return self.repo.head().decode("ascii")
+        except KeyError:
+            return None
+
+    def read_tags(self) -> dict[str, list[str]]:
+        from dulwich.objects import Tag
+
+        tags: dict[str, list[str]] = {}
+        for name, object_hash in sorted(self.repo.refs.as_dict(b"refs/tags").items()):
+            obj = self.repo[object_hash]
+            # Annotated tags point at a tag object, which points ('peels') to the commit
+            while isinstance(obj, Tag):
+                obj = self.repo[obj.object[1]]
+            tags.setdefault(obj.id.decode("ascii"), []).append(os.fsdecode(name))
+        return tags
+
+    def _read_commit(self, commit_hash: str) -> tuple[str, tuple[str, ...], int, int]:
+        commit = self.repo[commit_hash.encode("ascii")]
+        return (
+            commit.tree.decode("ascii"),
+            tuple(parent.decode("ascii") for parent in commit.parents),
+            commit.author_time,
+            commit.commit_time,
+        )
+
+    def _read_tree(self, tree_hash: str) -> dict[str, tuple[int, str]]:
+        return {
+            os.fsdecode(entry.path): (entry.mode, entry.sha.decode("ascii"))
+            for entry in self.repo[tree_hash.encode("ascii")].iteritems()
+        }
+
+
+class Pygit2Store(ObjectStore):
+    """
+    Objects read in-process with pygit2, the Python bindings of libgit2.
+    """
+
+    def __init__(self, working_dir: str, cache_size: int = 65536):
+        import pygit2
+
+        super().__init__(working_dir, cache_size=cache_size)
+        self.repo = pygit2.Repository(working_dir)
+
+    def close(self) -> None:
+        self.repo.free()
+
+    def resolve_head(self) -> str | None:
+        if self.repo.head_is_unborn:
+            return None
+        return str(self.repo.head.target)
+
+    def read_tags(self) -> dict[str, list[str]]:
+        import pygit2
+
+        tags: dict[str, list[str]] = {}
+        for name in sorted(self.repo.references):
+            if not name.startswith("refs/tags/"):
+                continue
+            commit = self.repo.references[name].peel(pygit2.Commit)
+            tags.setdefault(str(commit.id), []).append(name[len("refs/tags/") :])
+        return tags
+
+    def _read_commit(self, commit_hash: str) -> tuple[str, tuple[str, ...], int, int]:
+        commit = self.repo[commit_hash]
+        return (
+            str(commit.tree_id),
+            tuple(str(parent) for parent in commit.parent_ids),
+            commit.author.time,
+            commit.commit_time,
+        )
+
+    def _read_tree(self, tree_hash: str) -> dict[str, tuple[int, str]]:
+        return {entry.name: (entry.filemode, str(entry.id)) for entry in self.repo[tree_hash]}
+
+
+class Backend(ABC):
+    """
+    Interface to query the history of a repository.
+
+    A backend is shared by the threads of a build. Backends that read objects themselves
+    open an `ObjectStore` per thread, see `ObjectStore.for_repository()`.
+    """
+
+    def __init__(self, working_dir: str, follow: bool = True, ignored_commits: list[str] | None = None):
+        """
+        Initialize the backend.
+
+        Args:
+            working_dir (str): root directory of the repository
+            follow (bool): whether to follow renames
+            ignored_commits (list[str]): (abbreviated) commit hashes to ignore for the last commit
+        """
+        self.working_dir = working_dir
+        self.follow = follow
+        self.ignored_commits = ignored_commits or []
+        self.ignored = IgnoredCommits(self.ignored_commits)
+
+    @abstractmethod
+    def head(self) -> str | None:
+        """
+        Get the commit hash of HEAD, or None for a repository without commits.
+        """
+
+    @abstractmethod
+    def last_commit(self, path: str) -> tuple[str, int] | None:
+        """
+        Get the most recent commit that changed a path, skipping renames and ignored commits.
+
+        Args:
+            path (str): path relative to the repository root
+
+        Returns:
+            tuple[str, int] | None: commit hash and author timestamp
+        """
+
+    @abstractmethod
+    def first_commit(self, path: str) -> tuple[str, int] | None:
+        """
+        Get the oldest commit that added a path.
+
+        Args:
+            path (str): path relative to the repository root
+
+        Returns:
+            tuple[str, int] | None: commit hash and author timestamp
+        """
+
+    def commits(self, path: str) -> tuple[tuple[str, int] | None, tuple[str, int] | None]:
+        """
+        Get both the last and the first commit of a path.
+
+        Backends can override this to find both in a single walk over the history.
+
+        Args:
+            path (str): path relative to the repository root
+
+        Returns:
+            tuple: the last and the first commit, as returned by `last_commit()` and `first_commit()`
+        """
+        return self.last_commit(path), self.first_commit(path)
+
+    @abstractmethod
+    def tags_at(self, commit_hash: str) -> list[str]:
+        """
+        Get the names of the tags that point at a commit.
+
+        Args:
+            commit_hash (str): full commit hash
+
+        Returns:
+            list[str]: tag names
+        """
+
+
+class GitCliBackend(Backend):
+    """
+    Run a `git` command for every query.
+    """
+
+    def __init__(self, working_dir: str, follow: bool = True, ignored_commits: list[str] | None = None):
+        super().__init__(working_dir, follow=follow, ignored_commits=ignored_commits)
+        self.git = CountingGit(working_dir)
+        self.tags: dict[str, list[str]] | None = None
+
+    def head(self) -> str | None:
+        # The refs are read directly from the repository, without starting a git process.
+        try:
+            # Not `.head.commit`, which starts a `git cat-file` process to read the commit
+            return SymbolicReference.dereference_recursive(CountingRepo(self.working_dir), "HEAD")
+        except ValueError:
+            return None
+
+    def last_commit(self, path: str) -> tuple[str, int] | None:
+        if not self.ignored:
+            return self.parse_log(self.git.log(*self.log_args(path)))
+
+        # Stream the history, and stop git as soon as a commit is found that is not ignored
+        process = self.git.log(*self.log_args(path), as_process=True)
+        commit, found = self.select_last_commit(line.decode("utf-8", errors="replace") for line in process.stdout)
+        if found:
+            stop_process(process)
+        else:
+            process.wait()
+        return commit
+
+    def first_commit(self, path: str) -> tuple[str, int] | None:
+        return self.parse_log(self.git.log(*self.log_args(path, is_first_commit=True)), is_first_commit=True)
+
+    def commits(self, path: str) -> tuple[tuple[str, int] | None, tuple[str, int] | None]:
+        return self.parse_commits_log(self.git.log(*self.commits_log_args(path), stdout_as_string=False))
+
+    def log_args(self, path: str, is_first_commit: bool = False) -> list[str]:
+        """
+        Get the arguments for `git log` to find the last (or first) commit of a path.
+
+        Args:
+            path (str): path relative to the repository root
+            is_first_commit (bool): find the commit that created the file
+
+        Returns:
+            list[str]: arguments, without 'git log'
+        """
+        if is_first_commit:
+            # diff_filter="A" will select the commit that created the file
+            options = dict(diff_filter="A")
+        else:
+            # Pure renames are not counted as a revision. The statuses are spelled out, because
+            # without --follow some git versions (f.e. 2.39) list no commits for diff_filter="r"
+            options = dict(diff_filter=LAST_COMMIT_DIFF_FILTER, ignore_all_space=True, ignore_blank_lines=True)
+            if not self.ignored:
+                # Only the most recent commit is needed. Otherwise, the history is streamed
+                # until the first commit that is not ignored (see `last_commit()`).
+                options.update(n=1)
+        # Retrieve the history for the file in the format <hash> <timestamp>
+        options.update(date="unix", format="%H %at", no_show_signature=True, follow=self.follow)
+        return [*self.git.transform_kwargs(**options), "--", path]
+
+    def commits_log_args(self, path: str) -> list[str]:
+        """
+        Get the arguments for `git log` to find both the last and the first commit of a path.
+
+        Instead of filtering with `--diff-filter`, the full history is listed with the status of every change.
+
+        Args:
+            path (str): path relative to the repository root
+
+        Returns:
+            list[str]: arguments, without 'git log'
+        """
+        options = dict(
+            name_status=True,
+            z=True,
+            ignore_all_space=True,
+            ignore_blank_lines=True,
+            format="%x00%H %at",
+            no_show_signature=True,
+            follow=self.follow,
+        )
+        return [*self.git.transform_kwargs(**options), "--", path]
+
+    def parse_commits_log(self, output: bytes) -> tuple[tuple[str, int] | None, tuple[str, int] | None]:
+        """
+        Get the last and the first commit from the output of the `git log` command of `commits_log_args()`.
+
+        Gives the same results as `parse_log()` on the outputs of the separate queries of `log_args()`.
+
+        Args:
+            output (bytes): output of git log
+
+        Returns:
+            tuple: the last and the first commit (commit hash and author timestamp), or None when not found
+        """
+        last_commit = None
+        first_commit = None
+        for commit_hash, commit_timestamp, changes in iter_log_entries(output.split(b"\0")):
+            # Merge commits are listed without changes, --diff-filter would leave them out
+            if not changes:
+                continue
+            status = changes[0][0]
+            # Pure renames are not counted as a revision, like LAST_COMMIT_DIFF_FILTER
+            if status.startswith("R"):
+                continue
+            if last_commit is None or last_commit[0] in self.ignored:
+                # When all commits are ignored, this ends at the oldest one, like `select_last_commit()`
+                last_commit = (commit_hash, commit_timestamp)
+            if status == "A":
+                # Commits are ordered with most recent commit first, the last one we see is the oldest
+                first_commit = (commit_hash, commit_timestamp)
+        return last_commit, first_commit
+
+    def parse_log(self, output: str, is_first_commit: bool = False) -> tuple[str, int] | None:
+        """
+        Get the commit from the output of the `git log` command of `log_args()`.
+
+        Args:
+            output (str): output of git log
+            is_first_commit (bool): whether the output is of a query for the commit that created the file
+
+        Returns:
+            tuple[str, int] | None: commit hash and author timestamp
+        """
+        lines = output.strip("\n").split("\n")
+
+        if is_first_commit:
+            if lines == [""]:
+                return None
+            # A file can be created multiple times, through a file renamed.
+            # Commits are ordered with most recent commit first
+            # Get the oldest commit only
+            commit_hash, commit_timestamp = lines[-1].split(" ")
+            return commit_hash, int(commit_timestamp)
+
+        return self.select_last_commit(lines)[0]
+
+    def select_last_commit(self, lines: Iterable[str]) -> tuple[tuple[str, int] | None, bool]:
+        """
+        Get the last commit that is not ignored from the lines of the `git log` command of `log_args()`.
+
+        Lines are consumed only up to the first commit that is not ignored,
+        so this can be used on the output of a running git process.
+
+        Args:
+            lines (Iterable[str]): lines of the output of git log
+
+        Returns:
+            tuple: commit hash and author timestamp (or None when there are no commits),
+                   and whether that commit is not ignored. If all commits are ignored, the oldest is returned.
+        """
+        # process the commits for the file in reverse-chronological order. Ignore any commit that is on the
+        # ignored list. Without commits, we need to use the fallback behavior.
+        commit = None
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            commit_hash, commit_timestamp = line.split(" ")
+            commit = (commit_hash, int(commit_timestamp))
+            if commit_hash not in self.ignored:
+                return commit, True
+        return commit, False
+
+    def tags_at(self, commit_hash: str) -> list[str]:
+        if self.tags is None:
+            # Read all tags once, instead of running `git tag --points-at` for every commit
+            self.tags = read_tags(self.git)
+        return self.tags.get(commit_hash, [])
+
+
+class WalkerBackend(Backend):
+    """
+    Walk the commit graph in Python, reading objects from an `ObjectStore`.
+
+    Parsed objects are cached, so walks for files in the same directory share most of the work.
+
+    Known differences with `git log`:
+
+    - with `follow`, only exact renames (content unchanged) are followed.
+    - merge commits are never reported as a change, only their parents are.
+    """
+
+    store_class: type[ObjectStore] = ObjectStore
+
+    @property
+    def store(self) -> ObjectStore:
+        return self.store_class.for_repository(self.working_dir)
+
+    def head(self) -> str | None:
+        return self.store.resolve_head()
+
+    def iter_history(self, path: str) -> Iterator[tuple[str, int, str]]:
+        """
+        Walk the commits that changed a path, like `git log [--follow] --name-status -- <path>`.
+
+        Commits are visited most recent first (by committer date). At a merge commit,
+        history is simplified like git does: if the path is the same as in one of the parents,
+        only that parent is followed.
+
+        Args:
+            path (str): path relative to the repository root
+
+        Yields:
+            tuple: commit hash, author timestamp and status ('A', 'M', 'D' or 'R' for a followed rename)
+        """
+        store = self.store
+        head = store.resolve_head()
+        if head is None:
+            return
+
+        # Like git, commits with the same date are visited in the order they were found
+        order = itertools.count()
+        queue = [(-store.read_commit(head)[3], next(order), head)]
+        seen = {head}
+
+        def push(commit_hash: str) -> None:
+            if commit_hash not in seen:
+                seen.add(commit_hash)
+                heapq.heappush(queue, (-store.read_commit(commit_hash)[3], next(order), commit_hash))
+
+        while queue:
+            _, _, commit_hash = heapq.heappop(queue)
+            tree, parents, author_timestamp, _ = store.read_commit(commit_hash)
+            entry = store.lookup(tree, path)
+
+            parent_entry = None
+            if parents:
+                parent_entries = [store.lookup(store.read_commit(parent)[0], path) for parent in parents]
+                same_parents = [parent for parent, e in zip(parents, parent_entries) if e == entry]
+                if same_parents:
+                    # Unchanged compared to (one of) the parent(s): only follow that parent
+                    push(same_parents[0])
+                    continue
+                for parent in parents:
+                    push(parent)
+                if len(parents) > 1:
+                    continue
+                parent_entry = parent_entries[0]
+
+            if entry is None and parent_entry is None:
+                continue
+            if parent_entry is None:
+                if self.follow and parents:
+                    # A renamed file is added under the new path, and deleted under the old path
+                    old_path = store.find_deleted(store.read_commit(parents[0])[0], tree, entry[1])
+                    if old_path is not None:
+                        yield commit_hash, author_timestamp, "R"
+                        path = old_path
+                        continue
+                yield commit_hash, author_timestamp, "A"
+            elif entry is None:
+                yield commit_hash, author_timestamp, "D"
+            else:
+                yield commit_hash, author_timestamp, "M"
+
+    def last_commit(self, path: str) -> tuple[str, int] | None:
+        # When all commits are ignored, this ends at the oldest one, like `GitCliBackend.select_last_commit()`
+        last = None
+        for commit_hash, commit_timestamp, status in self.iter_history(path):
+            if status == "R":
+                continue
+            last = (commit_hash, commit_timestamp)
+            if commit_hash not in self.ignored:
+                break
+        return last
+
+    def first_commit(self, path: str) -> tuple[str, int] | None:
+        first = None
+        for commit_hash, commit_timestamp, status in self.iter_history(path):
+            if status == "A":
+                first = (commit_hash, commit_timestamp)
+        return first
+
+    def commits(self, path: str) -> tuple[tuple[str, int] | None, tuple[str, int] | None]:
+        last = first = None
+        for commit_hash, commit_timestamp, status in self.iter_history(path):
+            if status == "A":
+                first = (commit_hash, commit_timestamp)
+            if status != "R" and (last is None or last[0] in self.ignored):
+                last = (commit_hash, commit_timestamp)
+        return last, first
+
+    def tags_at(self, commit_hash: str) -> list[str]:
+        store = self.store
+        if store.tags is None:
+            # Read all tags once, instead of once per commit
+            store.tags = store.read_tags()
+        return store.tags.get(commit_hash, [])
+
+
+class CatFileBackend(WalkerBackend):
+    """
+    Read objects over long-lived `git cat-file --batch` processes.
+    """
+
+    store_class = CatFile
+
+
+class DulwichBackend(WalkerBackend):
+    """
+    Read objects in-process with dulwich. Requires `pip install mkdocs-git-revision-date-localized-plugin[dulwich]`.
+    """
+
+    store_class = DulwichStore
+
+
+class Pygit2Backend(WalkerBackend):
+    """
+    Read objects in-process with libgit2. Requires `pip install mkdocs-git-revision-date-localized-plugin[pygit2]`.
+    """
+
+    store_class = Pygit2Store
+
+
+# Value of the 'git_backend' option -> (backend, python package it requires)
+BACKENDS: dict[str, tuple[type[Backend], str | None]] = {
+    "cli": (GitCliBackend, None),
+    "batch": (CatFileBackend, None),
+    "dulwich": (DulwichBackend, "dulwich"),
+    "pygit2": (Pygit2Backend, "pygit2"),
+}
+
+
+def is_backend_available(name: str) -> bool:
+    """
+    Check whether the python package a backend requires is installed.
+
+    Args:
+        name (str): value of the 'git_backend' option
+
+    Returns:
+        bool: True if the backend can be used
+    """
+    requirement = BACKENDS[name][1]
+    return requirement is None or importlib.util.find_spec(requirement) is not None
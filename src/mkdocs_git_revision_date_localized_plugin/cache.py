@@ -0,0 +1,191 @@
+"""
+Persistent on-disk cache of git revision dates.
+
+The cache stores the last and first commit of every page, per repository,
+together with the HEAD commit the results were computed at. On the next build,
+only pages touched by commits since that HEAD need to be recomputed.
+"""
+
+import json
+import logging
+import os
+from pathlib import Path
+
+from mkdocs_git_revision_date_localized_plugin.util import Util
+
+logger = logging.getLogger("mkdocs.plugins")
+
+# Bump when the layout of the cache file or the meaning of its contents changes
+CACHE_VERSION = 1
+
+CACHE_FILE_NAME = "revisions.json"
+
+
+class RevisionCache:
+    """
+    Cache of (last hash, last timestamp, first hash, first timestamp) per file.
+
+    Entries are validated lazily, once per repository, by comparing the HEAD
+    commit the cache was built from with the current HEAD.
+    """
+
+    def __init__(self, util: Util, cache_dir: str | Path, options: dict, file_name: str = CACHE_FILE_NAME):
+        """
+        Initialize the cache.
+
+        Args:
+            util (Util): utility class used to query git
+            cache_dir (str | Path): directory to store the cache file in
+            options (dict): plugin options that affect the results. The cache is discarded when they change.
+            file_name (str): name of the cache file (f.e. the result file of a shard, see shard.py)
+        """
+        self.util = util
+        self.cache_file = Path(os.path.realpath(cache_dir)) / file_name
+        self.options = options
+        # repository root -> {"head": str, "files": {relpath: [last hash, last timestamp, first hash, first timestamp]}}
+        self.repositories: dict[str, dict] = {}
+        # repository roots that have been compared with the current HEAD
+        self.validated: set[str] = set()
+        self.load()
+
+    def load(self) -> None:
+        """
+        Read the cache file, discarding it if it was created with another version or other options.
+        """
+        try:
+            with open(self.cache_file, encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as err:
+            logger.info(
+                f"[git-revision-date-localized-plugin] Ignoring unreadable cache file '{self.cache_file}': {err}"
+            )
+            return
+
+        if data.get("version") != CACHE_VERSION or data.get("options") != self.options:
+            logger.debug("[git-revision-date-localized-plugin] Cache was built with other options, ignoring it")
+            return
+
+        # Repositories are stored relative to the cache directory, so the cache can be moved (f.e. on CI)
+        for root, repository in data.get("repositories", {}).items():
+            self.repositories[os.path.normpath(self.cache_file.parent / root)] = repository
+
+    def save(self) -> None:
+        """
+        Write the cache file.
+        """
+        repositories = {
+            Path(os.path.relpath(root, self.cache_file.parent)).as_posix(): repository
+            for root, repository in self.repositories.items()
+        }
+        data = {"version": CACHE_VERSION, "options": self.options, "repositories": repositories}
+
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = self.cache_file.with_suffix(".tmp")
+        with open(temp_file, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(temp_file, self.cache_file)
+
+    def _locate(self, path: str) -> tuple[str, str] | None:
+        """
+        Find the repository root and the path relative to it.
+
+        Also makes sure the cached entries of the repository are still valid.
+        """
+        root = self.util.get_repo_root(path)
+        if root is None:
+            return None
+
+        if root not in self.validated:
+            self.validated.add(root)
+            self.validate(root)
+
+        return root, Path(os.path.relpath(os.path.realpath(path), root)).as_posix()
+
+    def validate(self, root: str) -> None:
+        """
+        Drop the entries of a repository that are affected by commits since the cache was built.
+
+        Args:
+            root (str): root directory of the repository
+        """
+        head = self.util.get_head(root)
+        repository = self.repositories.get(root)
+
+        if head is None or repository is None or repository.get("head") is None:
+            self.repositories[root] = {"head": head, "files": {}}
+            return
+        if repository["head"] == head:
+            return
+
+        changed_paths = self.util.get_changed_paths(root, repository["head"], head)
+        if changed_paths is None:
+            logger.debug(
+                f"[git-revision-date-localized-plugin] Unable to compare with cached commit, clearing cache of '{root}'"
+            )
+            self.repositories[root] = {"head": head, "files": {}}
+            return
+
+        # A cached directory (f.e. the docs_dir for the site revision date) is affected by changes to any file in it
+        affected = {"."} if changed_paths else set()
+        for changed_path in changed_paths:
+            parts = changed_path.split("/")
+            affected.update("/".join(parts[:i]) for i in range(1, len(parts) + 1))
+
+        files = repository["files"]
+        n_cached = len(files)
+        repository["files"] = {path: entry for path, entry in files.items() if path not in affected}
+        repository["head"] = head
+        logger.debug(
+            f"[git-revision-date-localized-plugin] {n_cached - len(repository['files'])} of {n_cached} cached entries "
+            f"of '{root}' are invalidated by new commits"
+        )
+
+    def get(self, path: str) -> tuple[str | None, int | None, str | None, int | None] | None:
+        """
+        Get the cached commits of a file.
+
+        Args:
+            path (str): location of a file (or directory) that is part of a Git repository
+
+        Returns:
+            tuple | None: (last hash, last timestamp, first hash, first timestamp) or None if not cached.
+        """
+        located = self._locate(path)
+        if located is None:
+            return None
+        root, relpath = located
+        entry = self.repositories[root]["files"].get(relpath)
+        return tuple(entry) if entry is not None else None
+
+    def set(
+        self,
+        path: str,
+        last_commit: tuple[str, int] | None = None,
+        first_commit: tuple[str, int] | None = None,
+    ) -> None:
+        """
+        Store the commits of a file.
+
+        Fallback results (f.e. the build date for files without git history) have no hash and are not cached.
+
+        Args:
+            path (str): location of a file (or directory) that is part of a Git repository
+            last_commit (tuple[str, int] | None): hash and timestamp of the most recent commit
+            first_commit (tuple[str, int] | None): hash and timestamp of the commit that created the file
+        """
+        located = self._locate(path)
+        if located is None:
+            return
+        root, relpath = located
+        if self.repositories[root]["head"] is None:
+            return
+
+        entry = self.repositories[root]["files"].setdefault(relpath, [None, None, None, None])
+        if last_commit is not None and last_commit[0]:
+            entry[0:2] = last_commit
+        if first_commit is not None and first_commit[0]:
+            entry[2:4] = first_commit
+        if entry[0] is None and entry[2] is None:
+            del self.repositories[root]["files"][relpath]
@@ -0,0 +1,139 @@
+"""
+Compact storage of the commit of every file, see `CommitStore`.
+
+A dictionary of path -> (hash, timestamp) tuples costs a tuple, a 40-character string and an int
+per file, for every path of the file (monorepo and techdocs copy the docs_dir to a temporary directory).
+Here every path gets a small integer id (`PathIds`), temporary paths are aliases of the path under git,
+timestamps are kept in an array and hashes in a buffer of 20-byte binary hashes: 28 bytes per file.
+"""
+
+from array import array
+
+# Timestamp of ids without a commit
+MISSING = -(2**63)
+# Size of a SHA-1 hash in bytes
+HASH_SIZE = 20
+
+
+class PathIds:
+    """
+    Small integer ids of paths, shared by the commit stores of a build.
+
+    An alias (f.e. the path of a copy of a file in a temporary directory) has the id of the path it refers to.
+    """
+
+    def __init__(self):
+        # path or alias -> id
+        self.ids: dict[str, int] = {}
+        self.count = 0
+
+    def get(self, path: str) -> int | None:
+        """
+        Get the id of a path or alias, or None if it has none.
+        """
+        return self.ids.get(path)
+
+    def intern(self, path: str) -> int:
+        """
+        Get the id of a path or alias, adding a new id if it has none.
+        """
+        path_id = self.ids.get(path)
+        if path_id is None:
+            path_id = self.ids[path] = self.count
+            self.count += 1
+        return path_id
+
+    def alias(self, alias: str, path: str) -> None:
+        """
+        Make `alias` refer to the commits of `path`.
+        """
+        if alias != path:
+            self.ids[alias] = self.intern(path)
+
+
+class CommitStore:
+    """
+    The commit hash and timestamp of every file, looked up like a dictionary of path -> (hash, timestamp).
+
+    Hashes other than SHA-1 (f.e. SHA-256 repositories) and fallback results without a hash are kept as strings.
+    """
+
+    def __init__(self, path_ids: PathIds):
+        self.path_ids = path_ids
+        # id -> timestamp, or MISSING
+        self.timestamps = array("q")
+        # id -> binary hash, at offset id * HASH_SIZE
+        self.hashes = bytearray()
+        # id -> hash that is not 40 hexadecimal characters
+        self.other_hashes: dict[int, str] = {}
+        self.count = 0
+
+    def _get_id(self, path: str) -> int | None:
+        path_id = self.path_ids.get(path)
+        if path_id is None or path_id >= len(self.timestamps) or self.timestamps[path_id] == MISSING:
+            return None
+        return path_id
+
+    def _get_commit(self, path_id: int) -> tuple[str, int]:
+        if path_id in self.other_hashes:
+            return self.other_hashes[path_id], self.timestamps[path_id]
+        return self.hashes[path_id * HASH_SIZE : (path_id + 1) * HASH_SIZE].hex(), self.timestamps[path_id]
+
+    def __setitem__(self, path: str, commit: tuple[str, int]) -> None:
+        commit_hash, commit_timestamp = commit
+        path_id = self.path_ids.intern(path)
+        if path_id >= len(self.timestamps):
+            # Grow by at least half, so that adding files one by one takes linear time
+            grow = max(path_id + 1 - len(self.timestamps), len(self.timestamps) // 2)
+            self.timestamps.extend(array("q", [MISSING]) * grow)
+            self.hashes.extend(bytes(HASH_SIZE * grow))
+        if self.timestamps[path_id] == MISSING:
+            self.count += 1
+        self.timestamps[path_id] = commit_timestamp
+
+        binary_hash = None
+        if isinstance(commit_hash, str) and len(commit_hash) == 2 * HASH_SIZE:
+            try:
+                binary_hash = bytes.fromhex(commit_hash)
+            except ValueError:
+                pass
+        if binary_hash is None:
+            self.other_hashes[path_id] = commit_hash
+        else:
+            self.hashes[path_id * HASH_SIZE : (path_id + 1) * HASH_SIZE] = binary_hash
+            self.other_hashes.pop(path_id, None)
+
+    def __getitem__(self, path: str) -> tuple[str, int]:
+        path_id = self._get_id(path)
+        if path_id is None:
+            raise KeyError(path)
+        return self._get_commit(path_id)
+
+    def __contains__(self, path: str) -> bool:
+        return self._get_id(path) is not None
+
+    def __len__(self) -> int:
+        # Aliases are not counted
+        return self.count
+
+    def get(self, path: str, default=None):
+        """
+        Get the commit hash and timestamp of a file, or `default` if it has none.
+        """
+        path_id = self._get_id(path)
+        if path_id is None:
+            return default
+        return self._get_commit(path_id)
+
+    def pop(self, path: str, default=None):
+        """
+        Remove the commit of a file (and of its aliases), and return it, or `default` if it has none.
+        """
+        path_id = self._get_id(path)
+        if path_id is None:
+            return default
+        commit = self._get_commit(path_id)
+        self.timestamps[path_id] = MISSING
+        self.other_hashes.pop(path_id, None)
+        self.count -= 1
+        return commit
@@ -1,7 +1,102 @@
+from collections.abc import Iterable
 from datetime import datetime, timezone
 from typing import Any
 
-from babel.dates import format_date, format_datetime, get_timezone
+from babel.core import Locale
+from babel.dates import LC_TIME, get_timezone, parse_pattern
+
+# The different date formats / types, as returned by `get_date_formats()`
+DATE_TYPES = ("date", "datetime", "datetime-timezone", "iso_date", "iso_datetime", "timeago", "custom")
+
+
+class DateFormatter:
+    """
+    Format timestamps for one locale, timezone and custom format.
+
+    The locale, timezone and Babel patterns are parsed once, when the formatter is created,
+    instead of on every call of `format_date()` / `format_datetime()`.
+    """
+
+    def __init__(self, locale: str = "en", time_zone: str = "UTC", custom_format: str = "%d. %B %Y"):
+        """
+        Initialize the formatter.
+
+        Args:
+            locale (str): Locale code of language to use. Defaults to 'en'.
+            time_zone (str): Timezone database name (https://en.wikipedia.org/wiki/List_of_tz_database_time_zones).
+            custom_format (str): strftime format specifier for the 'custom' type
+        """
+        assert time_zone is not None
+        assert locale is not None
+
+        # Normalize locale for Babel: convert hyphens to underscores (e.g., pt-BR -> pt_BR)
+        # This is needed for compatibility with mkdocs-static-i18n and other plugins
+        # that may use hyphenated locale codes, while Babel expects underscores
+        if locale:
+            locale = str(locale).replace("-", "_")
+
+        self.locale_name = locale
+        self.locale = Locale.parse(locale or LC_TIME)
+        self.time_zone = get_timezone(time_zone)
+        self.long_date_pattern = parse_pattern(self.locale.date_formats["long"])
+        self.custom_pattern = parse_pattern(strftime_to_babel_format(custom_format))
+
+    def format(self, unix_timestamp: float) -> dict[str, Any]:
+        """
+        Calculate different date formats / types.
+
+        Args:
+            unix_timestamp (float): A timestamp in seconds since 1970. Assumes UTC.
+
+        Returns:
+            dict: Different date formats.
+        """
+        loc_revision_date = self.to_local(unix_timestamp)
+        return self.format_local(loc_revision_date, self.long_date_pattern.apply(loc_revision_date.date(), self.locale))
+
+    def format_many(self, unix_timestamps: Iterable[float]) -> dict[int, dict[str, Any]]:
+        """
+        Calculate the different date formats of many timestamps at once.
+
+        Identical timestamps are formatted once, and the localized date is formatted once per calendar day.
+
+        Args:
+            unix_timestamps (Iterable[float]): Timestamps in seconds since 1970. Assume UTC.
+
+        Returns:
+            dict: timestamp (as int) -> different date formats
+        """
+        local_dates = {
+            unix_timestamp: self.to_local(unix_timestamp) for unix_timestamp in set(map(int, unix_timestamps))
+        }
+        long_dates = {
+            day: self.long_date_pattern.apply(day, self.locale)
+            for day in {loc_revision_date.date() for loc_revision_date in local_dates.values()}
+        }
+        return {
+            unix_timestamp: self.format_local(loc_revision_date, long_dates[loc_revision_date.date()])
+            for unix_timestamp, loc_revision_date in local_dates.items()
+        }
+
+    def to_local(self, unix_timestamp: float) -> datetime:
+        """
+        Convert a timestamp to a datetime in the timezone of the formatter.
+        """
+        return datetime.fromtimestamp(int(unix_timestamp), tz=timezone.utc).astimezone(self.time_zone)
+
+    def format_local(self, loc_revision_date: datetime, long_date: str) -> dict[str, Any]:
+        """
+        Calculate the different date formats of a local datetime, of which the localized date is already known.
+        """
+        return {
+            "date": long_date,
+            "datetime": " ".join([long_date, loc_revision_date.strftime("%H:%M:%S")]),
+            "datetime-timezone": " ".join([long_date, loc_revision_date.strftime("%H:%M:%S %Z")]),
+            "iso_date": loc_revision_date.strftime("%Y-%m-%d"),
+            "iso_datetime": loc_revision_date.strftime("%Y-%m-%d %H:%M:%S"),
+            "timeago": f'<span class="timeago" datetime="{loc_revision_date.isoformat()}" locale="{self.locale_name}"></span>',
+            "custom": self.custom_pattern.apply(loc_revision_date, self.locale),
+        }
 
 
 def get_date_formats(
@@ -10,6 +105,8 @@ def get_date_formats(
     """
     Calculate different date formats / types.
 
+    To format many timestamps, create a `DateFormatter` once instead.
+
     Args:
         unix_timestamp (float): A timestamp in seconds since 1970. Assumes UTC.
         locale (str): Locale code of language to use. Defaults to 'en'.
@@ -19,37 +116,7 @@ def get_date_formats(
     Returns:
         dict: Different date formats.
     """
-    assert time_zone is not None
-    assert locale is not None
-
-    # Normalize locale for Babel: convert hyphens to underscores (e.g., pt-BR -> pt_BR)
-    # This is needed for compatibility with mkdocs-static-i18n and other plugins
-    # that may use hyphenated locale codes, while Babel expects underscores
-    if locale:
-        locale = str(locale).replace("-", "_")
-
-    utc_revision_date = datetime.fromtimestamp(int(unix_timestamp), tz=timezone.utc)
-    loc_revision_date = utc_revision_date.replace(tzinfo=get_timezone("UTC")).astimezone(get_timezone(time_zone))
-
-    return {
-        "date": format_date(loc_revision_date, format="long", locale=locale),
-        "datetime": " ".join(
-            [
-                format_date(loc_revision_date, format="long", locale=locale),
-                loc_revision_date.strftime("%H:%M:%S"),
-            ]
-        ),
-        "datetime-timezone": " ".join(
-            [
-                format_date(loc_revision_date, format="long", locale=locale),
-                loc_revision_date.strftime("%H:%M:%S %Z"),
-            ]
-        ),
-        "iso_date": loc_revision_date.strftime("%Y-%m-%d"),
-        "iso_datetime": loc_revision_date.strftime("%Y-%m-%d %H:%M:%S"),
-        "timeago": f'<span class="timeago" datetime="{loc_revision_date.isoformat()}" locale="{locale}"></span>',
-        "custom": format_datetime(loc_revision_date, format=strftime_to_babel_format(custom_format), locale=locale),
-    }
+    return DateFormatter(locale=locale, time_zone=time_zone, custom_format=custom_format).format(unix_timestamp)
 
 
 def strftime_to_babel_format(fmt: str) -> str:
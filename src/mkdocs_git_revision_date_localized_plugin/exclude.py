@@ -6,6 +6,9 @@ Inspired by https://github.com/apenwarr/mkdocs-exclude
 
 import fnmatch
 import os
+import re
+from collections.abc import Callable
+from functools import lru_cache
 
 
 def exclude(src_path: str, globs: list[str]) -> bool:
@@ -25,8 +28,28 @@ def exclude(src_path: str, globs: list[str]) -> bool:
     assert isinstance(src_path, str)
     assert isinstance(globs, list)
 
-    for g in globs:
-        if fnmatch.fnmatchcase(src_path, g):
+    return compile_exclude(tuple(globs))(src_path)
+
+
+@lru_cache(maxsize=32)
+def compile_exclude(globs: tuple[str, ...]) -> Callable[[str], bool]:
+    """
+    Compile a list of globs into a single matcher.
+
+    All globs are combined into one regular expression, so a path is matched once instead of once per glob.
+
+    Args:
+        globs (tuple): globs (e.g. folder/* or *.md)
+    Returns:
+        Callable: function that determines whether a src_path should be excluded
+    """
+    if not globs:
+        return lambda src_path: False
+
+    pattern = re.compile("|".join(fnmatch.translate(g) for g in globs))
+
+    def is_excluded(src_path: str) -> bool:
+        if pattern.match(src_path):
             return True
 
         # Windows reports filenames as eg.  a\\b\\c instead of a/b/c.
@@ -39,8 +62,8 @@ def exclude(src_path: str, globs: list[str]) -> bool:
         # report Windows filenames using / separators regardless of
         # os.sep, so we *always* test with / above.
         if os.sep != "/":
-            src_path_fix = src_path.replace(os.sep, "/")
-            if fnmatch.fnmatchcase(src_path_fix, g):
-                return True
+            return pattern.match(src_path.replace(os.sep, "/")) is not None
+
+        return False
 
-    return False
+    return is_excluded
@@ -0,0 +1,177 @@
+"""
+Single-pass history engine.
+
+Instead of running a separate `git log <file>` for every page,
+walk the history of a directory once with `git log --name-status`
+and build an index with the last and first commit of every file.
+"""
+
+import os
+import re
+from collections.abc import Iterable, Iterator
+
+from git import Git
+
+from mkdocs_git_revision_date_localized_plugin.ignored_commits import IgnoredCommits
+
+# A commit header as printed by the format '%H %at'
+COMMIT_HEADER = re.compile(r"^[0-9a-f]{40}(?:[0-9a-f]{24})? \d+$")
+
+
+def stop_process(process) -> None:
+    """
+    Stop a git process started with `as_process=True` before its output was read to the end.
+
+    The process is killed and waited for, so that it does not linger as a zombie.
+
+    Args:
+        process: the `AutoInterrupt` wrapper GitPython returns for `as_process=True`
+    """
+    process.proc.kill()
+    process.proc.wait()
+    for stream in (process.proc.stdout, process.proc.stderr):
+        if stream is not None:
+            stream.close()
+
+
+def iter_tokens(stream, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+    """
+    Split a NUL separated stream into tokens, without reading it into memory at once.
+
+    Args:
+        stream: binary file-like object (f.e. stdout of a git process)
+        chunk_size (int): number of bytes to read at once
+
+    Yields:
+        bytes: tokens between NUL characters
+    """
+    remainder = b""
+    while chunk := stream.read(chunk_size):
+        *tokens, remainder = (remainder + chunk).split(b"\0")
+        yield from tokens
+    if remainder:
+        yield remainder
+
+
+def iter_log_entries(tokens: Iterable[bytes]) -> Iterator[tuple[str, int, list[tuple[str, ...]]]]:
+    """
+    Parse the output of `git log -z --name-status --format=%x00%H %at`.
+
+    Args:
+        tokens (Iterable[bytes]): NUL separated tokens of the git log output
+
+    Yields:
+        tuple: commit hash, author timestamp and a list of (status, path [, new path]) changes
+    """
+    tokens = iter(tokens)
+    commit = None
+    changes: list[tuple[str, ...]] = []
+    for token in tokens:
+        # git separates the commit header from the list of changes with a newline
+        token = token.lstrip(b"\n")
+        if not token:
+            continue
+        text = token.decode("ascii", errors="replace")
+        if COMMIT_HEADER.match(text):
+            if commit is not None:
+                yield commit[0], commit[1], changes
+            commit_hash, commit_timestamp = text.split(" ")
+            commit = (commit_hash, int(commit_timestamp))
+            changes = []
+            continue
+        # Renames (R) and copies (C) list both the old and the new path
+        n_paths = 2 if text[0] in "RC" else 1
+        paths = tuple(os.fsdecode(next(tokens)) for _ in range(n_paths))
+        changes.append((text, *paths))
+    if commit is not None:
+        yield commit[0], commit[1], changes
+
+
+def build_history_index(
+    git: Git,
+    paths: Iterable[str],
+    pathspec: str = ".",
+    follow: bool = True,
+    ignored_commits: list[str] | None = None,
+    first_commit: bool = True,
+) -> dict[str, tuple[str | None, int | None, str | None, int | None]]:
+    """
+    Determine the last and first commit for a set of files in one pass over the history.
+
+    This mimics the per-file queries in `Util.get_git_commit_timestamp`:
+
+    - the last commit is the most recent commit that is not a pure rename (`--diff-filter=ACDMTUXB`)
+      and that is not in the list of ignored commits.
+    - the first commit is the oldest commit that added the file (`--diff-filter=A`).
+    - when `follow` is enabled, renames are followed back to the original path (`--follow`).
+      Note that only renames within `pathspec` can be detected.
+
+    Args:
+        git (Git): GitPython Git object of the repository
+        paths (Iterable[str]): paths of files, relative to the repository root
+        pathspec (str): directory to limit the history walk to, relative to the repository root
+        follow (bool): whether to follow renames
+        ignored_commits (list[str]): (abbreviated) commit hashes to ignore for the last commit
+        first_commit (bool): whether to also determine the first commit. If not,
+                             the walk stops as soon as all last commits are known.
+
+    Returns:
+        dict: path -> (last hash, last timestamp, first hash, first timestamp).
+              Values are None when no such commit was found.
+    """
+    ignored = IgnoredCommits(ignored_commits or [])
+    last: dict[str, tuple[str, int]] = {}
+    first: dict[str, tuple[str, int]] = {}
+
+    # Maps the name a file had at some point in history to the current path(s)
+    tracked: dict[str, list[str]] = {path: [path] for path in paths}
+    n_remaining = len(tracked)
+
+    process = git.log(
+        "-M" if follow else "--no-renames",
+        "--",
+        pathspec,
+        name_status=True,
+        z=True,
+        format="%x00%H %at",
+        no_show_signature=True,
+        as_process=True,
+    )
+
+    finished_early = False
+    for commit_hash, commit_timestamp, changes in iter_log_entries(iter_tokens(process.stdout)):
+        is_ignored = commit_hash in ignored
+        for status, *change_paths in changes:
+            if status.startswith("R"):
+                # Older commits know the file under its old name.
+                # Pure renames are not counted as a revision (no 'R' in the diff filter).
+                old_path, new_path = change_paths
+                current_paths = tracked.pop(new_path, None)
+                if current_paths:
+                    tracked.setdefault(old_path, []).extend(current_paths)
+                continue
+
+            for current_path in tracked.get(change_paths[0], []):
+                if not is_ignored and current_path not in last:
+                    last[current_path] = (commit_hash, commit_timestamp)
+                    n_remaining -= 1
+                if status == "A":
+                    # Commits are ordered with most recent commit first,
+                    # so the last added commit we see is the oldest one.
+                    first[current_path] = (commit_hash, commit_timestamp)
+
+        if not first_commit and n_remaining == 0:
+            finished_early = True
+            break
+
+    if finished_early:
+        stop_process(process)
+    else:
+        process.wait()
+
+    index = {}
+    for path in set(last) | set(first):
+        last_hash, last_timestamp = last.get(path, (None, None))
+        first_hash, first_timestamp = first.get(path, (None, None))
+        index[path] = (last_hash, last_timestamp, first_hash, first_timestamp)
+    return index
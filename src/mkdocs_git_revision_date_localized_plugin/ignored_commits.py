@@ -0,0 +1,32 @@
+"""
+Fast lookups of the commits listed in the 'ignored_commits_file'.
+"""
+
+from collections.abc import Iterable
+
+
+class IgnoredCommits:
+    """
+    Set of (abbreviated) commit hashes to ignore.
+
+    A commit is ignored when its hash starts with one of the listed hashes. Instead of comparing
+    a commit with every listed hash, the hashes are grouped by length: a lookup only checks
+    whether the prefix of each length is in the set. Files usually list full (or equally abbreviated)
+    hashes, so this is one or two set lookups, no matter how many commits are ignored.
+    """
+
+    def __init__(self, commits: Iterable[str] = ()):
+        """
+        Initialize the set.
+
+        Args:
+            commits (Iterable[str]): (abbreviated) commit hashes
+        """
+        self.prefixes = {commit for commit in commits if commit}
+        self.lengths = sorted({len(prefix) for prefix in self.prefixes})
+
+    def __contains__(self, commit_hash: str) -> bool:
+        return any(commit_hash[:length] in self.prefixes for length in self.lengths)
+
+    def __len__(self) -> int:
+        return len(self.prefixes)
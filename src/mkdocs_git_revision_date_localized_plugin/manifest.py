@@ -0,0 +1,114 @@
+"""
+Manifest of the revision dates of a build.
+
+A manifest stores the commits of every page, by its path in the docs_dir, and the tags of these commits.
+One build with the full git history exports it (option 'export_manifest'), other builds of the same docs
+import it (option 'import_manifest') and do not need git at all, f.e. in a container without `.git`.
+"""
+
+import gzip
+import json
+import os
+from pathlib import Path
+
+# Bump when the layout of the manifest file changes
+MANIFEST_VERSION = 1
+
+
+class RevisionManifest:
+    """
+    The last and first commit of every page, the site revision and the tags of these commits.
+
+    Files with a name ending in '.gz' are compressed with gzip.
+    """
+
+    def __init__(self):
+        # path in the docs_dir (with forward slashes) -> [last hash, last timestamp, first hash, first timestamp]
+        self.pages: dict[str, list] = {}
+        # hash and timestamp of the last commit of the docs_dir
+        self.site: list | None = None
+        # commit hash -> tag name
+        self.tags: dict[str, str] = {}
+
+    @staticmethod
+    def open(path: str | Path, mode: str):
+        """
+        Open a manifest file for reading ('r') or writing ('w') text.
+        """
+        if str(path).endswith(".gz"):
+            return gzip.open(path, mode + "t", encoding="utf-8")
+        return open(path, mode, encoding="utf-8")
+
+    @classmethod
+    def load(cls, path: str | Path) -> "RevisionManifest":
+        """
+        Read a manifest file.
+
+        Args:
+            path (str | Path): path of the manifest file
+
+        Returns:
+            RevisionManifest: the manifest
+
+        Raises:
+            ValueError: if the file was written by another version of the plugin
+        """
+        with cls.open(path, "r") as f:
+            data = json.load(f)
+        if data.get("version") != MANIFEST_VERSION:
+            raise ValueError(f"Manifest '{path}' was written by another version of the plugin")
+
+        manifest = cls()
+        manifest.pages = data.get("pages", {})
+        manifest.site = data.get("site")
+        manifest.tags = data.get("tags", {})
+        return manifest
+
+    def save(self, path: str | Path) -> None:
+        """
+        Write the manifest file.
+
+        Args:
+            path (str | Path): path of the manifest file
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Keep the suffix, which determines the compression
+        temp_file = path.with_name(f"{path.stem}.tmp{path.suffix}")
+        with self.open(temp_file, "w") as f:
+            json.dump({"version": MANIFEST_VERSION, "site": self.site, "pages": self.pages, "tags": self.tags}, f)
+        os.replace(temp_file, path)
+
+    def get(self, src_uri: str, is_first_commit: bool = False) -> tuple[str, int] | None:
+        """
+        Get the last (or first) commit of a page.
+
+        Args:
+            src_uri (str): path of the page in the docs_dir, with forward slashes
+            is_first_commit (bool): get the commit that created the page
+
+        Returns:
+            tuple[str, int] | None: commit hash and timestamp, or None if not in the manifest
+        """
+        entry = self.pages.get(src_uri)
+        if entry is None:
+            return None
+        commit_hash, commit_timestamp = entry[2:4] if is_first_commit else entry[0:2]
+        if commit_timestamp is None:
+            return None
+        return commit_hash, commit_timestamp
+
+    def set(self, src_uri: str, is_first_commit: bool, commit_hash: str, commit_timestamp: int) -> None:
+        """
+        Store the last (or first) commit of a page.
+
+        Fallback results (f.e. the build date for files without git history) have no hash and are not stored,
+        so that builds using the manifest do not get the build date of the build that exported it.
+        """
+        if not commit_hash:
+            return
+        entry = self.pages.setdefault(src_uri, [None, None, None, None])
+        if is_first_commit:
+            entry[2:4] = commit_hash, commit_timestamp
+        else:
+            entry[0:2] = commit_hash, commit_timestamp
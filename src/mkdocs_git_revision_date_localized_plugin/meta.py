@@ -0,0 +1,142 @@
+"""
+Lazy page meta information.
+
+With the 'lazy_meta' option, `page.meta` is replaced by a `LazyMeta`,
+so that variables are only computed when a template (or another plugin) uses them.
+"""
+
+from collections.abc import Callable, Iterator
+from typing import Any
+
+
+class LazyMeta(dict):
+    """
+    Dictionary of which some values are computed (and cached) on first access.
+
+    Lookups by key (`meta[key]`, `meta.get(key)`, `key in meta`) only compute the requested value.
+    Anything that needs all values (f.e. iterating) computes the remaining ones first.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy: dict[str, Callable[[], Any]] = {}
+
+    def set_lazy(self, key: str, compute: Callable[[], Any]) -> None:
+        """
+        Set a value that is computed when it is first accessed.
+
+        Args:
+            key (str): key of the value
+            compute (Callable): function without arguments that returns the value
+        """
+        super().pop(key, None)
+        self.lazy[key] = compute
+
+    def resolve(self) -> None:
+        """
+        Compute all remaining lazy values.
+        """
+        for key in list(self.lazy):
+            self[key]
+
+    def __missing__(self, key: str) -> Any:
+        if key not in self.lazy:
+            raise KeyError(key)
+        value = self.lazy.pop(key)()
+        super().__setitem__(key, value)
+        return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.lazy.pop(key, None)
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key: str) -> None:
+        if key in self.lazy:
+            del self.lazy[key]
+        else:
+            super().__delitem__(key)
+
+    def __contains__(self, key: object) -> bool:
+        return super().__contains__(key) or key in self.lazy
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def pop(self, key: str, *args: Any) -> Any:
+        if key in self.lazy:
+            self[key]
+        return super().pop(key, *args)
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        if key in self:
+            return self[key]
+        self[key] = default
+        return default
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        # dict.update() does not call __setitem__, so that it would keep lazy values of the updated keys
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def clear(self) -> None:
+        self.lazy.clear()
+        super().clear()
+
+    def popitem(self) -> tuple[str, Any]:
+        self.resolve()
+        return super().popitem()
+
+    def __ior__(self, other: Any) -> "LazyMeta":
+        self.update(other)
+        return self
+
+    def __or__(self, other: Any) -> dict:
+        self.resolve()
+        return super().__or__(other)
+
+    def __ror__(self, other: Any) -> dict:
+        self.resolve()
+        return super().__ror__(other)
+
+    def __iter__(self) -> Iterator[str]:
+        self.resolve()
+        return super().__iter__()
+
+    def __len__(self) -> int:
+        return super().__len__() + len(self.lazy)
+
+    def __eq__(self, other: object) -> bool:
+        self.resolve()
+        return super().__eq__(other)
+
+    def __ne__(self, other: object) -> bool:
+        self.resolve()
+        return super().__ne__(other)
+
+    def __repr__(self) -> str:
+        self.resolve()
+        return super().__repr__()
+
+    def keys(self):
+        self.resolve()
+        return super().keys()
+
+    def values(self):
+        self.resolve()
+        return super().values()
+
+    def items(self):
+        self.resolve()
+        return super().items()
+
+    def copy(self) -> dict:
+        self.resolve()
+        return dict(super().items())
+
+    def __reduce__(self):
+        # Pickle (f.e. for caching plugins) as a plain dictionary
+        self.resolve()
+        return dict, (dict(super().items()),)
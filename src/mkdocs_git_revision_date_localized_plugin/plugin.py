@@ -10,7 +10,10 @@ import os
 import re
 import time
 from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any
 
 from mkdocs import __version__ as mkdocs_version
 from mkdocs.config import config_options
@@ -20,13 +23,24 @@ from mkdocs.plugins import BasePlugin
 from mkdocs.structure.files import Files
 from mkdocs.structure.nav import Page
 from mkdocs.utils import copy_file
-from packaging.version import Version
 
-from mkdocs_git_revision_date_localized_plugin.exclude import exclude
-from mkdocs_git_revision_date_localized_plugin.util import Util
+from mkdocs_git_revision_date_localized_plugin.commits import CommitStore, PathIds
+from mkdocs_git_revision_date_localized_plugin.exclude import compile_exclude
+from mkdocs_git_revision_date_localized_plugin.manifest import RevisionManifest
+from mkdocs_git_revision_date_localized_plugin.meta import LazyMeta
+from mkdocs_git_revision_date_localized_plugin.report import BuildReport, timed_phase
+from mkdocs_git_revision_date_localized_plugin.trace import Trace
 
 HERE = Path(__file__).parent.absolute()
 
+logger = logging.getLogger("mkdocs.plugins")
+
+# Placeholders that are replaced in the markdown of a page, like {{ git_revision_date_localized }}
+PLACEHOLDER = re.compile(
+    r"\{\{\s*(git_revision_date_localized|git_site_revision_date_localized|git_creation_date_localized)\s*\}\}",
+    flags=re.IGNORECASE,
+)
+
 
 class GitRevisionDateLocalizedPlugin(BasePlugin):
     """
@@ -48,13 +62,44 @@ class GitRevisionDateLocalizedPlugin(BasePlugin):
         ("enable_git_follow", config_options.Type(bool, default=True)),
         ("ignored_commits_file", config_options.Type(str, default=None)),
         ("enable_parallel_processing", config_options.Type(bool, default=True)),
+        ("max_workers", config_options.Type(int, default=None)),
+        ("history_engine", config_options.Type(str, default="per_file")),
+        ("git_backend", config_options.Type(str, default="cli")),
+        ("enable_cache", config_options.Type(bool, default=False)),
+        ("cache_dir", config_options.Type(str, default=".cache/git-revision-date-localized")),
+        ("lazy_tags", config_options.Type(bool, default=False)),
+        ("lazy_meta", config_options.Type(bool, default=False)),
+        ("export_manifest", config_options.Type(str, default=None)),
+        ("import_manifest", config_options.Type(str, default=None)),
+        ("performance_report", config_options.Type(str, default=None)),
+        ("trace_file", config_options.Type(str, default=None)),
     )
 
     def __init__(self):
         super().__init__()
-        self.last_revision_commits = {}
-        self.created_commits = {}
-        self.is_serve_dirty_build = False
+        # Commits of the files, by their path (and the path of their copy by monorepo or techdocs)
+        self.path_ids = PathIds()
+        self.last_revision_commits = CommitStore(self.path_ids)
+        self.created_commits = CommitStore(self.path_ids)
+        self.cache = None
+        # repository root -> HEAD commit that the computed commit timestamps are based on,
+        # and the options they were computed with (see reuse_options())
+        self.heads = {}
+        self.heads_options = None
+        # Thread pool for parallel processing, kept across builds within one mkdocs serve
+        self.executor = None
+        self.executor_max_workers = None
+        # Whether to look up the git_*_tag variables, see on_config()
+        self.resolve_tags = True
+        # src_path -> whether the file is excluded, see is_excluded()
+        self.excluded_files = {}
+        self.exclude_matcher = compile_exclude(())
+        # Revision dates imported from another build, and the ones to export, see manifest.py
+        self.manifest = None
+        self.exported_manifest = None
+        # Timings of the current build, see the 'performance_report' and 'trace_file' options
+        self.report = None
+        self.trace = None
 
     def on_startup(self, *, command: str, dirty: bool) -> None:
         """
@@ -68,16 +113,21 @@ class GitRevisionDateLocalizedPlugin(BasePlugin):
             command (str): The mkdocs command being run.
             dirty (bool): Whether the build is dirty.
         """
-        # Track if this is an incremental rebuild during mkdocs serve
-        # dirty=True means it's a rebuild triggered by file changes
-        # dirty=False means it's a clean/initial build
-        self.is_serve_dirty_build = dirty
+        # on_startup runs once per mkdocs process, before the first build. Rebuilds during
+        # mkdocs serve (with or without --dirty) reuse the results, see on_files().
+        self.reset_commit_timestamps()
 
-        # Clear cache on clean builds to ensure fresh data
-        if not dirty:
-            self.last_revision_commits = {}
-            self.created_commits = {}
+    def reset_commit_timestamps(self) -> None:
+        """
+        Forget the commit timestamps of earlier builds.
+        """
+        self.path_ids = PathIds()
+        self.last_revision_commits = CommitStore(self.path_ids)
+        self.created_commits = CommitStore(self.path_ids)
+        self.heads = {}
+        self.heads_options = None
 
+    @timed_phase("on_config")
     def on_config(self, config: MkDocsConfig) -> MkDocsConfig | None:
         """
         Determine which locale to use.
@@ -96,10 +146,62 @@ class GitRevisionDateLocalizedPlugin(BasePlugin):
         if not self.config.get("enabled"):
             return config
 
+        # Imported here, so that builds with 'enabled: false' do not load GitPython, Babel and packaging
+        from packaging.version import Version
+
+        from mkdocs_git_revision_date_localized_plugin.backends import BACKENDS, is_backend_available
+        from mkdocs_git_revision_date_localized_plugin.cache import RevisionCache
+        from mkdocs_git_revision_date_localized_plugin.util import Util
+
+        self.report = BuildReport() if self.config.get("performance_report") else None
+        self.trace = Trace() if self.config.get("trace_file") else None
+
         assert self.config["type"] in ["date", "datetime", "iso_date", "iso_datetime", "timeago", "custom"]
+        assert self.config["history_engine"] in ["per_file", "single_pass", "asyncio"]
+        assert self.config["git_backend"] in BACKENDS
+        assert self.config["max_workers"] is None or self.config["max_workers"] > 0
+        if self.config["history_engine"] == "asyncio" and BACKENDS[self.config["git_backend"]][1] is not None:
+            # The asyncio engine always runs the git command, in-process backends are meant to work without it
+            msg = "[git-revision-date-localized] Option 'history_engine: asyncio' runs the git command, "
+            msg += f"and can not be combined with 'git_backend: {self.config['git_backend']}'"
+            raise ConfigurationError(msg)
+        if not is_backend_available(self.config["git_backend"]):
+            msg = f"[git-revision-date-localized] Option 'git_backend: {self.config['git_backend']}' "
+            msg += "requires an extra package: "
+            msg += f"pip install 'mkdocs-git-revision-date-localized-plugin[{self.config['git_backend']}]'"
+            raise ConfigurationError(msg)
 
         config_file_path = config.get("config_file_path") or ""
-        self.util = Util(config=self.config, mkdocs_dir=os.path.abspath(os.path.dirname(config_file_path)))
+        mkdocs_dir = os.path.abspath(os.path.dirname(config_file_path))
+        self.util = Util(config=self.config, mkdocs_dir=mkdocs_dir)
+
+        # Persistent cache of revision dates, see cache.py
+        if self.config.get("enable_cache"):
+            self.cache = RevisionCache(
+                util=self.util,
+                cache_dir=os.path.join(mkdocs_dir, self.config.get("cache_dir")),
+                options=self.cache_options(),
+            )
+        else:
+            self.cache = None
+
+        # Revision dates of another build, so that git is not needed (see manifest.py)
+        self.manifest = None
+        if self.config.get("import_manifest"):
+            manifest_file = os.path.join(mkdocs_dir, self.config.get("import_manifest"))
+            try:
+                self.manifest = RevisionManifest.load(manifest_file)
+            except (OSError, ValueError) as err:
+                msg = f"[git-revision-date-localized] Unable to read 'import_manifest' file '{manifest_file}': {err}"
+                raise ConfigurationError(msg)
+        self.exported_manifest = RevisionManifest() if self.config.get("export_manifest") else None
+
+        # Compile the exclude globs once
+        self.exclude_matcher = compile_exclude(tuple(self.config.get("exclude", [])))
+        self.excluded_files = {}
+
+        # Skip looking up tags when the theme does not use them
+        self.resolve_tags = not self.config.get("lazy_tags") or self.templates_use_tags(config)
 
         # Save last commit timestamp for entire site
         # Support monorepo/techdocs, which copies the docs_dir to a temporary directory
@@ -109,14 +211,12 @@ class GitRevisionDateLocalizedPlugin(BasePlugin):
             and hasattr(mono_repo_plugin, "originalDocsDir")
             and mono_repo_plugin.originalDocsDir is not None
         ):
-            self.last_site_revision_hash, self.last_site_revision_timestamp = self.util.get_git_commit_timestamp(
-                mono_repo_plugin.originalDocsDir
-            )
+            docs_dir = mono_repo_plugin.originalDocsDir
         else:
             docs_dir = config.get("docs_dir") or ""
-            self.last_site_revision_hash, self.last_site_revision_timestamp = self.util.get_git_commit_timestamp(
-                docs_dir
-            )
+        self.last_site_revision_hash, self.last_site_revision_timestamp = self.get_site_revision(docs_dir)
+        if self.exported_manifest is not None and self.last_site_revision_hash:
+            self.exported_manifest.site = [self.last_site_revision_hash, self.last_site_revision_timestamp]
 
         # Get locale from plugin configuration
         plugin_locale = self.config.get("locale", None)
@@ -158,6 +258,14 @@ class GitRevisionDateLocalizedPlugin(BasePlugin):
         # set locale also in plugin configuration
         self.config["locale"] = locale_set
 
+        # Parse the locales we already know about once, instead of on every page
+        # (the locale of a page can also be set in its front matter)
+        i18n_plugin = config.get("plugins", {}).get("i18n", None)
+        i18n_languages = getattr(getattr(i18n_plugin, "config", None), "languages", None) or []
+        self.util.prepare_date_formatters(
+            [locale_set, *(language.locale for language in i18n_languages if getattr(language, "locale", None))]
+        )
+
         # Add pointers to support files for timeago.js
         if self.config.get("type") == "timeago":
             config["extra_javascript"] = ["js/timeago_mkdocs_material.js"] + config["extra_javascript"]
@@ -174,11 +282,153 @@ class GitRevisionDateLocalizedPlugin(BasePlugin):
 
         return config
 
-    def parallel_compute_commit_timestamps(self, files, original_source: dict | None = None, is_first_commit=False):
-        import multiprocessing
+    @timed_phase("on_config/site_revision")
+    def get_site_revision(self, docs_dir: str) -> tuple[str, int]:
+        """
+        Get the commit hash and timestamp of the last commit of the docs_dir.
+        """
+        if self.manifest is not None and self.manifest.site is not None:
+            commit_hash, commit_timestamp = self.manifest.site
+            return commit_hash, commit_timestamp
+        return self.get_git_commit_timestamp(docs_dir)
+
+    def cache_options(self) -> dict:
+        """
+        Get the options that affect the revision dates. A cache built with other options is discarded.
+        """
+        return {
+            "enable_git_follow": self.config.get("enable_git_follow"),
+            "history_engine": self.config.get("history_engine"),
+            "git_backend": self.config.get("git_backend"),
+            "ignored_commits": self.util.ignored_commits,
+        }
+
+    def reuse_options(self) -> dict:
+        """
+        Get the options that affect the commit timestamps computed in on_files().
 
-        pool = multiprocessing.Pool(processes=min(10, multiprocessing.cpu_count()))
-        results = []
+        Results of an earlier build in the same process are only reused when these did not change.
+        """
+        return {**self.cache_options(), "enable_creation_date": self.config.get("enable_creation_date")}
+
+    @staticmethod
+    def templates_use_tags(config: MkDocsConfig) -> bool:
+        """
+        Determine whether any template of the theme refers to the git_*_tag variables.
+
+        Args:
+            config (MkDocsConfig): global configuration object
+
+        Returns:
+            bool: True if a template (possibly) uses the tags
+        """
+        theme = config.get("theme")
+        for theme_dir in getattr(theme, "dirs", []):
+            for root, _, filenames in os.walk(theme_dir):
+                for filename in filenames:
+                    if not filename.endswith((".html", ".j2", ".jinja", ".jinja2")):
+                        continue
+                    with open(os.path.join(root, filename), encoding="utf-8", errors="replace") as f:
+                        if "_localized_tag" in f.read():
+                            return True
+        return False
+
+    def is_excluded(self, src_path: str) -> bool:
+        """
+        Determine whether a file is excluded by the 'exclude' option.
+
+        The results of all files are determined once in on_files(), and reused for every page.
+        """
+        excluded = self.excluded_files.get(src_path)
+        if excluded is None:
+            excluded = self.excluded_files[src_path] = self.exclude_matcher(src_path)
+        return excluded
+
+    def get_tag_name_for_commit(self, commit_hash: str) -> str:
+        """
+        Get the tag name for a commit, or an empty string when tags are not looked up (see 'lazy_tags').
+        """
+        if not self.resolve_tags:
+            return ""
+        if self.manifest is not None:
+            return self.manifest.tags.get(commit_hash, "")
+        return self.util.get_tag_name_for_commit(commit_hash)
+
+    def get_git_commit_timestamp(self, path: str, is_first_commit: bool = False) -> tuple[str, int]:
+        """
+        Get the commit hash and timestamp of a file, using cached results where possible.
+
+        Args:
+            path (str): Location of a markdown file (or directory) that is part of a Git repository.
+            is_first_commit (bool): retrieve commit timestamp when file was created.
+
+        Returns:
+            tuple[str, int]: commit hash and commit date in unix timestamp.
+        """
+        # Results computed up front in on_files()
+        commits = self.created_commits if is_first_commit else self.last_revision_commits
+        commit_hash, commit_timestamp = commits.get(str(Path(path).absolute()), (None, None))
+        if commit_timestamp is not None:
+            if self.report is not None:
+                self.report.add_lookup(is_first_commit, "hits")
+            return commit_hash, commit_timestamp
+
+        # Results from a previous build
+        if self.cache is not None:
+            cached = self.cache.get(path)
+            if cached is not None:
+                commit_hash, commit_timestamp = cached[2:4] if is_first_commit else cached[0:2]
+                if commit_timestamp is not None:
+                    if self.report is not None:
+                        self.report.add_lookup(is_first_commit, "cache_hits")
+                    return commit_hash, commit_timestamp
+
+        if self.report is not None:
+            self.report.add_lookup(is_first_commit, "misses")
+        commit_hash, commit_timestamp = self.query_git(self.util.get_git_commit_timestamp, path, is_first_commit)
+        if self.cache is not None:
+            if is_first_commit:
+                self.cache.set(path, first_commit=(commit_hash, commit_timestamp))
+            else:
+                self.cache.set(path, last_commit=(commit_hash, commit_timestamp))
+        return commit_hash, commit_timestamp
+
+    def query_git(self, query: Callable, path: str, *args: Any, submitted: float | None = None) -> Any:
+        """
+        Run a git query of `Util` for a single file, timed for the 'performance_report' and 'trace_file'.
+
+        Args:
+            query (Callable): method of `Util`, called with the path and args
+            path (str): location of the file
+            submitted (float | None): `time.perf_counter()` when the query was submitted to the thread pool
+        """
+        if self.report is None and self.trace is None:
+            return query(path, *args)
+        start = time.perf_counter()
+        try:
+            return query(path, *args)
+        finally:
+            end = time.perf_counter()
+            if self.report is not None:
+                self.report.add_query(path, end - start)
+            if self.trace is not None:
+                args = {"path": path, "query": query.__name__}
+                if submitted is not None:
+                    # Time spent waiting for a free worker
+                    args["queued_ms"] = round((start - submitted) * 1000, 3)
+                self.trace.add("git query", start, end, args)
+
+    def get_paths_to_process(self, files, original_source: dict | None = None):
+        """
+        Determine the files that need a git revision date.
+
+        Args:
+            files (Files): files of the site
+            original_source (dict | None): mapping from (temporary) paths to the original paths under git
+
+        Yields:
+            tuple[str, str]: the absolute path of the file under git, and the absolute path mkdocs uses
+        """
         for f in files:
             if not f.is_documentation_page():
                 continue
@@ -186,7 +436,7 @@ class GitRevisionDateLocalizedPlugin(BasePlugin):
                 continue
             elif f.abs_src_path is None:
                 continue
-            elif exclude(f.src_path, self.config.get("exclude", [])):
+            elif self.is_excluded(f.src_path):
                 continue
             else:
                 temp_abs_src_path = str(Path(f.abs_src_path).absolute())
@@ -198,34 +448,162 @@ class GitRevisionDateLocalizedPlugin(BasePlugin):
 
                 assert Path(abs_src_path).exists()
                 abs_src_path = str(Path(abs_src_path).absolute())
-                result = pool.apply_async(self.util.get_git_commit_timestamp, args=(abs_src_path, is_first_commit))
-                # Store both the original path and temp path (if different) so cache lookups work either way
-                results.append((abs_src_path, result))
-                if temp_abs_src_path != abs_src_path:
-                    results.append((temp_abs_src_path, result))
-        pool.close()
-        pool.join()
-        if is_first_commit:
-            for src_uri, result in results:
-                self.created_commits[src_uri] = result.get()
-        else:
-            for src_uri, result in results:
-                self.last_revision_commits[src_uri] = result.get()
+                yield abs_src_path, temp_abs_src_path
 
-    def on_files(self, files: Files, config: MkDocsConfig):
+    @timed_phase("on_files/cache")
+    def load_cached_commit_timestamps(self, paths: list[tuple[str, str]]) -> list[tuple[str, str]]:
+        """
+        Fill the commit timestamps from the persistent cache.
+
+        Args:
+            paths (list[tuple[str, str]]): paths as returned by get_paths_to_process()
+
+        Returns:
+            list[tuple[str, str]]: the paths that are not (fully) cached
+        """
+        assert self.cache is not None
+        remaining = []
+        for abs_src_path, temp_abs_src_path in paths:
+            cached = self.cache.get(abs_src_path)
+            if cached is None or cached[1] is None or (self.config.get("enable_creation_date") and cached[3] is None):
+                remaining.append((abs_src_path, temp_abs_src_path))
+                continue
+            last_hash, last_timestamp, first_hash, first_timestamp = cached
+            self.last_revision_commits[abs_src_path] = (last_hash, last_timestamp)
+            if first_timestamp is not None:
+                self.created_commits[abs_src_path] = (first_hash, first_timestamp)
+        return remaining
+
+    def get_executor(self) -> ThreadPoolExecutor:
+        """
+        Get the thread pool for parallel processing, creating it on first use.
+
+        Looking up git history is mostly waiting on git processes, so threads work well here.
+        The pool is reused for rebuilds during mkdocs serve.
+        """
+        max_workers = self.config.get("max_workers")
+        if self.executor is not None and self.executor_max_workers != max_workers:
+            # The option was changed while serving
+            self.executor.shutdown(wait=False)
+            self.executor = None
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="git-revision-date")
+            self.executor_max_workers = max_workers
+        return self.executor
+
+    @timed_phase("on_files/per_file")
+    def parallel_compute_commit_timestamps(self, paths: list[tuple[str, str]]):
         """
-        Compute commit timestamps for all files in parallel.
+        Compute commit timestamps for all files on the thread pool.
+
+        With 'enable_creation_date', the last and first commit of a file are found in a single `git log`.
+        """
+        executor = self.get_executor()
+        include_first_commit = self.config.get("enable_creation_date")
+        results = []
+        for abs_src_path, _ in paths:
+            if include_first_commit:
+                result = executor.submit(
+                    self.query_git, self.util.get_git_commit_timestamps, abs_src_path, submitted=time.perf_counter()
+                )
+            else:
+                result = executor.submit(
+                    self.query_git,
+                    self.util.get_git_commit_timestamp,
+                    abs_src_path,
+                    False,
+                    submitted=time.perf_counter(),
+                )
+            results.append((abs_src_path, result))
+        for src_uri, result in results:
+            if include_first_commit:
+                self.last_revision_commits[src_uri], self.created_commits[src_uri] = result.result()
+            else:
+                self.last_revision_commits[src_uri] = result.result()
+
+    @timed_phase("on_files/single_pass")
+    def single_pass_compute_commit_timestamps(self, paths: list[tuple[str, str]]):
+        """
+        Compute commit timestamps for all files with one `git log` walk per repository.
+        """
+        index = self.util.get_git_history_index(
+            [abs_src_path for abs_src_path, _ in paths],
+            include_first_commit=self.config.get("enable_creation_date"),
+            on_query=self.report.add_query if self.report is not None else None,
+        )
+        self.store_commit_timestamps(paths, index)
+
+    @timed_phase("on_files/asyncio")
+    def async_compute_commit_timestamps(self, paths: list[tuple[str, str]]):
+        """
+        Compute commit timestamps for all files with concurrent `git log` calls on an asyncio event loop.
+        """
+        index = self.util.get_git_commit_timestamps_async(
+            [abs_src_path for abs_src_path, _ in paths],
+            include_first_commit=self.config.get("enable_creation_date"),
+            max_concurrency=self.config.get("max_workers"),
+            on_query=self.report.add_query if self.report is not None else None,
+        )
+        self.store_commit_timestamps(paths, index)
+
+    def store_commit_timestamps(self, paths: list[tuple[str, str]], index: dict):
+        """
+        Store the commits of an index of path -> (last hash, last timestamp, first hash, first timestamp).
+        """
+        for abs_src_path, _ in paths:
+            if abs_src_path not in index:
+                # Falls back to a per-file query in on_page_markdown()
+                continue
+            last_hash, last_timestamp, first_hash, first_timestamp = index[abs_src_path]
+            if last_timestamp is not None:
+                self.last_revision_commits[abs_src_path] = (last_hash, last_timestamp)
+            if first_timestamp is not None:
+                self.created_commits[abs_src_path] = (first_hash, first_timestamp)
+
+    @timed_phase("on_files/invalidate")
+    def invalidate_commit_timestamps(self, paths: list[tuple[str, str]]) -> None:
+        """
+        Drop the commit timestamps of files that are affected by commits made since they were computed.
+
+        Used on incremental rebuilds during `mkdocs serve`. HEAD is read without starting a git process,
+        so when nothing was committed this is nearly free. Dropped files are recomputed in on_page_markdown().
+
+        Args:
+            paths (list[tuple[str, str]]): paths as returned by get_paths_to_process()
         """
-        if not self.config.get("enabled") or not self.config.get("enable_parallel_processing"):
+        changed_paths = {}
+        for root, head in self.heads.items():
+            current_head = self.util.get_head(root)
+            if current_head == head:
+                continue
+            if head is not None and current_head is not None:
+                changed_paths[root] = self.util.get_changed_paths(root, head, current_head)
+            else:
+                changed_paths[root] = None
+            self.heads[root] = current_head
+
+        if not changed_paths:
             return
 
-        # Skip parallel processing on incremental rebuilds (dirty builds during mkdocs serve)
-        # This avoids the overhead of creating a new multiprocessing pool on every file save
-        # The cache from the initial build will be reused
-        if self.is_serve_dirty_build:
-            logging.debug(
-                "[git-revision-date-localized] Skipping parallel processing on incremental rebuild, using cache"
-            )
+        for abs_src_path, _ in paths:
+            root = self.util.get_repo_root(abs_src_path)
+            if root not in changed_paths:
+                continue
+            relpath = Path(os.path.relpath(os.path.realpath(abs_src_path), root)).as_posix()
+            # Without a list of changed paths (f.e. when the old HEAD no longer exists), drop everything
+            if changed_paths[root] is None or relpath in changed_paths[root]:
+                self.last_revision_commits.pop(abs_src_path, None)
+                self.created_commits.pop(abs_src_path, None)
+
+    @timed_phase("on_files")
+    def on_files(self, files: Files, config: MkDocsConfig):
+        """
+        Compute commit timestamps and date formats for all files up front.
+
+        Depending on the 'history_engine' option, this either runs a `git log`
+        for every file in parallel (on threads or an asyncio event loop), or walks the git history once.
+        """
+        if not self.config.get("enabled"):
             return
 
         # Support monorepo/techdocs, which copies the docs_dir to a temporary directory
@@ -235,21 +613,125 @@ class GitRevisionDateLocalizedPlugin(BasePlugin):
         else:
             original_source = None
 
-        try:
-            if not self.last_revision_commits:
-                self.parallel_compute_commit_timestamps(
-                    files=files, original_source=original_source, is_first_commit=False
-                )
-            if not self.created_commits:
-                self.parallel_compute_commit_timestamps(
-                    files=files, original_source=original_source, is_first_commit=True
-                )
-        except Exception as e:
+        self.excluded_files = {f.src_path: self.exclude_matcher(f.src_path) for f in files}
+        paths = list(self.get_paths_to_process(files, original_source))
+
+        # Rebuilds in the same process (mkdocs serve) reuse the results of the earlier build,
+        # except for files affected by commits made since then
+        reuse = self.manifest is None and self.heads and self.heads_options == self.reuse_options()
+        if not reuse:
+            self.reset_commit_timestamps()
+        # Commits are stored for the path under git, lookups by the path mkdocs uses find them too
+        for abs_src_path, temp_abs_src_path in paths:
+            self.path_ids.alias(temp_abs_src_path, abs_src_path)
+
+        # Revision dates from the manifest of another build are used as-is
+        if self.manifest is not None:
+            self.load_manifest_commit_timestamps(files)
+        elif reuse:
+            logging.debug("[git-revision-date-localized] Reusing the commit timestamps of the previous build")
+            self.invalidate_commit_timestamps(paths)
+        else:
+            self.compute_commit_timestamps(paths)
+
+        self.prepare_date_formats(files)
+
+    @timed_phase("on_files/manifest")
+    def load_manifest_commit_timestamps(self, files: Files) -> None:
+        """
+        Fill the commit timestamps from the manifest of the 'import_manifest' option.
+
+        Pages that are not in the manifest are looked up in git in on_page_markdown().
+        """
+        assert self.manifest is not None
+        missing = []
+        for f in files:
+            if not f.is_documentation_page() or f.abs_src_path is None or getattr(f, "generated_by", None):
+                continue
+            if self.is_excluded(f.src_path):
+                continue
+            src_uri = Path(f.src_path).as_posix()
+            last_commit = self.manifest.get(src_uri)
+            if last_commit is None:
+                missing.append(src_uri)
+                continue
+            abs_src_path = str(Path(f.abs_src_path).absolute())
+            self.last_revision_commits[abs_src_path] = last_commit
+            first_commit = self.manifest.get(src_uri, is_first_commit=True)
+            if first_commit is not None:
+                self.created_commits[abs_src_path] = first_commit
+        if missing:
             logging.warning(
-                f"Parallel processing failed: {str(e)}.\n To fall back to serial processing, use 'enable_parallel_processing: False' setting."
+                f"[git-revision-date-localized] {len(missing)} pages are not in the 'import_manifest' file, "
+                f"looking up their dates in git: {', '.join(missing[:10])}"
             )
-            raise e
 
+    def compute_commit_timestamps(self, paths: list[tuple[str, str]]) -> None:
+        """
+        Compute commit timestamps for all files, with the engine of the 'history_engine' option.
+
+        Args:
+            paths (list[tuple[str, str]]): paths as returned by get_paths_to_process()
+        """
+        # Remember which commits the results are based on, see invalidate_commit_timestamps()
+        self.heads = {}
+        self.heads_options = self.reuse_options()
+        for abs_src_path, _ in paths:
+            root = self.util.get_repo_root(abs_src_path)
+            if root is not None and root not in self.heads:
+                self.heads[root] = self.util.get_head(root)
+
+        if self.cache is not None:
+            paths = self.load_cached_commit_timestamps(paths)
+        if not paths:
+            return
+
+        if self.config.get("history_engine") == "single_pass":
+            self.single_pass_compute_commit_timestamps(paths)
+        elif self.config.get("history_engine") == "asyncio":
+            self.async_compute_commit_timestamps(paths)
+        elif self.config.get("enable_parallel_processing"):
+            try:
+                self.parallel_compute_commit_timestamps(paths)
+            except Exception as e:
+                logging.warning(
+                    f"Parallel processing failed: {str(e)}.\n To fall back to serial processing, use 'enable_parallel_processing: False' setting."
+                )
+                raise e
+        else:
+            return
+
+        if self.cache is not None:
+            for abs_src_path, _ in paths:
+                self.cache.set(
+                    abs_src_path,
+                    last_commit=self.last_revision_commits.get(abs_src_path),
+                    first_commit=self.created_commits.get(abs_src_path),
+                )
+
+    @timed_phase("on_files/date_formats")
+    def prepare_date_formats(self, files: Files) -> None:
+        """
+        Format the dates of all pages at once, per locale, so that on_page_markdown() only has to look them up.
+
+        Pages with a locale in their front matter are formatted when the page is built.
+        """
+        timestamps_per_locale = {}
+        for f in files:
+            if not f.is_documentation_page() or f.abs_src_path is None:
+                continue
+            # The locale of mkdocs-static-i18n, or the locale determined in on_config()
+            locale = getattr(f, "locale", None) or self.config.get("locale")
+            timestamps = timestamps_per_locale.setdefault(locale, {self.last_site_revision_timestamp})
+            src_uri = str(Path(f.abs_src_path).absolute())
+            for commits in (self.last_revision_commits, self.created_commits):
+                if src_uri in commits:
+                    timestamps.add(commits[src_uri][1])
+
+        for locale, timestamps in timestamps_per_locale.items():
+            self.util.prepare_date_formats(timestamps, locale)
+
+    @timed_phase("on_page_markdown", lambda markdown, page, *args, **kwargs: {"page": page.file.src_path})
     def on_page_markdown(self, markdown: str, page: Page, config: config_options.Config, files, **kwargs) -> str:
         """
         Replace jinja2 tags in markdown and templates with the localized dates.
@@ -274,11 +756,14 @@ class GitRevisionDateLocalizedPlugin(BasePlugin):
             return markdown
 
         # Exclude pages specified in config
-        excluded_pages = self.config.get("exclude", [])
-        if exclude(page.file.src_path, excluded_pages):
+        if self.is_excluded(page.file.src_path):
             logging.debug("Excluding page " + page.file.src_path)
             return markdown
 
+        # With 'lazy_meta', variables that are rarely used are only computed when they are accessed
+        if self.config.get("lazy_meta") and not isinstance(page.meta, LazyMeta):
+            page.meta = LazyMeta(page.meta)
+
         # Find the locale
 
         # First prio is use mkdocs-static-i18n locale if set
@@ -304,21 +789,13 @@ class GitRevisionDateLocalizedPlugin(BasePlugin):
             # abs_src_path should always be set for documentation pages
             assert page.file.abs_src_path is not None
             abs_src_path = page.file.abs_src_path
-            # Use cached results if parallel processing is enabled and cache is populated
-            if self.config.get("enable_parallel_processing") and self.last_revision_commits:
-                last_revision_hash, last_revision_timestamp = self.last_revision_commits.get(
-                    str(Path(abs_src_path).absolute()), (None, None)
-                )
-                if last_revision_timestamp is None:
-                    last_revision_hash, last_revision_timestamp = self.util.get_git_commit_timestamp(
-                        path=abs_src_path,
-                        is_first_commit=False,
-                    )
-            else:
-                # Directly call git if parallel processing is disabled or cache is empty
-                last_revision_hash, last_revision_timestamp = self.util.get_git_commit_timestamp(
-                    path=abs_src_path,
-                    is_first_commit=False,
+            last_revision_hash, last_revision_timestamp = self.get_git_commit_timestamp(
+                path=abs_src_path,
+                is_first_commit=False,
+            )
+            if self.exported_manifest is not None:
+                self.exported_manifest.set(
+                    Path(page.file.src_path).as_posix(), False, last_revision_hash, last_revision_timestamp
                 )
 
         # Last revision date
@@ -337,25 +814,20 @@ class GitRevisionDateLocalizedPlugin(BasePlugin):
         # Include variants without the CSS <span> elements (raw date strings)
         page.meta["git_revision_date_localized"] = revision_date
         page.meta["git_revision_date_localized_hash"] = last_revision_hash
-        page.meta["git_revision_date_localized_tag"] = self.util.get_tag_name_for_commit(last_revision_hash)
-        revision_dates_raw = self.util.get_date_formats_for_timestamp(
-            last_revision_timestamp, locale=locale, add_spans=False
-        )
-        for date_type, date_string in revision_dates_raw.items():
-            page.meta[f"git_revision_date_localized_raw_{date_type}"] = date_string
-
-        # Replace any occurances in markdown page
-        markdown = re.sub(
-            r"\{\{\s*git_revision_date_localized\s*\}\}",
-            revision_date,
-            markdown,
-            flags=re.IGNORECASE,
+        self.set_meta(
+            page.meta, "git_revision_date_localized_tag", lambda: self.get_tag_name_for_commit(last_revision_hash)
         )
+        self.set_raw_dates_meta(page.meta, "git_revision_date_localized", last_revision_timestamp, locale)
+
+        # Placeholders in the markdown page are replaced at the end, see replace_placeholders()
+        replacements = {"git_revision_date_localized": revision_date}
 
         # Also add site last updated information, for developers
         page.meta["git_site_revision_date_localized_hash"] = self.last_site_revision_hash
-        page.meta["git_site_revision_date_localized_tag"] = self.util.get_tag_name_for_commit(
-            self.last_site_revision_hash
+        self.set_meta(
+            page.meta,
+            "git_site_revision_date_localized_tag",
+            lambda: self.get_tag_name_for_commit(self.last_site_revision_hash),
         )
         site_dates = self.util.get_date_formats_for_timestamp(
             self.last_site_revision_timestamp, locale=locale, add_spans=True
@@ -364,24 +836,16 @@ class GitRevisionDateLocalizedPlugin(BasePlugin):
         if self.config["type"] == "timeago":
             site_date += site_dates["iso_date"]
         page.meta["git_site_revision_date_localized"] = site_date
-        site_dates_raw = self.util.get_date_formats_for_timestamp(
-            self.last_site_revision_timestamp, locale=locale, add_spans=False
-        )
-        for date_type, date_string in site_dates_raw.items():
-            page.meta[f"git_site_revision_date_localized_raw_{date_type}"] = date_string
-
-        # Replace any occurances in markdown page
-        markdown = re.sub(
-            r"\{\{\s*git_site_revision_date_localized\s*\}\}",
-            site_date,
-            markdown,
-            flags=re.IGNORECASE,
+        self.set_raw_dates_meta(
+            page.meta, "git_site_revision_date_localized", self.last_site_revision_timestamp, locale
         )
 
+        replacements["git_site_revision_date_localized"] = site_date
+
         # If creation date not enabled, return markdown
         # This is for speed: prevents another `git log` operation each file
         if not self.config.get("enable_creation_date"):
-            return markdown
+            return self.replace_placeholders(markdown, replacements)
 
         # Retrieve git commit timestamp
         # Except for generated pages (f.e. by mkdocs-gen-files plugin)
@@ -391,26 +855,10 @@ class GitRevisionDateLocalizedPlugin(BasePlugin):
             # abs_src_path should always be set for documentation pages
             assert page.file.abs_src_path is not None
             abs_src_path = page.file.abs_src_path
-            # Use cached results if parallel processing is enabled and cache is populated
-            if (
-                self.config.get("enable_creation_date")
-                and self.config.get("enable_parallel_processing")
-                and self.created_commits
-            ):
-                first_revision_hash, first_revision_timestamp = self.created_commits.get(
-                    str(Path(abs_src_path).absolute()), (None, None)
-                )
-                if first_revision_timestamp is None:
-                    first_revision_hash, first_revision_timestamp = self.util.get_git_commit_timestamp(
-                        path=abs_src_path,
-                        is_first_commit=True,
-                    )
-            else:
-                # Directly call git if parallel processing is disabled or cache is empty
-                first_revision_hash, first_revision_timestamp = self.util.get_git_commit_timestamp(
-                    path=abs_src_path,
-                    is_first_commit=True,
-                )
+            first_revision_hash, first_revision_timestamp = self.get_git_commit_timestamp(
+                path=abs_src_path,
+                is_first_commit=True,
+            )
 
         if first_revision_timestamp > last_revision_timestamp:
             # See also https://github.com/timvink/mkdocs-git-revision-date-localized-plugin/issues/111
@@ -419,6 +867,11 @@ class GitRevisionDateLocalizedPlugin(BasePlugin):
             logging.warning(msg)
             first_revision_hash, first_revision_timestamp = last_revision_hash, last_revision_timestamp
 
+        if self.exported_manifest is not None and not getattr(page.file, "generated_by", None):
+            self.exported_manifest.set(
+                Path(page.file.src_path).as_posix(), True, first_revision_hash, first_revision_timestamp
+            )
+
         # Creation date formats
         creation_dates = self.util.get_date_formats_for_timestamp(
             first_revision_timestamp, locale=locale, add_spans=True
@@ -434,30 +887,114 @@ class GitRevisionDateLocalizedPlugin(BasePlugin):
         # Add to page meta information, for developers
         # Include variants without the CSS <span> elements (raw date strings)
         page.meta["git_creation_date_localized_hash"] = first_revision_hash
-        page.meta["git_creation_date_localized_tag"] = self.util.get_tag_name_for_commit(first_revision_hash)
-        page.meta["git_creation_date_localized"] = creation_date
-        creation_dates_raw = self.util.get_date_formats_for_timestamp(
-            first_revision_timestamp, locale=locale, add_spans=False
-        )
-        for date_type, date_string in creation_dates_raw.items():
-            page.meta[f"git_creation_date_localized_raw_{date_type}"] = date_string
-
-        # Replace any occurances in markdown page
-        markdown = re.sub(
-            r"\{\{\s*git_creation_date_localized\s*\}\}",
-            creation_date,
-            markdown,
-            flags=re.IGNORECASE,
+        self.set_meta(
+            page.meta, "git_creation_date_localized_tag", lambda: self.get_tag_name_for_commit(first_revision_hash)
         )
+        page.meta["git_creation_date_localized"] = creation_date
+        self.set_raw_dates_meta(page.meta, "git_creation_date_localized", first_revision_timestamp, locale)
+
+        replacements["git_creation_date_localized"] = creation_date
+
+        return self.replace_placeholders(markdown, replacements)
+
+    @staticmethod
+    def set_meta(meta: dict, key: str, compute: Callable[[], Any]) -> None:
+        """
+        Add a variable to the page meta information, computed on first access with 'lazy_meta'.
+        """
+        if isinstance(meta, LazyMeta):
+            meta.set_lazy(key, compute)
+        else:
+            meta[key] = compute()
+
+    def set_raw_dates_meta(self, meta: dict, prefix: str, timestamp: int, locale: str) -> None:
+        """
+        Add the variants of a date without the CSS <span> elements (raw date strings) to the page meta information.
+        """
+        if not isinstance(meta, LazyMeta):
+            raw_dates = self.util.get_date_formats_for_timestamp(timestamp, locale=locale, add_spans=False)
+            for date_type, date_string in raw_dates.items():
+                meta[f"{prefix}_raw_{date_type}"] = date_string
+            return
+
+        from mkdocs_git_revision_date_localized_plugin.dates import DATE_TYPES
 
-        return markdown
+        for date_type in DATE_TYPES:
+            meta.set_lazy(
+                f"{prefix}_raw_{date_type}",
+                lambda date_type=date_type: self.util.get_date_formats_for_timestamp(
+                    timestamp, locale=locale, add_spans=False
+                )[date_type],
+            )
+
+    @staticmethod
+    def replace_placeholders(markdown: str, replacements: dict[str, str]) -> str:
+        """
+        Replace any occurances of the placeholders in the markdown of a page, in a single scan.
+
+        Args:
+            markdown (str): Markdown source text of page as string
+            replacements (dict): placeholder name (lowercase) -> date. Other placeholders are left as-is.
+
+        Returns:
+            str: Markdown source text of page as string
+        """
+        # Most pages do not contain any placeholders
+        if "{{" not in markdown:
+            return markdown
+        return PLACEHOLDER.sub(lambda match: replacements.get(match.group(1).lower(), match.group(0)), markdown)
+
+    def export_manifest(self, config: MkDocsConfig) -> None:
+        """
+        Write the revision dates of this build, and the tags of their commits, to the 'export_manifest' file.
+        """
+        manifest = self.exported_manifest
+        assert manifest is not None
+        commit_hashes = {entry[i] for entry in manifest.pages.values() for i in (0, 2) if entry[i]}
+        if manifest.site is not None:
+            commit_hashes.add(manifest.site[0])
+        manifest.tags = {}
+        for commit_hash in sorted(commit_hashes):
+            if self.manifest is not None:
+                tag = self.manifest.tags.get(commit_hash, "")
+            else:
+                tag = self.util.get_tag_name_for_commit(commit_hash)
+            if tag:
+                manifest.tags[commit_hash] = tag
+
+        config_file_path = config.get("config_file_path") or ""
+        manifest.save(os.path.join(os.path.abspath(os.path.dirname(config_file_path)), self.config["export_manifest"]))
 
     def on_post_build(self, *, config: MkDocsConfig) -> None:
         """
         Run on post build.
 
-        Adds the timeago assets to the build.
+        Adds the timeago assets to the build, and saves the cache, the manifest, the performance report and the trace.
         """
+        # Save revision dates for the next build
+        if self.cache is not None and self.config.get("enabled"):
+            self.cache.save()
+
+        # Save revision dates for other builds
+        if self.exported_manifest is not None and self.config.get("enabled"):
+            self.export_manifest(config)
+
+        if self.report is not None and self.config.get("enabled"):
+            config_file_path = config.get("config_file_path") or ""
+            report_file = os.path.join(
+                os.path.abspath(os.path.dirname(config_file_path)), self.config["performance_report"]
+            )
+            self.report.save(report_file)
+            logger.info(f"[git-revision-date-localized] Performance report written to '{report_file}'")
+            for line in self.report.summary().splitlines():
+                logger.info(f"[git-revision-date-localized] {line}")
+
+        if self.trace is not None and self.config.get("enabled"):
+            config_file_path = config.get("config_file_path") or ""
+            trace_file = os.path.join(os.path.abspath(os.path.dirname(config_file_path)), self.config["trace_file"])
+            self.trace.save(trace_file)
+            logger.info(f"[git-revision-date-localized] Timeline written to '{trace_file}', open it in ui.perfetto.dev")
+
         # Add timeago files:
         if self.config.get("type") == "timeago" and self.config.get("enabled"):
             files = [
@@ -470,3 +1007,11 @@ class GitRevisionDateLocalizedPlugin(BasePlugin):
                 src_file_path = HERE / f
                 assert src_file_path.exists()
                 copy_file(str(src_file_path), str(dest_file_path))
+
+    def on_shutdown(self) -> None:
+        """
+        Run when mkdocs exits, after the last build.
+        """
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
@@ -0,0 +1,164 @@
+"""
+Performance report of a build, see the 'performance_report' option.
+
+Covers the time spent per hook (and the passes within them), the git processes started,
+how often commits were found without querying git, and the slowest git queries.
+"""
+
+import functools
+import heapq
+import json
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+# Number of slowest git queries to include in the report
+SLOWEST_QUERIES = 20
+
+
+class BuildReport:
+    """
+    Timings and counters of a single build.
+
+    Git queries can run on a thread pool, so updates are thread-safe.
+    """
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        # Git processes started during this build. Imported here, as the accounting loads GitPython.
+        from mkdocs_git_revision_date_localized_plugin.accounting import GitCallCounter
+
+        self.git_calls = GitCallCounter()
+        self.lock = threading.Lock()
+        # phase -> [calls, seconds]. Passes within a hook are named '<hook>/<pass>'.
+        self.phases: dict[str, list] = {}
+        # How the commits of pages were found: precomputed in on_files, from the persistent cache or by querying git
+        self.lookups = {
+            "last_revision_commits": {"hits": 0, "cache_hits": 0, "misses": 0},
+            "created_commits": {"hits": 0, "cache_hits": 0, "misses": 0},
+        }
+        # The slowest git queries, as a heap of (seconds, path)
+        self.queries: list[tuple[float, str]] = []
+
+    def add_phase(self, name: str, seconds: float) -> None:
+        """
+        Add the time spent in a hook, or in a pass within a hook.
+        """
+        with self.lock:
+            phase = self.phases.setdefault(name, [0, 0.0])
+            phase[0] += 1
+            phase[1] += seconds
+
+    def add_lookup(self, is_first_commit: bool, outcome: str) -> None:
+        """
+        Count a lookup of the commit of a page.
+
+        Args:
+            is_first_commit (bool): whether the commit that created the page was looked up
+            outcome (str): 'hits', 'cache_hits' or 'misses'
+        """
+        with self.lock:
+            self.lookups["created_commits" if is_first_commit else "last_revision_commits"][outcome] += 1
+
+    def add_query(self, path: str, seconds: float) -> None:
+        """
+        Add the time spent querying git for a single file.
+        """
+        with self.lock:
+            if len(self.queries) < SLOWEST_QUERIES:
+                heapq.heappush(self.queries, (seconds, path))
+            else:
+                heapq.heappushpop(self.queries, (seconds, path))
+
+    def git_processes(self) -> dict[str, dict]:
+        """
+        Get the number of git processes and the seconds spent on them per subcommand, during this build.
+        """
+        seconds = self.git_calls.seconds
+        return {
+            subcommand: {"calls": count, "seconds": round(seconds[subcommand], 6)}
+            for subcommand, count in self.git_calls.counts.items()
+        }
+
+    def to_dict(self) -> dict:
+        """
+        Get the report as a dictionary.
+        """
+        git_processes = self.git_processes()
+        with self.lock:
+            return {
+                "seconds": round(time.perf_counter() - self.start, 6),
+                "phases": {
+                    name: {"calls": calls, "seconds": round(seconds, 6)}
+                    for name, (calls, seconds) in self.phases.items()
+                },
+                "git_processes": git_processes,
+                "git_processes_total": sum(process["calls"] for process in git_processes.values()),
+                "lookups": self.lookups,
+                "slowest_queries": [
+                    {"path": path, "seconds": round(seconds, 6)} for seconds, path in sorted(self.queries, reverse=True)
+                ],
+            }
+
+    def summary(self) -> str:
+        """
+        Summarize the report in a few lines, for the log.
+        """
+        report = self.to_dict()
+        phases = ", ".join(
+            f"{name} {phase['seconds']:.2f}s" + (f" ({phase['calls']}x)" if phase["calls"] > 1 else "")
+            for name, phase in report["phases"].items()
+            if "/" not in name
+        )
+        processes = ", ".join(f"{name}: {process['calls']}" for name, process in report["git_processes"].items())
+        lines = [
+            f"Time spent: {phases}",
+            f"Git processes: {report['git_processes_total']}" + (f" ({processes})" if processes else ""),
+        ]
+        for name, lookups in report["lookups"].items():
+            lines.append(
+                f"{name}: {lookups['hits']} precomputed, {lookups['cache_hits']} from cache, {lookups['misses']} queried"
+            )
+        if report["slowest_queries"]:
+            slowest = report["slowest_queries"][0]
+            lines.append(f"Slowest git query: '{slowest['path']}' ({slowest['seconds']:.2f}s)")
+        return "\n".join(lines)
+
+    def save(self, path: str | Path) -> None:
+        """
+        Write the report as JSON.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+
+def timed_phase(name: str, describe: Callable[..., dict] | None = None) -> Callable:
+    """
+    Decorate a plugin method to add its duration to the report and the trace of the build, if there are any.
+
+    The report and trace are looked up after the method returns, so that on_config() can create them.
+
+    Args:
+        name (str): name of the phase, f.e. 'on_files' or 'on_files/single_pass'
+        describe (Callable | None): function of the arguments of the method that returns details for the trace
+    """
+
+    def decorator(method: Callable) -> Callable:
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                end = time.perf_counter()
+                if self.report is not None:
+                    self.report.add_phase(name, end - start)
+                if self.trace is not None:
+                    self.trace.add(name, start, end, describe(*args, **kwargs) if describe else None)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,265 @@
+"""
+Compute revision dates in shards, f.e. spread over the nodes of a CI pipeline.
+
+Every shard looks up the git history of a subset of the pages and writes the results to a file
+in the format of the persistent cache (see cache.py). The files of all shards are merged into the
+cache file, so that a build with 'enable_cache' does not need to query git for any page.
+
+    mkdocs-git-revision-date-shard compute --shard 1/8
+    mkdocs-git-revision-date-shard merge .cache/git-revision-date-localized/revisions-*-of-8.json
+"""
+
+import argparse
+import json
+import logging
+import os
+import zlib
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+from mkdocs.config import load_config
+from mkdocs.config.defaults import MkDocsConfig
+from mkdocs.structure.files import File, get_files
+
+from mkdocs_git_revision_date_localized_plugin.cache import CACHE_FILE_NAME, CACHE_VERSION, RevisionCache
+from mkdocs_git_revision_date_localized_plugin.exclude import compile_exclude
+from mkdocs_git_revision_date_localized_plugin.plugin import GitRevisionDateLocalizedPlugin
+
+logger = logging.getLogger("mkdocs.plugins")
+
+
+def shard_of(src_uri: str, shard_count: int) -> int:
+    """
+    Get the (1-based) shard a file belongs to.
+
+    The hash of the path does not depend on the machine or python process, so every shard selects the same files.
+
+    Args:
+        src_uri (str): path of the file relative to the docs_dir, with forward slashes
+        shard_count (int): total number of shards
+
+    Returns:
+        int: shard number, from 1 up to and including shard_count
+    """
+    return zlib.crc32(src_uri.encode("utf-8")) % shard_count + 1
+
+
+def select_files(
+    files: Iterable[File],
+    shard: tuple[int, int] | None = None,
+    globs: Iterable[str] = (),
+    file_list: set[str] | None = None,
+) -> Iterator[File]:
+    """
+    Select the files of a shard. A file is selected when it matches all given criteria.
+
+    Args:
+        files (Iterable[File]): files of the site
+        shard (tuple[int, int] | None): shard number and total number of shards
+        globs (Iterable[str]): glob patterns of the paths relative to the docs_dir
+        file_list (set[str] | None): paths relative to the docs_dir, with forward slashes
+
+    Yields:
+        File: the selected files
+    """
+    globs = tuple(globs)
+    matcher = compile_exclude(globs) if globs else None
+    for f in files:
+        src_uri = Path(f.src_path).as_posix()
+        if shard is not None and shard_of(src_uri, shard[1]) != shard[0]:
+            continue
+        if matcher is not None and not matcher(f.src_path):
+            continue
+        if file_list is not None and src_uri not in file_list:
+            continue
+        yield f
+
+
+def get_plugin(config: MkDocsConfig) -> GitRevisionDateLocalizedPlugin:
+    """
+    Get the (first) instance of the plugin from the mkdocs configuration.
+    """
+    for plugin in config.plugins.values():
+        if isinstance(plugin, GitRevisionDateLocalizedPlugin):
+            return plugin
+    raise ValueError(f"The git-revision-date-localized plugin is not enabled in '{config.config_file_path}'")
+
+
+def get_cache_dir(config: MkDocsConfig, plugin: GitRevisionDateLocalizedPlugin) -> Path:
+    """
+    Get the directory of the cache file, as used by the build.
+    """
+    return Path(os.path.dirname(os.path.abspath(config.config_file_path))) / plugin.config.get("cache_dir")
+
+
+def compute_shard(
+    config_file: str | None = None,
+    output: str | Path | None = None,
+    shard: tuple[int, int] | None = None,
+    globs: Iterable[str] = (),
+    file_list: set[str] | None = None,
+) -> Path:
+    """
+    Look up the revision dates of the selected pages and write them to a shard file.
+
+    Args:
+        config_file (str | None): path of the mkdocs.yml file
+        output (str | Path | None): path of the shard file. Defaults to a file in the 'cache_dir'.
+        shard (tuple[int, int] | None): shard number and total number of shards
+        globs (Iterable[str]): glob patterns of the paths relative to the docs_dir
+        file_list (set[str] | None): paths relative to the docs_dir, with forward slashes
+
+    Returns:
+        Path: path of the shard file
+
+    Raises:
+        ValueError: if the plugin is not enabled
+    """
+    config = load_config(config_file)
+    plugin = get_plugin(config)
+    if not plugin.config.get("enabled"):
+        raise ValueError(f"The git-revision-date-localized plugin has 'enabled: false' in '{config.config_file_path}'")
+    # Results are stored in the shard file instead of the cache file
+    plugin.config["enable_cache"] = False
+    # Also looks up the site revision date
+    plugin.on_config(config)
+
+    if output is None:
+        name = f"revisions-{shard[0]}-of-{shard[1]}.json" if shard else "revisions-shard.json"
+        output = get_cache_dir(config, plugin) / name
+    output = Path(output)
+    plugin.cache = RevisionCache(plugin.util, output.parent, plugin.cache_options(), file_name=output.name)
+
+    files = select_files(get_files(config), shard=shard, globs=globs, file_list=file_list)
+    paths = list(plugin.get_paths_to_process(files))
+    logger.info(f"[git-revision-date-localized-plugin] Computing revision dates of {len(paths)} pages")
+    plugin.compute_commit_timestamps(paths)
+
+    # Pages that were not computed up front (f.e. without parallel processing) are looked up one by one.
+    # Results that are already known are not queried again.
+    for abs_src_path, _ in paths:
+        plugin.get_git_commit_timestamp(abs_src_path)
+        if plugin.config.get("enable_creation_date"):
+            plugin.get_git_commit_timestamp(abs_src_path, is_first_commit=True)
+    # The site revision date, as found by on_config()
+    plugin.cache.set(
+        config.get("docs_dir"),
+        last_commit=(plugin.last_site_revision_hash, plugin.last_site_revision_timestamp),
+    )
+
+    plugin.cache.save()
+    return output
+
+
+def merge_shards(shard_files: Iterable[str | Path], output: str | Path) -> Path:
+    """
+    Merge the files of shards into one cache file.
+
+    All shards should be computed with the same plugin options, at the same commit,
+    and write their files to the same directory as the output (the default).
+    Repository paths in the files are relative to the directory they were written to.
+
+    Args:
+        shard_files (Iterable[str | Path]): paths of the shard files
+        output (str | Path): path of the merged cache file
+
+    Returns:
+        Path: path of the merged cache file
+    """
+    options = None
+    repositories: dict[str, dict] = {}
+    for shard_file in shard_files:
+        with open(shard_file, encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != CACHE_VERSION:
+            raise ValueError(f"'{shard_file}' was written by another version of the plugin")
+        if options is None:
+            options = data.get("options")
+        elif data.get("options") != options:
+            raise ValueError(f"'{shard_file}' was computed with other plugin options")
+
+        for root, repository in data.get("repositories", {}).items():
+            merged = repositories.setdefault(root, {"head": repository.get("head"), "files": {}})
+            if repository.get("head") != merged["head"]:
+                raise ValueError(f"'{shard_file}' was computed at another commit of repository '{root}'")
+            for path, entry in repository.get("files", {}).items():
+                known = merged["files"].get(path)
+                if known is not None:
+                    # A file can be in several shards, f.e. when only its last commit was computed in one of them
+                    entry = [value if value is not None else other for value, other in zip(entry, known)]
+                merged["files"][path] = entry
+
+    if options is None:
+        raise ValueError("No shard files to merge")
+
+    output = Path(output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    temp_file = output.with_suffix(".tmp")
+    with open(temp_file, "w", encoding="utf-8") as f:
+        json.dump({"version": CACHE_VERSION, "options": options, "repositories": repositories}, f)
+    os.replace(temp_file, output)
+    return output
+
+
+def parse_shard(value: str) -> tuple[int, int]:
+    """
+    Parse a shard argument like '3/8' into (3, 8).
+    """
+    try:
+        number, count = (int(part) for part in value.split("/"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid shard '{value}', expected <number>/<count>, f.e. 1/8")
+    if not 1 <= number <= count:
+        raise argparse.ArgumentTypeError(f"invalid shard '{value}', the number should be between 1 and {count}")
+    return number, count
+
+
+def main(argv: list[str] | None = None) -> None:
+    """
+    Command line interface, see `mkdocs-git-revision-date-shard --help`.
+    """
+    parser = argparse.ArgumentParser(
+        prog="mkdocs-git-revision-date-shard",
+        description="Compute git revision dates in shards, and merge them into the cache of the plugin.",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    compute_parser = subparsers.add_parser("compute", help="compute the revision dates of a subset of the pages")
+    compute_parser.add_argument("-f", "--config-file", help="path of the mkdocs.yml file")
+    compute_parser.add_argument("-o", "--output", help="path of the shard file (default: in the cache_dir)")
+    compute_parser.add_argument("--shard", type=parse_shard, help="select pages by the hash of their path, f.e. 1/8")
+    compute_parser.add_argument(
+        "--glob", action="append", default=[], help="select pages matching a glob pattern (can be repeated)"
+    )
+    compute_parser.add_argument("--files", help="select the pages listed in a file, one path (in docs_dir) per line")
+
+    merge_parser = subparsers.add_parser("merge", help="merge shard files into the cache file")
+    merge_parser.add_argument("-f", "--config-file", help="path of the mkdocs.yml file")
+    merge_parser.add_argument(
+        "-o", "--output", help=f"path of the merged file (default: {CACHE_FILE_NAME} in cache_dir)"
+    )
+    merge_parser.add_argument("shard_files", nargs="+", help="files written by the compute command")
+
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(levelname)-7s -  %(message)s")
+
+    try:
+        if args.command == "compute":
+            file_list = None
+            if args.files:
+                with open(args.files, encoding="utf-8") as f:
+                    file_list = {Path(line.strip()).as_posix() for line in f if line.strip()}
+            output = compute_shard(args.config_file, args.output, args.shard, args.glob, file_list)
+        else:
+            output = args.output
+            if output is None:
+                config = load_config(args.config_file)
+                output = get_cache_dir(config, get_plugin(config)) / CACHE_FILE_NAME
+            output = merge_shards(args.shard_files, output)
+    except (OSError, ValueError) as err:
+        parser.exit(1, f"error: {err}\n")
+    logger.info(f"[git-revision-date-localized-plugin] Revision dates written to '{output}'")
+
+
+if __name__ == "__main__":
+    main()
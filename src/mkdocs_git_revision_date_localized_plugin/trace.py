@@ -0,0 +1,73 @@
+"""
+Timeline of a build, see the 'trace_file' option.
+
+Events are written in the Chrome trace event format, which can be viewed in Perfetto
+(https://ui.perfetto.dev) or chrome://tracing: every hook, pass and git query is a bar
+on the timeline of the thread that ran it.
+"""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+
+class Trace:
+    """
+    Events of a single build, with their thread. Events can be added from any thread.
+    """
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.lock = threading.Lock()
+        self.events: list[dict] = []
+        # thread id -> thread name
+        self.threads: dict[int, str] = {}
+
+    def add(self, name: str, start: float, end: float, args: dict | None = None) -> None:
+        """
+        Add an event that ran on the current thread.
+
+        Args:
+            name (str): name of the event, f.e. 'on_files' or 'git query'
+            start (float): `time.perf_counter()` at the start of the event
+            end (float): `time.perf_counter()` at the end of the event
+            args (dict | None): details shown with the event, f.e. the path of a file
+        """
+        thread = threading.current_thread()
+        event = {
+            "name": name,
+            # Hooks and passes are named like 'on_files/single_pass'
+            "cat": name.split("/")[0],
+            "ph": "X",
+            "ts": round((start - self.start) * 1e6, 3),
+            "dur": round((end - start) * 1e6, 3),
+            "pid": os.getpid(),
+            "tid": thread.ident,
+        }
+        if args:
+            event["args"] = args
+        with self.lock:
+            self.events.append(event)
+            self.threads[thread.ident] = thread.name
+
+    def to_dict(self) -> dict:
+        """
+        Get the trace in the Chrome trace event format.
+        """
+        with self.lock:
+            thread_names = [
+                {"name": "thread_name", "ph": "M", "pid": os.getpid(), "tid": tid, "args": {"name": name}}
+                for tid, name in self.threads.items()
+            ]
+            return {"traceEvents": thread_names + self.events, "displayTimeUnit": "ms"}
+
+    def save(self, path: str | Path) -> None:
+        """
+        Write the trace as JSON.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f)
@@ -2,20 +2,27 @@
 
 import logging
 import os
+import threading
 import time
+from collections.abc import Callable, Iterable
+from functools import lru_cache
 from pathlib import Path
 
+from babel.core import UnknownLocaleError
 from git import (
     Git,
     GitCommandError,
     GitCommandNotFound,
     InvalidGitRepositoryError,
     NoSuchPathError,
-    Repo,
 )
 
+from mkdocs_git_revision_date_localized_plugin import async_history
+from mkdocs_git_revision_date_localized_plugin.accounting import CountingRepo
+from mkdocs_git_revision_date_localized_plugin.backends import BACKENDS, Backend, GitCliBackend
 from mkdocs_git_revision_date_localized_plugin.ci import raise_ci_warnings
-from mkdocs_git_revision_date_localized_plugin.dates import get_date_formats
+from mkdocs_git_revision_date_localized_plugin.dates import DateFormatter
+from mkdocs_git_revision_date_localized_plugin.history import build_history_index
 
 logger = logging.getLogger("mkdocs.plugins")
 
@@ -29,7 +36,18 @@ class Util:
     def __init__(self, config: dict, mkdocs_dir: str):
         """Initialize utility class."""
         self.config = config
-        self.repo_cache = {}
+        # repository root -> Git object
+        self.repo_cache: dict[str, Git] = {}
+        # directory -> root of the repository it is part of
+        self.repo_roots: dict[str, str] = {}
+        self.repo_lock = threading.Lock()
+        self.backends: dict[str, Backend] = {}
+        # locale -> date formatter, see prepare_date_formatters()
+        self.date_formatters: dict[str, DateFormatter] = {}
+        # (timestamp, locale) -> date formats, see prepare_date_formats()
+        self.precomputed_date_formats: dict[tuple[int, str], dict[str, str]] = {}
+        # (timestamp, locale, add_spans) -> date formats
+        self.date_formats = lru_cache(maxsize=4096)(self._date_formats)
 
         ignore_commits_file = self.config.get("ignored_commits_file")
         if ignore_commits_file:
@@ -39,16 +57,57 @@ class Util:
             self.ignored_commits: list[str] = []
 
     def _get_repo(self, path: str) -> Git:
+        """
+        Get the Git object of the repository a file or directory is part of.
+
+        Repositories are cached by their root directory, so every repository is only discovered
+        (and checked for CI warnings) once, no matter how many directories the docs have.
+        """
+        path = os.path.abspath(path)
         if not os.path.isdir(path):
             path = os.path.dirname(path)
 
-        if path not in self.repo_cache:
-            self.repo_cache[path] = Repo(path, search_parent_directories=True).git
-            # Checks if user is running builds on CI
-            # and raise appropriate warnings
-            raise_ci_warnings(self.repo_cache[path])
-
-        return self.repo_cache[path]
+        root = self.repo_roots.get(path)
+        if root is not None:
+            return self.repo_cache[root]
+
+        with self.repo_lock:
+            # Walk up to a directory of which the repository is already known.
+            # Stop at directories with a '.git' entry, which start a (nested) repository of their own.
+            directories = []
+            directory = path
+            while directory not in self.repo_roots:
+                directories.append(directory)
+                parent = os.path.dirname(directory)
+                if parent == directory or os.path.exists(os.path.join(directory, ".git")):
+                    break
+                directory = parent
+
+            root = self.repo_roots.get(directory)
+            if root is None:
+                git = CountingRepo(path, search_parent_directories=True).git
+                root = str(git.working_dir)
+                if root not in self.repo_cache:
+                    self.repo_cache[root] = git
+                    # Checks if user is running builds on CI
+                    # and raise appropriate warnings
+                    raise_ci_warnings(git)
+
+            for directory in directories:
+                self.repo_roots[directory] = root
+
+        return self.repo_cache[root]
+
+    def _get_backend(self, git: Git) -> Backend:
+        working_dir = str(git.working_dir)
+        if working_dir not in self.backends:
+            backend_class, _ = BACKENDS[self.config.get("git_backend") or "cli"]
+            self.backends[working_dir] = backend_class(
+                working_dir,
+                follow=self.config.get("enable_git_follow", True),
+                ignored_commits=self.ignored_commits,
+            )
+        return self.backends[working_dir]
 
     def get_git_commit_timestamp(self, path: str, is_first_commit: bool = False) -> tuple[str, int]:
         """
@@ -63,9 +122,42 @@ class Util:
         Returns:
             tuple[str, int]: commit hash and commit date in unix timestamp.
         """
-        commit_timestamp = ""
-        commit_hash = ""
-        n_ignored_commits = 0
+        # Ignored commits are only considered for the most recent update, not for creation
+        if is_first_commit:
+            return self._get_git_commits(path, lambda backend, relpath: (backend.first_commit(relpath),))[0]
+        return self._get_git_commits(path, lambda backend, relpath: (backend.last_commit(relpath),))[0]
+
+    def get_git_commit_timestamps(self, path: str) -> tuple[tuple[str, int], tuple[str, int]]:
+        """
+        Get both the most recent commit and the commit that created a file, with a single walk over its history.
+
+        Gives the same results as calling `get_git_commit_timestamp()` twice.
+
+        Args:
+            path (str): Location of a markdown file that is part of a Git repository.
+
+        Returns:
+            tuple: commit hash and commit date in unix timestamp, of the last and of the first commit.
+        """
+        last_commit, first_commit = self._get_git_commits(
+            path, lambda backend, relpath: backend.commits(relpath), n_commits=2
+        )
+        return last_commit, first_commit
+
+    def _get_git_commits(self, path: str, query, n_commits: int = 1) -> list[tuple[str, int]]:
+        """
+        Run a query on the backend of the repository of a file, falling back to the build date where needed.
+
+        Args:
+            path (str): Location of a markdown file that is part of a Git repository.
+            query (callable): called with the backend and the path relative to the repository root,
+                              returns a tuple of commits (or None when not found).
+            n_commits (int): number of commits the query returns.
+
+        Returns:
+            list[tuple[str, int]]: commit hash and commit date in unix timestamp, for every commit of the query.
+        """
+        commits = None
 
         # Determine the logging level
         # Only log warnings when plugin is set to strict.
@@ -83,45 +175,10 @@ class Util:
             realpath = os.path.realpath(path)
             git = self._get_repo(realpath)
 
-            follow_option = self.config.get("enable_git_follow")
+            backend = self._get_backend(git)
+            relpath = Path(os.path.relpath(realpath, git.working_dir)).as_posix()
 
-            # Ignored commits are only considered for the most recent update, not for creation
-            if is_first_commit:
-                # diff_filter="A" will select the commit that created the file
-                commit_timestamp = git.log(
-                    realpath, date="unix", format="%at", diff_filter="Ar", no_show_signature=True, follow=follow_option
-                )
-                # A file can be created multiple times, through a file renamed.
-                # Commits are ordered with most recent commit first
-                # Get the oldest commit only
-                if commit_timestamp != "":
-                    commit_timestamp = commit_timestamp.split()[-1]
-            else:
-                # Retrieve the history for the file in the format <hash> <timestamp>
-                # The maximum number of commits we will ever need to examine is 1 more than the number of ignored commits.
-                lines = git.log(
-                    realpath,
-                    date="unix",
-                    format="%H %at",
-                    diff_filter="r",
-                    n=len(self.ignored_commits) + 1,
-                    no_show_signature=True,
-                    follow=follow_option,
-                    ignore_all_space=True,
-                    ignore_blank_lines=True,
-                ).split("\n")
-
-                # process the commits for the file in reverse-chronological order. Ignore any commit that is on the
-                # ignored list. If the line is empty, we've reached the end and need to use the fallback behavior.
-                for line in lines:
-                    if not line:
-                        commit_timestamp = ""
-                        break
-                    commit_hash, commit_timestamp = line.split(" ")
-                    if not any(commit_hash.startswith(x) for x in self.ignored_commits):
-                        break
-                    else:
-                        n_ignored_commits += 1
+            commits = query(backend, relpath)
 
         except (InvalidGitRepositoryError, NoSuchPathError) as err:
             if self.config.get("fallback_to_build_date"):
@@ -129,7 +186,6 @@ class Util:
                     "[git-revision-date-localized-plugin] Unable to find a git directory and/or git is not installed."
                     " Option 'fallback_to_build_date' set to 'true': Falling back to build date"
                 )
-                commit_timestamp = time.time()
             else:
                 log(
                     "[git-revision-date-localized-plugin] Unable to find a git directory and/or git is not installed."
@@ -142,7 +198,6 @@ class Util:
                     f"[git-revision-date-localized-plugin] Unable to read git logs of '{path}'. Is git log readable?"
                     " Option 'fallback_to_build_date' set to 'true': Falling back to build date"
                 )
-                commit_timestamp = time.time()
             else:
                 logger.error(
                     f"[git-revision-date-localized-plugin] Unable to read git logs of '{path}'. "
@@ -157,7 +212,6 @@ class Util:
                     "[git-revision-date-localized-plugin] Unable to perform command: 'git log'. Is git installed?"
                     " Option 'fallback_to_build_date' set to 'true': Falling back to build date"
                 )
-                commit_timestamp = time.time()
             else:
                 log(
                     "[git-revision-date-localized-plugin] Unable to perform command 'git log'. Is git installed?"
@@ -170,7 +224,6 @@ class Util:
                     f"[git-revision-date-localized-plugin] An unexpected error occurred: {str(err)}"
                     " Option 'fallback_to_build_date' set to 'true': Falling back to build date"
                 )
-                commit_timestamp = time.time()
             else:
                 logger.error(
                     f"[git-revision-date-localized-plugin] An unexpected error occurred: {str(err)}"
@@ -178,15 +231,212 @@ class Util:
                 )
                 raise err
 
+        if commits is None:
+            # Falling back to build date
+            return [("", int(time.time()))] * n_commits
+
         # create timestamp
-        if commit_timestamp == "":
-            commit_timestamp = time.time()
+        if any(commit is None for commit in commits):
             msg = f"[git-revision-date-localized-plugin] '{path}' has no git logs, using current timestamp"
-            if n_ignored_commits:
-                msg += f" (ignored {n_ignored_commits} commits)"
+            if self.ignored_commits:
+                msg += f" (ignored {len(self.ignored_commits)} commits)"
             log(msg)
 
-        return commit_hash, int(commit_timestamp)
+        return [(commit[0], int(commit[1])) if commit is not None else ("", int(time.time())) for commit in commits]
+
+    def get_git_history_index(
+        self,
+        paths: list[str],
+        include_first_commit: bool = True,
+        on_query: Callable[[str, float], None] | None = None,
+    ) -> dict[str, tuple[str | None, int | None, str | None, int | None]]:
+        """
+        Get the last and first commit of many files with a single `git log` per repository.
+
+        Files for which the history could not be determined are left out,
+        so that callers can fall back to `get_git_commit_timestamp()`,
+        which also takes care of logging and the 'fallback_to_build_date' option.
+
+        Args:
+            paths (list[str]): Locations of markdown files that are part of a Git repository.
+            include_first_commit (bool): also determine the commit that created each file.
+            on_query (Callable | None): called with the folder and the seconds of every `git log` per repository.
+
+        Returns:
+            dict: path -> (last hash, last timestamp, first hash, first timestamp).
+        """
+        # Group the files per repository, with paths relative to the repository root
+        repos: dict[str, tuple[Git, list[tuple[str, str]]]] = {}
+        for path in paths:
+            realpath = os.path.realpath(path)
+            try:
+                git = self._get_repo(realpath)
+            except (InvalidGitRepositoryError, NoSuchPathError):
+                continue
+            working_dir = str(git.working_dir)
+            relpath = Path(os.path.relpath(realpath, working_dir)).as_posix()
+            repos.setdefault(working_dir, (git, []))[1].append((path, relpath))
+
+        index = {}
+        for working_dir, (git, repo_paths) in repos.items():
+            relpaths = [relpath for _, relpath in repo_paths]
+            # Only walk the history of the directory that contains all the files
+            pathspec = os.path.commonpath([os.path.dirname(relpath) for relpath in relpaths]) or "."
+            start = time.perf_counter()
+            try:
+                repo_index = build_history_index(
+                    git,
+                    relpaths,
+                    pathspec=pathspec,
+                    follow=self.config.get("enable_git_follow"),
+                    ignored_commits=self.ignored_commits,
+                    first_commit=include_first_commit,
+                )
+            except (GitCommandError, GitCommandNotFound) as err:
+                logger.debug(
+                    f"[git-revision-date-localized-plugin] Unable to read git history of '{working_dir}': {err}"
+                )
+                continue
+            finally:
+                if on_query is not None:
+                    on_query(os.path.normpath(os.path.join(working_dir, pathspec)), time.perf_counter() - start)
+            for path, relpath in repo_paths:
+                if relpath in repo_index:
+                    index[path] = repo_index[relpath]
+
+        return index
+
+    def get_git_commit_timestamps_async(
+        self,
+        paths: list[str],
+        include_first_commit: bool = True,
+        max_concurrency: int | None = None,
+        on_query: Callable[[str, float], None] | None = None,
+    ) -> dict[str, tuple[str | None, int | None, str | None, int | None]]:
+        """
+        Get the last and first commit of many files, running the `git log` calls concurrently with asyncio.
+
+        Like `get_git_history_index()`, files for which the history could not be determined are left out.
+
+        Args:
+            paths (list[str]): Locations of markdown files that are part of a Git repository.
+            include_first_commit (bool): also determine the commit that created each file.
+            max_concurrency (int | None): maximum number of git processes to run at the same time.
+            on_query (Callable | None): called with the path and the seconds of the `git log` calls of every file.
+
+        Returns:
+            dict: path -> (last hash, last timestamp, first hash, first timestamp).
+        """
+        backends: dict[str, GitCliBackend] = {}
+        queries = []
+        query_paths = []
+        for path in paths:
+            realpath = os.path.realpath(path)
+            try:
+                git = self._get_repo(realpath)
+            except (InvalidGitRepositoryError, NoSuchPathError):
+                continue
+            working_dir = str(git.working_dir)
+            if working_dir not in backends:
+                backends[working_dir] = GitCliBackend(
+                    working_dir,
+                    follow=self.config.get("enable_git_follow", True),
+                    ignored_commits=self.ignored_commits,
+                )
+            queries.append((backends[working_dir], Path(os.path.relpath(realpath, working_dir)).as_posix()))
+            query_paths.append(path)
+
+        query_callback = None
+        if on_query is not None:
+            paths_by_query = {
+                (backend.working_dir, relpath): path for (backend, relpath), path in zip(queries, query_paths)
+            }
+
+            def query_callback(backend: GitCliBackend, relpath: str, seconds: float) -> None:
+                on_query(paths_by_query[backend.working_dir, relpath], seconds)
+
+        try:
+            results = async_history.run(
+                async_history.query_commits(
+                    queries,
+                    include_first_commit=include_first_commit,
+                    max_concurrency=max_concurrency,
+                    on_query=query_callback,
+                )
+            )
+        except (OSError, RuntimeError) as err:
+            logger.debug(f"[git-revision-date-localized-plugin] Unable to run git processes with asyncio: {err}")
+            return {}
+
+        index = {}
+        for path, (last_commit, first_commit) in zip(query_paths, results):
+            if isinstance(last_commit, BaseException) or isinstance(first_commit, BaseException):
+                logger.debug(
+                    f"[git-revision-date-localized-plugin] Unable to read git logs of '{path}': "
+                    f"{last_commit if isinstance(last_commit, BaseException) else first_commit}"
+                )
+                continue
+            if last_commit is None:
+                continue
+            first_hash, first_timestamp = first_commit if first_commit is not None else (None, None)
+            index[path] = (*last_commit, first_hash, first_timestamp)
+
+        return index
+
+    def get_repo_root(self, path: str) -> str | None:
+        """
+        Get the root directory of the repository a path is part of.
+
+        Args:
+            path (str): Location of a file or directory.
+
+        Returns:
+            str | None: resolved root directory, or None if the path is not part of a Git repository.
+        """
+        try:
+            return os.path.realpath(self._get_repo(os.path.realpath(path)).working_dir)
+        except (InvalidGitRepositoryError, NoSuchPathError):
+            return None
+
+    def get_head(self, path: str) -> str | None:
+        """
+        Get the commit hash of HEAD of the repository a path is part of.
+
+        Args:
+            path (str): Location of a file or directory that is part of a Git repository.
+
+        Returns:
+            str | None: commit hash, or None if it could not be determined (f.e. a repository without commits).
+        """
+        try:
+            return self._get_backend(self._get_repo(path)).head()
+        except Exception as err:
+            logger.debug(f"[git-revision-date-localized-plugin] Unable to determine HEAD commit for '{path}': {err}")
+            return None
+
+    def get_changed_paths(self, path: str, since: str, until: str = "HEAD") -> set[str] | None:
+        """
+        Determine which files were touched by the commits between two commits.
+
+        Uses the symmetric difference `since...until`, so that files touched by commits that
+        were amended or rebased away are also included.
+
+        Args:
+            path (str): Location of a file or directory that is part of a Git repository.
+            since (str): commit to compare with, f.e. the HEAD of a previous build
+            until (str): commit to compare to
+
+        Returns:
+            set[str] | None: paths relative to the repository root, or None if the commits could not be compared.
+        """
+        try:
+            output = self._get_repo(path).log(
+                f"{since}...{until}", m=True, name_only=True, no_renames=True, z=True, format=""
+            )
+        except (GitCommandError, GitCommandNotFound) as err:
+            logger.debug(f"[git-revision-date-localized-plugin] Unable to compare '{since}' with '{until}': {err}")
+            return None
+        return {changed_path.strip("\n") for changed_path in output.split("\0") if changed_path.strip("\n")}
 
     def get_date_formats_for_timestamp(
         self,
@@ -197,6 +447,9 @@ class Util:
         """
         Determine localized date variants for a given timestamp.
 
+        Many pages share a commit (and all pages share the site revision date),
+        so the results are cached per timestamp and locale.
+
         Args:
             commit_timestamp (int): most recent commit date in unix timestamp.
             locale (str, optional): Locale code of language to use. Defaults to 'en'.
@@ -205,16 +458,62 @@ class Util:
         Returns:
             dict: Localized date variants.
         """
-        date_formats = get_date_formats(
-            unix_timestamp=commit_timestamp,
-            time_zone=self.config.get("timezone") or "UTC",
-            locale=locale,
-            custom_format=self.config.get("custom_format") or "%d. %B %Y",
-        )
+        # Return a copy, so callers can not change the cached results
+        return dict(self.date_formats(int(commit_timestamp), locale, add_spans))
+
+    def _date_formats(self, commit_timestamp: int, locale: str, add_spans: bool) -> dict[str, str]:
         if add_spans:
-            date_formats = self.add_spans(date_formats)
+            # Derived from the (cached) raw date strings
+            return self.add_spans(dict(self.date_formats(commit_timestamp, locale, False)))
+        date_formats = self.precomputed_date_formats.get((commit_timestamp, locale))
+        if date_formats is not None:
+            return date_formats
+        return self.get_date_formatter(locale).format(commit_timestamp)
+
+    def prepare_date_formats(self, commit_timestamps: Iterable[int], locale: str) -> None:
+        """
+        Format many timestamps at once, so that `get_date_formats_for_timestamp()` only has to look them up.
 
-        return date_formats
+        Args:
+            commit_timestamps (Iterable[int]): commit dates in unix timestamp.
+            locale (str): Locale code of language to use.
+        """
+        for commit_timestamp, date_formats in self.get_date_formatter(locale).format_many(commit_timestamps).items():
+            self.precomputed_date_formats[(commit_timestamp, locale)] = date_formats
+
+    def get_date_formatter(self, locale: str) -> DateFormatter:
+        """
+        Get the date formatter of a locale, creating it on first use.
+
+        Args:
+            locale (str): Locale code of language to use.
+
+        Returns:
+            DateFormatter: formatter with the timezone and custom format of the plugin configuration
+        """
+        formatter = self.date_formatters.get(locale)
+        if formatter is None:
+            formatter = self.date_formatters[locale] = DateFormatter(
+                locale=locale,
+                time_zone=self.config.get("timezone") or "UTC",
+                custom_format=self.config.get("custom_format") or "%d. %B %Y",
+            )
+        return formatter
+
+    def prepare_date_formatters(self, locales: list[str]) -> None:
+        """
+        Create the date formatters of locales that are known up front.
+
+        Locales Babel does not know are skipped here, they raise an error when a page is formatted.
+
+        Args:
+            locales (list[str]): Locale codes
+        """
+        for locale in locales:
+            try:
+                self.get_date_formatter(locale)
+            except (UnknownLocaleError, ValueError) as err:
+                logger.debug(f"[git-revision-date-localized-plugin] Unable to prepare locale '{locale}': {err}")
 
     @staticmethod
     def add_spans(date_formats: dict[str, str]) -> dict[str, str]:
@@ -268,10 +567,10 @@ class Util:
             for path, git in self.repo_cache.items():
                 try:
                     # Check if there's a tag pointing to this commit
-                    tags = git.tag("--points-at", commit_hash, format="%(refname:short)")
+                    tags = self._get_backend(git).tags_at(commit_hash)
                     if tags:
                         # Return first tag if multiple tags exist for the commit
-                        return tags.split("\n")[0]
+                        return tags[0]
                 except GitCommandError:
                     # Continue checking other repositories in cache
                     continue
@@ -0,0 +1,61 @@
+from contextlib import contextmanager
+
+import pytest
+
+from mkdocs_git_revision_date_localized_plugin.accounting import count_git_calls
+from mkdocs_git_revision_date_localized_plugin.util import Util
+
+
+@pytest.fixture
+def git_call_budget():
+    """
+    Assert that the code in a `with` block starts at most a number of git processes.
+
+        def test_build(git_call_budget):
+            with git_call_budget(3, log=2) as calls:
+                build_docs_setup(testproject_path)
+
+    The first argument is the budget for all git processes, keyword arguments are budgets per
+    git subcommand (with underscores for dashes, f.e. `rev_list`).
+    """
+
+    @contextmanager
+    def budget(max_calls: int, **max_calls_per_subcommand: int):
+        with count_git_calls() as calls:
+            yield calls
+        assert calls.total <= max_calls, f"Expected at most {max_calls} git processes, got {calls.counts}"
+        for subcommand, max_subcommand_calls in max_calls_per_subcommand.items():
+            subcommand = subcommand.replace("_", "-")
+            assert calls.counts.get(subcommand, 0) <= max_subcommand_calls, (
+                f"Expected at most {max_subcommand_calls} 'git {subcommand}' processes, got {calls.counts}"
+            )
+
+    return budget
+
+
+@pytest.fixture
+def git_lookup_spy(monkeypatch):
+    """
+    Record the paths of which the git history is looked up, one file at a time.
+
+        def test_build(git_lookup_spy):
+            build_docs_setup(testproject_path)
+            assert git_lookup_spy == []
+
+    Returns the list of paths passed to `Util.get_git_commit_timestamp()` and `Util.get_git_commit_timestamps()`.
+    """
+    looked_up = []
+    get_git_commit_timestamp = Util.get_git_commit_timestamp
+    get_git_commit_timestamps = Util.get_git_commit_timestamps
+
+    def spy_get_git_commit_timestamp(self, path, is_first_commit=False):
+        looked_up.append(path)
+        return get_git_commit_timestamp(self, path, is_first_commit)
+
+    def spy_get_git_commit_timestamps(self, path):
+        looked_up.append(path)
+        return get_git_commit_timestamps(self, path)
+
+    monkeypatch.setattr(Util, "get_git_commit_timestamp", spy_get_git_commit_timestamp)
+    monkeypatch.setattr(Util, "get_git_commit_timestamps", spy_get_git_commit_timestamps)
+    return looked_up
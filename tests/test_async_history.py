@@ -0,0 +1,24 @@
+import asyncio
+
+import git
+import pytest
+
+from mkdocs_git_revision_date_localized_plugin import async_history
+from mkdocs_git_revision_date_localized_plugin.backends import GitCliBackend
+
+
+def test_stream_last_commit_error(tmp_path):
+    """
+    When a streamed git log fails, the error of git is raised.
+    """
+    repo = git.Repo.init(tmp_path)
+    (tmp_path / "page.md").write_text("page\n", encoding="utf-8")
+    repo.git.add("page.md")
+    repo.git.commit(message="add page", author="Test Person <testtest@gmail.com>")
+
+    backend = GitCliBackend(str(tmp_path), ignored_commits=["0" * 40])
+    result = async_history.run(async_history.stream_last_commit(backend, "page.md", asyncio.Semaphore(1)))
+    assert result[0] == repo.head.commit.hexsha
+
+    with pytest.raises(git.GitCommandError, match="outside repository"):
+        async_history.run(async_history.stream_last_commit(backend, "../outside.md", asyncio.Semaphore(1)))
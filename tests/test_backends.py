@@ -0,0 +1,128 @@
+import pytest
+from test_builds import setup_clean_mkdocs_folder, setup_commit_history
+
+from mkdocs_git_revision_date_localized_plugin import backends, history
+from mkdocs_git_revision_date_localized_plugin.backends import BACKENDS, Backend, GitCliBackend, ObjectStore
+from mkdocs_git_revision_date_localized_plugin.history import stop_process
+from mkdocs_git_revision_date_localized_plugin.util import Util
+
+
+def test_incomplete_backend(tmp_path):
+    """
+    A backend or object store that does not implement the whole interface fails when it is created.
+    """
+
+    class IncompleteBackend(Backend):
+        def head(self):
+            return None
+
+    class IncompleteStore(ObjectStore):
+        def resolve_head(self):
+            return None
+
+    with pytest.raises(TypeError, match="last_commit"):
+        IncompleteBackend(str(tmp_path))
+    with pytest.raises(TypeError, match="_read_commit"):
+        IncompleteStore(str(tmp_path))
+
+
+@pytest.mark.parametrize("git_backend", ["batch", "dulwich", "pygit2"])
+@pytest.mark.parametrize("enable_git_follow", [True, False])
+def test_git_backends(tmp_path, enable_git_follow, git_backend):
+    """
+    The backends that walk the history themselves should give the same results as the git log calls.
+    """
+    pytest.importorskip(BACKENDS[git_backend][1] or "git")
+
+    testproject_path = setup_clean_mkdocs_folder("tests/fixtures/basic_project/mkdocs.yml", tmp_path)
+    repo = setup_commit_history(testproject_path)
+
+    # Ignore the most recent change to page_with_tag.md, and tag a commit
+    commit_hash = repo.git.log("docs/page_with_tag.md", format="%H", n=1)
+    with open(str(testproject_path / "ignored-commits.txt"), "w", encoding="utf-8") as fp:
+        fp.write(commit_hash[:8])
+    repo.git.tag("v1.0", commit_hash, message="annotated tag")
+
+    config = {"enable_git_follow": enable_git_follow, "ignored_commits_file": "ignored-commits.txt"}
+    cli = Util(config=config, mkdocs_dir=str(testproject_path))
+    batch = Util(config={**config, "git_backend": git_backend}, mkdocs_dir=str(testproject_path))
+
+    paths = [str(path) for path in (testproject_path / "docs").rglob("*.md")]
+    paths.append(str(testproject_path / "docs"))
+    for path in paths:
+        if not repo.git.log(path, format="%H"):
+            continue
+        assert batch.get_git_commit_timestamp(path) == cli.get_git_commit_timestamp(path)
+        assert batch.get_git_commit_timestamp(path, is_first_commit=True) == cli.get_git_commit_timestamp(
+            path, is_first_commit=True
+        )
+
+    assert batch.get_git_commit_timestamp(str(testproject_path / "docs/page_with_tag.md"))[1] == 1525475836
+    renamed = str(testproject_path / "docs/subfolder/page_with_renamed.md")
+    assert batch.get_git_commit_timestamp(renamed, is_first_commit=True)[1] == (
+        1655229469 if enable_git_follow else 1655229515
+    )
+
+    assert batch.get_tag_name_for_commit(commit_hash) == "v1.0"
+    assert batch.get_tag_name_for_commit(repo.head.commit.hexsha) == ""
+    assert cli.get_tag_name_for_commit(commit_hash) == "v1.0"
+    assert cli.get_tag_name_for_commit(repo.head.commit.hexsha) == ""
+
+
+@pytest.mark.parametrize("git_backend", ["batch", "dulwich", "pygit2"])
+def test_git_backends_merge(tmp_path, git_backend):
+    """
+    Changes made on a merged branch should be found by following the right parent.
+    """
+    pytest.importorskip(BACKENDS[git_backend][1] or "git")
+    testproject_path = setup_clean_mkdocs_folder("tests/fixtures/basic_project/mkdocs.yml", tmp_path)
+    repo = setup_commit_history(testproject_path)
+    author = "Test Person <testtest@gmail.com>"
+
+    repo.git.checkout("-b", "feature")
+    with open(testproject_path / "docs/first_page.md", "a") as the_file:
+        the_file.write("feature\n")
+    repo.git.commit("-a", message="feature", author=author, date="1700000000")
+    repo.git.checkout("master")
+    with open(testproject_path / "docs/second_page.md", "a") as the_file:
+        the_file.write("master\n")
+    repo.git.commit("-a", message="master", author=author, date="1700000100")
+    repo.git.merge("feature", no_ff=True, message="merge")
+
+    cli = Util(config={}, mkdocs_dir=str(testproject_path))
+    backend = Util(config={"git_backend": git_backend}, mkdocs_dir=str(testproject_path))
+    for page in ["docs/first_page.md", "docs/second_page.md", "docs/index.md", "docs"]:
+        path = str(testproject_path / page)
+        assert backend.get_git_commit_timestamp(path) == cli.get_git_commit_timestamp(path)
+        assert backend.get_git_commit_timestamp(path, is_first_commit=True) == cli.get_git_commit_timestamp(
+            path, is_first_commit=True
+        )
+    assert backend.get_git_commit_timestamp(str(testproject_path / "docs/first_page.md"))[1] == 1700000000
+
+
+def test_stopped_git_log_is_reaped(tmp_path, monkeypatch):
+    """
+    A git log that is stopped once the commits are found should be killed and waited for.
+    """
+    testproject_path = setup_clean_mkdocs_folder("tests/fixtures/basic_project/mkdocs.yml", tmp_path)
+    repo = setup_commit_history(testproject_path)
+    commit_hashes = repo.git.log("docs/page_with_tag.md", format="%H").split()
+
+    stopped = []
+
+    def spy_stop_process(process):
+        stopped.append(process)
+        stop_process(process)
+
+    monkeypatch.setattr(backends, "stop_process", spy_stop_process)
+    monkeypatch.setattr(history, "stop_process", spy_stop_process)
+
+    # The most recent commit is ignored, so the history is streamed until the one before it
+    backend = GitCliBackend(str(testproject_path), ignored_commits=[commit_hashes[0][:10]])
+    assert backend.last_commit("docs/page_with_tag.md")[0] == commit_hashes[1]
+    history.build_history_index(repo.git, ["docs/page_with_tag.md"], first_commit=False)
+
+    assert len(stopped) == 2
+    for process in stopped:
+        assert process.proc.returncode is not None
+        assert process.proc.stdout.closed
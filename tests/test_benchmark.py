@@ -0,0 +1,43 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+BENCHMARK = Path(__file__).parent.parent / "benchmarks" / "benchmark.py"
+
+
+def test_benchmark(tmp_path):
+    """
+    The benchmark should run on a tiny synthetic repository and write its results as JSON.
+    """
+    output = tmp_path / "results.json"
+    subprocess.run(
+        [sys.executable, str(BENCHMARK), "--files", "5", "--commits", "12", "--tags", "2", "--ignored", "4"]
+        + ["--repeat", "1", "--only", "single_pass", "--only", "per_file-cli-*", "--output", str(output)],
+        check=True,
+    )
+    report = json.loads(output.read_text(encoding="utf-8"))
+    assert report["repository"]["files"] == 5
+    assert [result["name"] for result in report["results"]] == [
+        "per_file-cli-serial",
+        "per_file-cli-parallel",
+        "single_pass",
+    ]
+    for result in report["results"]:
+        assert result["median"]["build"] > 0
+        assert result["runs"][0]["calls"]["on_page_markdown"] == 5
+
+
+def test_importtime(tmp_path):
+    """
+    A build with 'enabled: false' should not load GitPython, packaging or the date formatting of the plugin.
+    """
+    output = tmp_path / "importtime.json"
+    subprocess.run(
+        [sys.executable, str(BENCHMARK.parent / "importtime.py"), "--repeat", "1", "--output", str(output)],
+        check=True,
+    )
+    report = json.loads(output.read_text(encoding="utf-8"))
+    assert report["disabled_build_loaded"] == []
+    assert report["median_ms"] > 0
+    assert "git" not in {module["module"] for module in report["slowest_imports"]}
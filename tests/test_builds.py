@@ -11,6 +11,7 @@ You can reproduce locally with:
 """
 
 # standard lib
+import json
 import logging
 import os
 import re
@@ -27,11 +28,18 @@ from click.testing import CliRunner
 # MkDocs
 from mkdocs.__main__ import build_command
 from mkdocs.config import load_config
+from mkdocs.structure.files import get_files
+from mkdocs.structure.pages import Page
 
+from mkdocs_git_revision_date_localized_plugin.accounting import count_git_calls
 from mkdocs_git_revision_date_localized_plugin.ci import commit_count
-from mkdocs_git_revision_date_localized_plugin.dates import get_date_formats
+from mkdocs_git_revision_date_localized_plugin.dates import DateFormatter, get_date_formats
+from mkdocs_git_revision_date_localized_plugin.manifest import RevisionManifest
 
 # package module
+from mkdocs_git_revision_date_localized_plugin.plugin import GitRevisionDateLocalizedPlugin
+from mkdocs_git_revision_date_localized_plugin.shard import main as shard_main
+from mkdocs_git_revision_date_localized_plugin.shard import merge_shards, select_files, shard_of
 from mkdocs_git_revision_date_localized_plugin.util import Util
 
 # ##################################
@@ -133,6 +141,29 @@ def setup_clean_mkdocs_folder(mkdocs_yml_path, output_path):
     return testproject_path
 
 
+def setup_plugin_options(testproject_path, **options):
+    """
+    Sets options of the plugin in the mkdocs.yml file of a test project.
+
+    Args:
+        testproject_path (Path): Path to test project
+        **options: plugin options, f.e. `enable_cache=True`
+    """
+    mkdocs_yml = testproject_path / "mkdocs.yml"
+    contents = mkdocs_yml.read_text(encoding="utf8")
+    # The options are inserted right below the name of the plugin, as JSON values are valid YAML
+    match = re.search(r"^( *)- git-revision-date-localized:?[ \t]*$", contents, flags=re.M)
+    assert match, f"The plugin is not configured in {mkdocs_yml}"
+    indent = match.group(1) + "    "
+    lines = [f"{indent}{name}: {json.dumps(value)}" for name, value in options.items()]
+    contents = (
+        contents[: match.start()]
+        + "\n".join([f"{match.group(1)}- git-revision-date-localized:", *lines])
+        + contents[match.end() :]
+    )
+    mkdocs_yml.write_text(contents, encoding="utf8")
+
+
 def setup_commit_history(testproject_path):
     """
     Initializes and creates a git commit history
@@ -331,6 +362,7 @@ def validate_mkdocs_file(temp_path: str, mkdocs_yml_file: str):
 
 
 MKDOCS_FILES = [
+    "basic_project/mkdocs_cache.yml",
     "basic_project/mkdocs_creation_date.yml",
     "basic_project/mkdocs_custom_type.yml",
     "basic_project/mkdocs_datetime.yml",
@@ -340,6 +372,10 @@ MKDOCS_FILES = [
     "basic_project/mkdocs_meta.yml",
     "basic_project/mkdocs_no_parallel.yml",
     "basic_project/mkdocs_plugin_locale.yml",
+    "basic_project/mkdocs_single_pass.yml",
+    "basic_project/mkdocs_asyncio.yml",
+    "basic_project/mkdocs_batch_backend.yml",
+    "basic_project/mkdocs_dulwich_backend.yml",
     "basic_project/mkdocs.yml",
     "basic_project/mkdocs_theme_timeago_locale.yml",
     "basic_project/mkdocs_theme_language.yml",
@@ -360,6 +396,7 @@ MKDOCS_FILES = [
 
 INVALID_MKDOCS_FILES = [
     ("basic_project/mkdocs_unknown_type.yml", "AssertionError"),
+    ("basic_project/mkdocs_asyncio_dulwich.yml", "can not be combined with 'git_backend: dulwich'"),
     ("i18n/mkdocs_wrong_order.yml", "should be defined after the i18n plugin in your mkdocs.yml"),
 ]
 
@@ -728,3 +765,450 @@ def test_genfiles_plugin(tmp_path):
     page_with_tag = testproject_path / "site/foo/index.html"
     contents = page_with_tag.read_text(encoding="utf8")
     assert "Bar, world!" in contents
+
+
+def test_lazy_tags(tmp_path, monkeypatch):
+    """
+    With 'lazy_tags', tags should only be looked up when a template uses them.
+    """
+    testproject_path = setup_clean_mkdocs_folder("tests/fixtures/basic_project/mkdocs_with_override.yml", tmp_path)
+    setup_plugin_options(testproject_path, lazy_tags=True)
+    repo = setup_commit_history(testproject_path)
+    repo.git.tag("v1.0")
+
+    looked_up = []
+    monkeypatch.setattr(Util, "get_tag_name_for_commit", lambda self, commit_hash: looked_up.append(commit_hash))
+
+    result = build_docs_setup(testproject_path)
+    assert result.exit_code == 0
+    assert looked_up == []
+
+    # A template of the theme refers to a tag variable
+    monkeypatch.undo()
+    with open(testproject_path / "docs/overrides_mkdocs_theme/content.html", "a") as f:
+        f.write("<small>Site tag: {{ page.meta.git_site_revision_date_localized_tag }}</small>\n")
+
+    result = build_docs_setup(testproject_path)
+    assert result.exit_code == 0
+    contents = (testproject_path / "site/index.html").read_text(encoding="utf8")
+    assert "Site tag: v1.0" in contents
+
+
+@pytest.mark.parametrize("manifest_file", ["manifest.json", "manifest.json.gz"])
+def test_manifest(tmp_path, manifest_file):
+    """
+    A build from an exported manifest should give the same dates and tags, without git.
+    """
+    testproject_path = setup_clean_mkdocs_folder("tests/fixtures/basic_project/mkdocs_with_override.yml", tmp_path)
+    setup_plugin_options(testproject_path, enable_creation_date=True, export_manifest=manifest_file)
+    repo = setup_commit_history(testproject_path)
+    repo.git.tag("v1.0", repo.git.log("docs", format="%H", n=1))
+    with open(testproject_path / "docs/overrides_mkdocs_theme/content.html", "a") as f:
+        f.write("<small>Site tag: {{ page.meta.git_site_revision_date_localized_tag }}</small>\n")
+
+    result = build_docs_setup(testproject_path)
+    assert result.exit_code == 0
+    manifest = RevisionManifest.load(testproject_path / manifest_file)
+    assert manifest.get("page_with_tag.md")[1] == 1642911026
+    assert manifest.get("page_with_tag.md", is_first_commit=True)[1] == 1500854705
+    # Pages without git history are left out, instead of exporting the build date
+    assert manifest.get("subpage.md") is None
+    assert list(manifest.tags.values()) == ["v1.0"]
+
+    # A copy of the project without git history
+    offline_path = tmp_path / "offline"
+    shutil.copytree(testproject_path, offline_path, ignore=shutil.ignore_patterns(".git", "site"))
+    shutil.copyfile("tests/fixtures/basic_project/mkdocs_with_override.yml", offline_path / "mkdocs.yml")
+    setup_plugin_options(
+        offline_path, enable_creation_date=True, import_manifest=manifest_file, fallback_to_build_date=True
+    )
+    result = build_docs_setup(offline_path)
+    assert result.exit_code == 0
+    for page in ("index.html", "page_with_tag/index.html", "subfolder/page_with_renamed/index.html"):
+        # Leave out the comment with the build date of mkdocs
+        contents = re.sub(r"<!--.*?-->", "", (offline_path / "site" / page).read_text(encoding="utf8"), flags=re.S)
+        expected = re.sub(r"<!--.*?-->", "", (testproject_path / "site" / page).read_text(encoding="utf8"), flags=re.S)
+        assert contents == expected
+    assert "Site tag: v1.0" in (offline_path / "site/index.html").read_text(encoding="utf8")
+
+
+def test_performance_report(tmp_path):
+    """
+    The performance report should cover the hooks, the git processes and the lookups of the build.
+    """
+    testproject_path = setup_clean_mkdocs_folder("tests/fixtures/basic_project/mkdocs.yml", tmp_path)
+    setup_plugin_options(testproject_path, enable_creation_date=True, performance_report="report.json")
+    setup_commit_history(testproject_path)
+
+    result = build_docs_setup(testproject_path)
+    assert result.exit_code == 0
+    report = json.loads((testproject_path / "report.json").read_text(encoding="utf8"))
+
+    n_pages = len(list((testproject_path / "docs").rglob("*.md")))
+    assert report["phases"]["on_page_markdown"]["calls"] == n_pages
+    for phase in ("on_config", "on_config/site_revision", "on_files", "on_files/per_file", "on_files/date_formats"):
+        assert report["phases"][phase]["calls"] == 1
+    # One git log per page, and one for the site revision date
+    assert report["git_processes"]["log"]["calls"] == n_pages + 1
+    assert report["lookups"]["last_revision_commits"] == {"hits": n_pages, "cache_hits": 0, "misses": 1}
+    assert report["lookups"]["created_commits"] == {"hits": n_pages, "cache_hits": 0, "misses": 0}
+    assert len(report["slowest_queries"]) == n_pages + 1
+    assert any(query["path"].endswith("page_with_tag.md") for query in report["slowest_queries"])
+
+
+@pytest.mark.parametrize("history_engine", ["single_pass", "asyncio"])
+def test_performance_report_engines(tmp_path, history_engine):
+    """
+    The slowest git queries should also be reported for the engines that look up all pages at once.
+    """
+    testproject_path = setup_clean_mkdocs_folder("tests/fixtures/basic_project/mkdocs.yml", tmp_path)
+    setup_plugin_options(testproject_path, history_engine=history_engine, performance_report="report.json")
+    setup_commit_history(testproject_path)
+
+    result = build_docs_setup(testproject_path)
+    assert result.exit_code == 0
+    report = json.loads((testproject_path / "report.json").read_text(encoding="utf8"))
+    paths = [query["path"] for query in report["slowest_queries"]]
+    if history_engine == "single_pass":
+        # The history of the docs folder is read for the site revision date, and once for all pages
+        assert paths.count(str(testproject_path / "docs")) == 2
+    else:
+        assert str(testproject_path / "docs/page_with_tag.md") in paths
+    assert all(query["seconds"] > 0 for query in report["slowest_queries"])
+
+
+def test_trace_file(tmp_path):
+    """
+    The trace should have an event for every hook, page and git query, on the thread that ran it.
+    """
+    testproject_path = setup_clean_mkdocs_folder("tests/fixtures/basic_project/mkdocs.yml", tmp_path)
+    setup_plugin_options(testproject_path, trace_file="trace.json")
+    setup_commit_history(testproject_path)
+
+    result = build_docs_setup(testproject_path)
+    assert result.exit_code == 0
+    trace = json.loads((testproject_path / "trace.json").read_text(encoding="utf8"))
+    events = [event for event in trace["traceEvents"] if event["ph"] == "X"]
+    thread_names = {event["tid"]: event["args"]["name"] for event in trace["traceEvents"] if event["ph"] == "M"}
+
+    pages = {
+        Path(path).relative_to(testproject_path / "docs").as_posix()
+        for path in (testproject_path / "docs").rglob("*.md")
+    }
+    page_events = [event for event in events if event["name"] == "on_page_markdown"]
+    assert {Path(event["args"]["page"]).as_posix() for event in page_events} == pages
+
+    queries = [event for event in events if event["name"] == "git query" and "queued_ms" in event["args"]]
+    assert len(queries) == len(pages)
+    assert all(thread_names[event["tid"]].startswith("git-revision-date") for event in queries)
+
+    (on_files,) = [event for event in events if event["name"] == "on_files"]
+    for event in queries:
+        assert on_files["ts"] <= event["ts"] and event["ts"] + event["dur"] <= on_files["ts"] + on_files["dur"]
+
+
+def test_date_formats_prepared(tmp_path, monkeypatch):
+    """
+    The dates of all pages should be formatted in on_files(), so that pages only look them up.
+    """
+    testproject_path = setup_clean_mkdocs_folder("tests/fixtures/basic_project/mkdocs_creation_date.yml", tmp_path)
+    setup_commit_history(testproject_path)
+
+    config = load_config(str(testproject_path / "mkdocs.yml"))
+    plugin = config["plugins"]["git-revision-date-localized"]
+    plugin.on_startup(command="build", dirty=False)
+    config = plugin.on_config(config)
+    files = get_files(config)
+    plugin.on_files(files, config)
+
+    _, last_timestamp = plugin.last_revision_commits[str(testproject_path / "docs/page_with_tag.md")]
+    assert (last_timestamp, "en") in plugin.util.precomputed_date_formats
+    assert (plugin.last_site_revision_timestamp, "en") in plugin.util.precomputed_date_formats
+
+    def format_one_by_one(self, unix_timestamp):
+        raise AssertionError("date formats should have been prepared")
+
+    monkeypatch.setattr(DateFormatter, "format", format_one_by_one)
+    page = Page(None, files.get_file_from_path("page_with_tag.md"), config)
+    page.meta = {}
+    markdown = plugin.on_page_markdown("{{ git_revision_date_localized }}", page=page, config=config, files=files)
+    assert "January 23, 2022" in markdown
+
+
+def test_replace_placeholders():
+    """
+    All placeholders should be replaced in a single scan, leaving unknown ones as-is.
+    """
+    markdown = (
+        "{{ git_revision_date_localized }}, {{Git_Site_Revision_Date_Localized}} and {{ git_creation_date_localized }}"
+    )
+    replacements = {"git_revision_date_localized": "a", "git_site_revision_date_localized": "b"}
+    assert (
+        GitRevisionDateLocalizedPlugin.replace_placeholders(markdown, replacements)
+        == "a, b and {{ git_creation_date_localized }}"
+    )
+    assert GitRevisionDateLocalizedPlugin.replace_placeholders("no placeholders", replacements) == "no placeholders"
+
+
+def test_lazy_meta(tmp_path, monkeypatch):
+    """
+    With 'lazy_meta', variables the theme does not use should never be computed.
+    """
+    testproject_path = setup_clean_mkdocs_folder("tests/fixtures/basic_project/mkdocs_with_override.yml", tmp_path)
+    setup_plugin_options(testproject_path, lazy_meta=True)
+    setup_commit_history(testproject_path)
+
+    looked_up = []
+    monkeypatch.setattr(Util, "get_tag_name_for_commit", lambda self, commit_hash: looked_up.append(commit_hash))
+
+    result = build_docs_setup(testproject_path)
+    assert result.exit_code == 0
+    assert looked_up == []
+    contents = (testproject_path / "site/page_with_tag/index.html").read_text(encoding="utf8")
+    assert re.search(r"Last update\:\s<span class.+", contents)
+
+
+def test_persistent_cache(tmp_path, monkeypatch, git_lookup_spy):
+    """
+    A second build should not query git for pages that did not change.
+    """
+    testproject_path = setup_clean_mkdocs_folder("tests/fixtures/basic_project/mkdocs_cache.yml", tmp_path)
+    repo = setup_commit_history(testproject_path)
+
+    result = build_docs_setup(testproject_path)
+    assert result.exit_code == 0
+    assert (testproject_path / ".cache/git-revision-date-localized/revisions.json").exists()
+
+    # Nothing changed, so git log should not be needed at all
+    git_lookup_spy.clear()
+    monkeypatch.setattr(Util, "get_git_history_index", lambda *args, **kwargs: {})
+
+    def queried_paths():
+        return {Path(path).relative_to(testproject_path).as_posix() for path in git_lookup_spy}
+
+    # Pages without git history are never cached
+    untracked_paths = {"docs/subpage.md", "docs/subfolder/page_in_subfolder.md"}
+
+    result = build_docs_setup(testproject_path)
+    assert result.exit_code == 0
+    assert queried_paths() == untracked_paths
+    git_lookup_spy.clear()
+
+    # Only the changed page (and the site revision date of the docs folder) should be recomputed
+    with working_directory(testproject_path):
+        with open("docs/page_with_tag.md", "a") as the_file:
+            the_file.write("cached\n")
+        repo.git.add("docs/page_with_tag.md")
+        repo.git.commit(message="update homepage #3", author="Test Person <testtest@gmail.com>", date="1700000000")
+
+    result = build_docs_setup(testproject_path)
+    assert result.exit_code == 0
+    assert queried_paths() == untracked_paths | {"docs", "docs/page_with_tag.md"}
+
+    contents = (testproject_path / "site/page_with_tag/index.html").read_text(encoding="utf8")
+    assert "November 14, 2023" in contents
+
+
+def test_sharded_history(tmp_path, capsys, git_lookup_spy):
+    """
+    Shards computed separately and merged should give the same cache as a full build.
+    """
+    testproject_path = setup_clean_mkdocs_folder("tests/fixtures/basic_project/mkdocs_cache.yml", tmp_path)
+    setup_commit_history(testproject_path)
+    cache_dir = testproject_path / ".cache/git-revision-date-localized"
+
+    files = get_files(load_config(str(testproject_path / "mkdocs.yml")))
+    src_uris = {Path(f.src_path).as_posix() for f in files}
+    shards = [{f for f in src_uris if shard_of(f, 3) == number} for number in (1, 2, 3)]
+    assert set().union(*shards) == src_uris
+    assert {Path(f.src_path).as_posix() for f in select_files(files, shard=(2, 3))} == shards[1]
+    assert {Path(f.src_path).as_posix() for f in select_files(files, globs=["subfolder/*"])} == {
+        f for f in src_uris if f.startswith("subfolder/")
+    }
+    assert [f.src_path for f in select_files(files, file_list={"index.md"})] == ["index.md"]
+
+    with working_directory(testproject_path):
+        for number in (1, 2, 3):
+            with count_git_calls() as calls:
+                shard_main(["compute", "--shard", f"{number}/3"])
+            # The history of the docs_dir (for the site revision date) is looked up once, plus one per page
+            assert calls.counts["log"] <= 1 + len(shards[number - 1])
+        shard_main(["merge", *(str(cache_dir / f"revisions-{number}-of-3.json") for number in (1, 2, 3))])
+    sharded = json.loads((cache_dir / "revisions.json").read_text(encoding="utf-8"))
+    (repository,) = sharded["repositories"].values()
+    assert len(repository["files"]) > 1
+
+    # A build on the merged cache should only query git for pages without git history (these are never cached)
+    git_lookup_spy.clear()
+    result = build_docs_setup(testproject_path)
+    assert result.exit_code == 0
+    assert {Path(path).relative_to(testproject_path).as_posix() for path in git_lookup_spy} == {
+        "docs/subpage.md",
+        "docs/subfolder/page_in_subfolder.md",
+    }
+
+    # The merged cache is the same as the cache of a full build
+    (cache_dir / "revisions.json").unlink()
+    result = build_docs_setup(testproject_path)
+    assert result.exit_code == 0
+    assert json.loads((cache_dir / "revisions.json").read_text(encoding="utf-8")) == sharded
+
+    # Shards of different commits can not be merged
+    other = json.loads((cache_dir / "revisions-1-of-3.json").read_text(encoding="utf-8"))
+    for repository in other["repositories"].values():
+        repository["head"] = "0" * 40
+    (cache_dir / "other.json").write_text(json.dumps(other), encoding="utf-8")
+    with pytest.raises(ValueError, match="another commit"):
+        merge_shards([cache_dir / "revisions-2-of-3.json", cache_dir / "other.json"], cache_dir / "merged.json")
+
+    # The plugin has to be enabled to compute a shard
+    setup_plugin_options(testproject_path, enabled=False)
+    with working_directory(testproject_path), pytest.raises(SystemExit) as exit_info:
+        shard_main(["compute", "--shard", "1/3"])
+    assert exit_info.value.code == 1
+    assert "enabled: false" in capsys.readouterr().err
+
+
+def test_serve_rebuild_invalidation(tmp_path):
+    """
+    During mkdocs serve, rebuilds should reuse the dates, and a commit should invalidate only the pages it touched.
+    """
+    testproject_path = setup_clean_mkdocs_folder("tests/fixtures/basic_project/mkdocs_creation_date.yml", tmp_path)
+    repo = setup_commit_history(testproject_path)
+
+    def build():
+        # Mimic the events of a (re)build during mkdocs serve, which keeps the plugin object
+        config = load_config(str(testproject_path / "mkdocs.yml"))
+        config["plugins"]["git-revision-date-localized"] = plugin
+        with count_git_calls() as calls:
+            plugin.on_config(config)
+            plugin.on_files(get_files(config), config)
+        return calls
+
+    # mkdocs calls on_startup once per process, before the first build
+    plugin = load_config(str(testproject_path / "mkdocs.yml"))["plugins"]["git-revision-date-localized"]
+    plugin.on_startup(command="serve", dirty=False)
+    first_build = build()
+    page_with_tag = str(testproject_path / "docs/page_with_tag.md")
+    first_page = str(testproject_path / "docs/first_page.md")
+    assert plugin.last_revision_commits[page_with_tag][1] == 1642911026
+    n_files = len(plugin.last_revision_commits)
+
+    # Rebuilds without new commits only look up the site revision date
+    for _ in range(2):
+        calls = build()
+        assert calls.counts == {"log": 1}
+        assert calls.total < first_build.total
+        assert len(plugin.last_revision_commits) == n_files
+
+    # Saving a file without committing keeps all results
+    with open(page_with_tag, "a") as the_file:
+        the_file.write("edit\n")
+    assert build().counts == {"log": 1}
+    assert len(plugin.last_revision_commits) == n_files
+
+    # Committing drops only the results of the committed file
+    with working_directory(testproject_path):
+        repo.git.add("docs/page_with_tag.md")
+        repo.git.commit(message="update homepage #3", author="Test Person <testtest@gmail.com>", date="1700000000")
+    calls = build()
+    # The site revision date, and the paths changed by the new commit
+    assert calls.counts == {"log": 2}
+    assert page_with_tag not in plugin.last_revision_commits
+    assert page_with_tag not in plugin.created_commits
+    assert first_page in plugin.last_revision_commits
+    assert len(plugin.last_revision_commits) == n_files - 1
+    assert plugin.get_git_commit_timestamp(page_with_tag) == (repo.head.commit.hexsha, 1700000000)
+
+    # Amending the commit is detected as well, even though the contents of the file did not change
+    with working_directory(testproject_path):
+        repo.git.commit(amend=True, no_edit=True, date="1700000001")
+    build()
+    assert page_with_tag not in plugin.last_revision_commits
+    assert plugin.get_git_commit_timestamp(page_with_tag) == (repo.head.commit.hexsha, 1700000001)
+
+    # Changing an option that affects the dates recomputes all of them
+    setup_plugin_options(testproject_path, enable_git_follow=False)
+    calls = build()
+    assert plugin.config["enable_git_follow"] is False
+    assert calls.counts["log"] > 2
+    assert plugin.last_revision_commits[page_with_tag][1] == 1700000001
+
+
+def test_thread_pool_reused(tmp_path):
+    """
+    The thread pool should be shared by consecutive builds during mkdocs serve.
+    """
+    testproject_path = setup_clean_mkdocs_folder("tests/fixtures/basic_project/mkdocs_creation_date.yml", tmp_path)
+    setup_commit_history(testproject_path)
+    setup_plugin_options(testproject_path, max_workers=2)
+
+    plugin = load_config(str(testproject_path / "mkdocs.yml"))["plugins"]["git-revision-date-localized"]
+    executors = []
+    plugin.on_startup(command="serve", dirty=False)
+    for _ in range(2):
+        config = load_config(str(testproject_path / "mkdocs.yml"))
+        config["plugins"]["git-revision-date-localized"] = plugin
+        plugin.on_config(config)
+        plugin.on_files(get_files(config), config)
+        executors.append(plugin.executor)
+
+    assert executors[0] is executors[1]
+    assert executors[0]._max_workers == 2
+    assert plugin.created_commits[str(testproject_path / "docs/page_with_tag.md")][1] == 1500854705
+
+    plugin.on_shutdown()
+    assert plugin.executor is None
+
+
+@pytest.fixture(scope="module")
+def large_shallow_project(tmp_path_factory):
+    """
+    A shallow clone of a repository with 500 pages in 10 directories and a tag.
+    """
+    tmp_path = tmp_path_factory.mktemp("large_project")
+    origin_path = tmp_path / "origin"
+    for i in range(500):
+        page = origin_path / f"docs/section_{i % 10}/page_{i}.md"
+        page.parent.mkdir(parents=True, exist_ok=True)
+        page.write_text(f"# Page {i}\n", encoding="utf8")
+    (origin_path / "docs/index.md").write_text("# Home\n", encoding="utf8")
+
+    repo = git.Repo.init(origin_path, bare=False)
+    repo.git.checkout("-b", "master")
+    repo.git.add(".")
+    repo.git.commit(message="add pages", date="1500854705")
+    for page in list((origin_path / "docs").rglob("*.md"))[::2]:
+        page.write_text(page.read_text(encoding="utf8") + "Edited\n", encoding="utf8")
+    repo.git.add(".")
+    repo.git.commit(message="edit pages", date="1643911026")
+    repo.git.tag("v1.0")
+
+    testproject_path = tmp_path / "testproject"
+    git.Repo.clone_from(origin_path.as_uri(), testproject_path, depth=1)
+    return testproject_path
+
+
+@pytest.mark.parametrize("history_engine", ["per_file", "single_pass", "asyncio"])
+def test_git_call_budget(large_shallow_project, git_call_budget, history_engine):
+    """
+    A build should start a fixed number of git processes per repository, plus one per page for the per_file engines.
+
+    The repository is a shallow clone, so that the CI warnings are checked with 'git rev-list'.
+    """
+    (large_shallow_project / "mkdocs.yml").write_text(
+        "site_name: test gitrevisiondatelocalized_plugin\n"
+        "plugins:\n"
+        "    - git-revision-date-localized:\n"
+        "        enable_creation_date: true\n"
+        f"        history_engine: {history_engine}\n",
+        encoding="utf8",
+    )
+    n_pages = len(list((large_shallow_project / "docs").rglob("*.md")))
+    n_repos = 1
+    # The site revision date, then per repository: the CI warnings, the tags and the single pass over the history
+    budget = 1 + 3 * n_repos if history_engine == "single_pass" else 1 + n_pages + 2 * n_repos
+
+    with git_call_budget(budget, rev_list=n_repos, for_each_ref=n_repos, cat_file=0):
+        result = build_docs_setup(large_shallow_project)
+    assert result.exit_code == 0
@@ -0,0 +1,58 @@
+import pytest
+
+from mkdocs_git_revision_date_localized_plugin.commits import CommitStore, PathIds
+
+SHA1 = "7fca064e1a2b3c4d5e6f708192a3b4c5d6e7f809"
+SHA256 = "0123456789abcdef" * 4
+
+
+def test_commit_store():
+    path_ids = PathIds()
+    last_commits = CommitStore(path_ids)
+    first_commits = CommitStore(path_ids)
+
+    # Same lookups as a dictionary of path -> (hash, timestamp)
+    last_commits["/docs/a.md"] = (SHA1, 1642911026)
+    last_commits["/docs/b.md"] = (SHA256, 1500854705)
+    last_commits["/docs/c.md"] = ("", 1700000000)
+    first_commits["/docs/a.md"] = (SHA1, 1500854705)
+    assert last_commits["/docs/a.md"] == (SHA1, 1642911026)
+    assert last_commits["/docs/b.md"] == (SHA256, 1500854705)
+    assert last_commits.get("/docs/c.md") == ("", 1700000000)
+    assert first_commits.get("/docs/b.md") is None
+    assert first_commits.get("/docs/b.md", (None, None)) == (None, None)
+    assert "/docs/b.md" in last_commits and "/docs/b.md" not in first_commits
+    assert len(last_commits) == 3 and len(first_commits) == 1
+    with pytest.raises(KeyError):
+        first_commits["/docs/missing.md"]
+
+    # Overwrite a commit with another kind of hash
+    last_commits["/docs/b.md"] = (SHA1, 1600000000)
+    assert last_commits["/docs/b.md"] == (SHA1, 1600000000)
+    assert len(last_commits) == 3
+
+    # Aliases find the commits of the path they refer to, also ones stored later
+    path_ids.alias("/tmp/docs/a.md", "/docs/a.md")
+    path_ids.alias("/tmp/docs/d.md", "/docs/d.md")
+    last_commits["/docs/d.md"] = (SHA1, 1)
+    assert last_commits["/tmp/docs/a.md"] == (SHA1, 1642911026)
+    assert first_commits["/tmp/docs/a.md"] == (SHA1, 1500854705)
+    assert last_commits["/tmp/docs/d.md"] == (SHA1, 1)
+    assert len(last_commits) == 4
+
+    # Removing a commit removes it for its aliases
+    assert last_commits.pop("/tmp/docs/a.md") == (SHA1, 1642911026)
+    assert "/docs/a.md" not in last_commits
+    assert last_commits.pop("/docs/a.md", None) is None
+    assert first_commits["/docs/a.md"] == (SHA1, 1500854705)
+    assert len(last_commits) == 3
+
+
+def test_commit_store_grows():
+    commits = CommitStore(PathIds())
+    for i in range(1000):
+        commits[f"/docs/page_{i}.md"] = (f"{i:040x}", i)
+    assert len(commits) == 1000
+    assert all(commits[f"/docs/page_{i}.md"] == (f"{i:040x}", i) for i in range(1000))
+    assert len(commits.hashes) == 20 * len(commits.timestamps)
+    assert commits.other_hashes == {}
@@ -4,7 +4,7 @@ import pytest
 from babel.core import UnknownLocaleError
 from babel.dates import get_timezone
 
-from mkdocs_git_revision_date_localized_plugin.dates import get_date_formats
+from mkdocs_git_revision_date_localized_plugin.dates import DateFormatter, get_date_formats
 
 
 def test_get_dates():
@@ -108,3 +108,73 @@ def test_get_dates():
         "timeago": '<span class="timeago" datetime="2020-02-22T18:52:09+00:00" locale="en"></span>',
         "custom": "22. February 2020",
     }
+
+
+def test_date_formatter_reuse():
+    # A formatter parses the locale and patterns once, and can be reused for many timestamps
+    formatter = DateFormatter(locale="pt-BR", time_zone="Europe/Amsterdam", custom_format="%A %-d %B %Y %H:%M")
+    assert formatter.format(0) == {
+        "date": "1 de janeiro de 1970",
+        "datetime": "1 de janeiro de 1970 01:00:00",
+        "datetime-timezone": "1 de janeiro de 1970 01:00:00 CET",
+        "iso_date": "1970-01-01",
+        "iso_datetime": "1970-01-01 01:00:00",
+        "timeago": '<span class="timeago" datetime="1970-01-01T01:00:00+01:00" locale="pt_BR"></span>',
+        "custom": "quinta-feira 1 janeiro 1970 01:00",
+    }
+    assert formatter.format(1582397529) == {
+        "date": "22 de fevereiro de 2020",
+        "datetime": "22 de fevereiro de 2020 19:52:09",
+        "datetime-timezone": "22 de fevereiro de 2020 19:52:09 CET",
+        "iso_date": "2020-02-22",
+        "iso_datetime": "2020-02-22 19:52:09",
+        "timeago": '<span class="timeago" datetime="2020-02-22T19:52:09+01:00" locale="pt_BR"></span>',
+        "custom": "sábado 22 fevereiro 2020 19:52",
+    }
+    assert formatter.format(1697369524) == {
+        "date": "15 de outubro de 2023",
+        "datetime": "15 de outubro de 2023 13:32:04",
+        "datetime-timezone": "15 de outubro de 2023 13:32:04 CEST",
+        "iso_date": "2023-10-15",
+        "iso_datetime": "2023-10-15 13:32:04",
+        "timeago": '<span class="timeago" datetime="2023-10-15T13:32:04+02:00" locale="pt_BR"></span>',
+        "custom": "domingo 15 outubro 2023 13:32",
+    }
+
+    with pytest.raises(UnknownLocaleError):
+        DateFormatter(locale="abcd")
+
+
+def test_date_formatter_format_many():
+    # Duplicates are formatted once, timestamps on the same day share their date
+    formatter = DateFormatter(locale="fr", time_zone="Europe/Amsterdam")
+    formats = formatter.format_many([0, 1582397529, 1582397529.5, 1582387529, 1697369524, 1697369524])
+    assert set(formats) == {0, 1582397529, 1582387529, 1697369524}
+    assert formats[0] == {
+        "date": "1 janvier 1970",
+        "datetime": "1 janvier 1970 01:00:00",
+        "datetime-timezone": "1 janvier 1970 01:00:00 CET",
+        "iso_date": "1970-01-01",
+        "iso_datetime": "1970-01-01 01:00:00",
+        "timeago": '<span class="timeago" datetime="1970-01-01T01:00:00+01:00" locale="fr"></span>',
+        "custom": "01. janvier 1970",
+    }
+    assert formats[1582397529] == {
+        "date": "22 février 2020",
+        "datetime": "22 février 2020 19:52:09",
+        "datetime-timezone": "22 février 2020 19:52:09 CET",
+        "iso_date": "2020-02-22",
+        "iso_datetime": "2020-02-22 19:52:09",
+        "timeago": '<span class="timeago" datetime="2020-02-22T19:52:09+01:00" locale="fr"></span>',
+        "custom": "22. février 2020",
+    }
+    assert formats[1582387529] == {
+        "date": "22 février 2020",
+        "datetime": "22 février 2020 17:05:29",
+        "datetime-timezone": "22 février 2020 17:05:29 CET",
+        "iso_date": "2020-02-22",
+        "iso_datetime": "2020-02-22 17:05:29",
+        "timeago": '<span class="timeago" datetime="2020-02-22T17:05:29+01:00" locale="fr"></span>',
+        "custom": "22. février 2020",
+    }
+    assert formats[1697369524]["datetime-timezone"] == "15 octobre 2023 13:32:04 CEST"
@@ -1,6 +1,8 @@
+import fnmatch
+
 import pytest
 
-from mkdocs_git_revision_date_localized_plugin.exclude import exclude
+from mkdocs_git_revision_date_localized_plugin.exclude import compile_exclude, exclude
 
 
 def test_exclude():
@@ -18,3 +20,24 @@ def test_exclude():
     globs = ["folder/*"]
     assert exclude("folder/index.md", globs)
     assert not exclude("subfolder/index.md", globs)
+
+
+def test_compile_exclude():
+    # A single matcher gives the same results as matching the globs one by one
+    globs = ["index.md", "folder/*", "*/vendor/*", "api/**/*.md", "page_?.md", "[ab]*.md"]
+    is_excluded = compile_exclude(tuple(globs))
+    paths = [
+        "index.md",
+        "folder/index.md",
+        "subfolder/index.md",
+        "docs/vendor/lib.md",
+        "api/v1/ref.md",
+        "page_1.md",
+        "page_10.md",
+        "about.md",
+        "contact.md",
+    ]
+    for path in paths:
+        assert is_excluded(path) == any(fnmatch.fnmatchcase(path, g) for g in globs), path
+
+    assert not compile_exclude(())("index.md")
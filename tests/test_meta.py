@@ -0,0 +1,81 @@
+import pickle
+
+import pytest
+
+from mkdocs_git_revision_date_localized_plugin.meta import LazyMeta
+
+
+def test_lazy_meta():
+    computed = []
+
+    def compute(value):
+        def inner():
+            computed.append(value)
+            return value
+
+        return inner
+
+    meta = LazyMeta({"title": "Page"})
+    meta.set_lazy("a", compute("a"))
+    meta.set_lazy("b", compute("b"))
+
+    # Lookups by key only compute the requested value, once
+    assert "a" in meta and "b" in meta
+    assert len(meta) == 3
+    assert meta["a"] == "a"
+    assert meta.get("a") == "a"
+    assert computed == ["a"]
+    assert meta.get("missing", "default") == "default"
+    with pytest.raises(KeyError):
+        meta["missing"]
+
+    # Overwriting a lazy value never computes it
+    meta["b"] = "overwritten"
+    assert computed == ["a"]
+
+    meta.set_lazy("c", compute("c"))
+    del meta["c"]
+    assert "c" not in meta
+
+    # Anything that needs all values computes them
+    meta.set_lazy("d", compute("d"))
+    assert dict(meta) == {"title": "Page", "a": "a", "b": "overwritten", "d": "d"}
+    assert computed == ["a", "d"]
+    assert pickle.loads(pickle.dumps(meta)) == meta
+
+
+def test_lazy_meta_mutators():
+    meta = LazyMeta({"title": "Page"})
+    meta.set_lazy("a", lambda: "a")
+    meta.set_lazy("b", lambda: "b")
+
+    # update() replaces lazy values without computing them
+    meta.update({"a": "updated"}, b="keyword")
+    assert len(meta) == 3
+    assert sorted(meta) == ["a", "b", "title"]
+    assert meta == {"title": "Page", "a": "updated", "b": "keyword"}
+
+    meta.set_lazy("c", lambda: "c")
+    meta |= {"c": "or"}
+    assert meta["c"] == "or" and len(meta) == 4
+
+    meta.set_lazy("d", lambda: "d")
+    assert (meta | {"e": "e"})["d"] == "d"
+    assert ({"e": "e"} | meta)["d"] == "d"
+
+    meta.set_lazy("f", lambda: "f")
+    meta.clear()
+    assert "f" not in meta
+    assert len(meta) == 0 and list(meta) == []
+
+    meta.set_lazy("g", lambda: "g")
+    assert meta.popitem() == ("g", "g")
+    assert len(meta) == 0
+
+
+def test_lazy_meta_not_equal():
+    meta = LazyMeta()
+    meta.set_lazy("t", lambda: "x")
+    assert not meta != {"t": "x"}
+    assert meta != {"t": "y"}
+    assert meta == {"t": "x"}
@@ -3,6 +3,7 @@ import tempfile
 
 import pytest
 
+from mkdocs_git_revision_date_localized_plugin.ignored_commits import IgnoredCommits
 from mkdocs_git_revision_date_localized_plugin.util import Util
 
 TEST_PARAMS = [
@@ -21,3 +22,14 @@ def test_parse_git_ignore_revs(test_input, expected):
         assert Util.parse_git_ignore_revs(temp_file_name) == expected
     finally:
         os.remove(temp_file_name)
+
+
+def test_ignored_commits_prefixes():
+    ignored = IgnoredCommits(["abc123", "abc1234567", "def4567890abcdef", ""])
+    assert len(ignored) == 3
+    assert "abc123ffffffffffffffffffffffffffffffffff" in ignored
+    assert "abc1234567ffffffffffffffffffffffffffffff" in ignored
+    assert "def4567890abcdefffffffffffffffffffffffff" in ignored
+    assert "def4567890ffffffffffffffffffffffffffffff" not in ignored
+    assert "ab1234ffffffffffffffffffffffffffffffffff" not in ignored
+    assert not IgnoredCommits()
@@ -0,0 +1,226 @@
+import logging
+import os
+
+import git
+import pytest
+from test_builds import setup_clean_mkdocs_folder, setup_commit_history
+
+from mkdocs_git_revision_date_localized_plugin.backends import BACKENDS
+from mkdocs_git_revision_date_localized_plugin.dates import DateFormatter
+from mkdocs_git_revision_date_localized_plugin.util import Util
+
+
+def test_no_git_logs_warning(tmp_path, caplog):
+    """
+    A file without commits falls back to the current time, and the warning mentions the ignored commits.
+    """
+    repo = git.Repo.init(tmp_path)
+    (tmp_path / "page.md").write_text("page\n", encoding="utf-8")
+    repo.git.add("page.md")
+    repo.git.commit(message="add page", author="Test Person <testtest@gmail.com>")
+    (tmp_path / "new_page.md").write_text("new page\n", encoding="utf-8")
+    (tmp_path / "ignored-commits.txt").write_text("0" * 40 + "\n" + "1" * 40 + "\n", encoding="utf-8")
+
+    u = Util(config={"ignored_commits_file": "ignored-commits.txt", "strict": True}, mkdocs_dir=str(tmp_path))
+    with caplog.at_level(logging.WARNING):
+        commit_hash, _ = u.get_git_commit_timestamp(str(tmp_path / "new_page.md"))
+    assert commit_hash == ""
+    assert "has no git logs, using current timestamp (ignored 2 commits)" in caplog.text
+
+
+@pytest.mark.parametrize("enable_git_follow", [True, False])
+def test_single_pass_history_index(tmp_path, enable_git_follow):
+    """
+    The single pass history engine should give the same results as the per-file git log calls.
+    """
+    testproject_path = setup_clean_mkdocs_folder("tests/fixtures/basic_project/mkdocs.yml", tmp_path)
+    repo = setup_commit_history(testproject_path)
+
+    # Ignore the most recent change to page_with_tag.md
+    commit_hash = repo.git.log("docs/page_with_tag.md", format="%H", n=1)
+    with open(str(testproject_path / "ignored-commits.txt"), "w", encoding="utf-8") as fp:
+        fp.write(commit_hash[:8])
+
+    config = {"enable_git_follow": enable_git_follow, "ignored_commits_file": "ignored-commits.txt"}
+    u = Util(config=config, mkdocs_dir=str(testproject_path))
+    paths = [str(path) for path in (testproject_path / "docs").rglob("*.md")]
+    index = u.get_git_history_index(paths)
+
+    for path in paths:
+        if not repo.git.log(path, format="%H"):
+            # Files without commits are left out, so that the plugin can fall back to the build date
+            assert path not in index
+            continue
+        last_hash, last_timestamp, first_hash, first_timestamp = index[path]
+        assert (last_hash, last_timestamp) == u.get_git_commit_timestamp(path, is_first_commit=False)
+        assert (first_hash, first_timestamp) == u.get_git_commit_timestamp(path, is_first_commit=True)
+
+    _, last_timestamp, _, first_timestamp = index[str(testproject_path / "docs/page_with_tag.md")]
+    assert last_timestamp == 1525475836
+    assert first_timestamp == 1500854705
+
+    _, last_timestamp, _, first_timestamp = index[str(testproject_path / "docs/first_page.md")]
+    assert last_timestamp == 1643911026
+    assert first_timestamp == 1500854705
+
+    _, _, _, first_timestamp = index[str(testproject_path / "docs/subfolder/page_with_renamed.md")]
+    assert first_timestamp == (1655229469 if enable_git_follow else 1655229515)
+
+
+def test_date_formats_cache(monkeypatch):
+    """
+    Date formats should be computed once per timestamp and locale, also when spans are added.
+    """
+    calls = []
+
+    def counting_format(self, unix_timestamp):
+        calls.append((unix_timestamp, self.locale_name))
+        return original_format(self, unix_timestamp)
+
+    original_format = DateFormatter.format
+    monkeypatch.setattr(DateFormatter, "format", counting_format)
+    u = Util(config={"timezone": "Europe/Amsterdam"}, mkdocs_dir=os.getcwd())
+
+    raw = u.get_date_formats_for_timestamp(1642911026, locale="en", add_spans=False)
+    spans = u.get_date_formats_for_timestamp(1642911026, locale="en", add_spans=True)
+    assert raw["date"] == "January 23, 2022"
+    assert spans["date"].startswith('<span class="git-revision-date-localized-plugin')
+    assert raw["date"] in spans["date"]
+
+    # Changing the results should not change the cache
+    raw["date"] = "changed"
+    assert u.get_date_formats_for_timestamp(1642911026, locale="en", add_spans=False)["date"] == "January 23, 2022"
+    u.get_date_formats_for_timestamp(1642911026, locale="fr", add_spans=True)
+    assert calls == [(1642911026, "en"), (1642911026, "fr")]
+    # Every locale is parsed once
+    assert set(u.date_formatters) == {"en", "fr"}
+
+
+def test_repo_cache_per_repository(tmp_path, monkeypatch):
+    """
+    Every repository should only be discovered once, also when pages are spread over many directories.
+    """
+    testproject_path = setup_clean_mkdocs_folder("tests/fixtures/basic_project/mkdocs.yml", tmp_path)
+    setup_commit_history(testproject_path)
+
+    # A nested repository should not be mistaken for a directory of the outer repository
+    nested_path = testproject_path / "docs/subfolder/nested"
+    nested_path.mkdir()
+    (nested_path / "nested_page.md").write_text("# Nested\n", encoding="utf8")
+    git.Repo.init(nested_path, bare=False)
+
+    ci_checks = []
+    monkeypatch.setattr(
+        "mkdocs_git_revision_date_localized_plugin.util.raise_ci_warnings", lambda repo: ci_checks.append(repo)
+    )
+
+    u = Util(config={}, mkdocs_dir=str(testproject_path))
+    paths = [str(path) for path in (testproject_path / "docs").rglob("*.md")]
+    for path in paths:
+        u._get_repo(path)
+
+    assert len(ci_checks) == 2
+    assert set(u.repo_cache) == {str(testproject_path), str(nested_path)}
+    assert u._get_repo(str(testproject_path / "docs/subfolder/page_in_subfolder.md")).working_dir == str(
+        testproject_path
+    )
+    assert u._get_repo(str(nested_path / "nested_page.md")).working_dir == str(nested_path)
+
+
+@pytest.mark.parametrize("git_backend", ["cli", "batch", "dulwich", "pygit2"])
+@pytest.mark.parametrize("enable_git_follow", [True, False])
+def test_combined_commit_timestamps(tmp_path, enable_git_follow, git_backend):
+    """
+    Finding the last and first commit in one history walk should give the same results as two separate queries.
+    """
+    pytest.importorskip(BACKENDS[git_backend][1] or "git")
+
+    testproject_path = setup_clean_mkdocs_folder("tests/fixtures/basic_project/mkdocs.yml", tmp_path)
+    repo = setup_commit_history(testproject_path)
+
+    # Ignore the most recent change to page_with_tag.md
+    commit_hash = repo.git.log("docs/page_with_tag.md", format="%H", n=1)
+    with open(str(testproject_path / "ignored-commits.txt"), "w", encoding="utf-8") as fp:
+        fp.write(commit_hash[:8])
+
+    config = {
+        "enable_git_follow": enable_git_follow,
+        "ignored_commits_file": "ignored-commits.txt",
+        "git_backend": git_backend,
+        "fallback_to_build_date": True,
+    }
+    u = Util(config=config, mkdocs_dir=str(testproject_path))
+
+    paths = [str(path) for path in (testproject_path / "docs").rglob("*.md")]
+    paths.append(str(testproject_path / "docs"))
+    for path in paths:
+        if not repo.git.log(path, format="%H"):
+            # Both fall back to the build date
+            (last_hash, _), (first_hash, _) = u.get_git_commit_timestamps(path)
+            assert last_hash == first_hash == ""
+            continue
+        last_commit, first_commit = u.get_git_commit_timestamps(path)
+        assert last_commit == u.get_git_commit_timestamp(path)
+        assert first_commit == u.get_git_commit_timestamp(path, is_first_commit=True)
+
+    last_commit, first_commit = u.get_git_commit_timestamps(str(testproject_path / "docs/page_with_tag.md"))
+    assert last_commit[1] == 1525475836
+    assert first_commit[1] == 1500854705
+    _, first_commit = u.get_git_commit_timestamps(str(testproject_path / "docs/subfolder/page_with_renamed.md"))
+    assert first_commit[1] == (1655229469 if enable_git_follow else 1655229515)
+
+
+@pytest.mark.parametrize("include_first_commit", [True, False])
+def test_asyncio_history_engine(tmp_path, include_first_commit):
+    """
+    The asyncio engine should give the same results as the per-file git log calls.
+    """
+    testproject_path = setup_clean_mkdocs_folder("tests/fixtures/basic_project/mkdocs.yml", tmp_path)
+    repo = setup_commit_history(testproject_path)
+
+    commit_hash = repo.git.log("docs/page_with_tag.md", format="%H", n=1)
+    with open(str(testproject_path / "ignored-commits.txt"), "w", encoding="utf-8") as fp:
+        fp.write(commit_hash)
+
+    u = Util(config={"ignored_commits_file": "ignored-commits.txt"}, mkdocs_dir=str(testproject_path))
+    paths = [str(path) for path in (testproject_path / "docs").rglob("*.md")]
+    index = u.get_git_commit_timestamps_async(paths, include_first_commit=include_first_commit, max_concurrency=2)
+
+    for path in paths:
+        if not repo.git.log(path, format="%H"):
+            assert path not in index
+            continue
+        last_hash, last_timestamp, first_hash, first_timestamp = index[path]
+        assert (last_hash, last_timestamp) == u.get_git_commit_timestamp(path)
+        if include_first_commit:
+            assert (first_hash, first_timestamp) == u.get_git_commit_timestamp(path, is_first_commit=True)
+        else:
+            assert first_hash is None and first_timestamp is None
+
+    assert index[str(testproject_path / "docs/page_with_tag.md")][1] == 1525475836
+
+
+@pytest.mark.parametrize("git_backend", ["cli", "batch", "dulwich", "pygit2"])
+def test_all_commits_ignored(tmp_path, git_backend):
+    """
+    When all commits of a file are ignored, every engine and backend falls back to the oldest commit.
+    """
+    pytest.importorskip(BACKENDS[git_backend][1] or "git")
+    testproject_path = setup_clean_mkdocs_folder("tests/fixtures/basic_project/mkdocs.yml", tmp_path)
+    repo = setup_commit_history(testproject_path)
+
+    path = str(testproject_path / "docs/page_with_tag.md")
+    commit_hashes = repo.git.log(path, format="%H").split()
+    assert len(commit_hashes) > 1
+    with open(str(testproject_path / "ignored-commits.txt"), "w", encoding="utf-8") as fp:
+        fp.write("\n".join(commit_hash[:10] for commit_hash in commit_hashes))
+
+    u = Util(
+        config={"ignored_commits_file": "ignored-commits.txt", "git_backend": git_backend},
+        mkdocs_dir=str(testproject_path),
+    )
+    first_commit = u.get_git_commit_timestamp(path, is_first_commit=True)
+    assert first_commit[1] == 1500854705
+    assert u.get_git_commit_timestamp(path) == first_commit
+    assert tuple(u.get_git_commit_timestamps(path)) == (first_commit, first_commit)
+    assert u.get_git_commit_timestamps_async([path])[path] == (*first_commit, *first_commit)